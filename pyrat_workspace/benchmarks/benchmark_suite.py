@@ -0,0 +1,251 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This script times the graph primitives and solvers of the "programs" directory on reproducible mazes.
+    Mazes are generated from fixed seeds for every size, representation (dictionary or matrix) and mud percentage.
+    Results are written as a JSON report, which can be compared to a previous one to spot regressions:
+        python benchmark_suite.py --output new.json --compare old.json
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import sys
+import os
+import time
+import json
+import random
+import argparse
+import platform
+import statistics
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from tutorial import get_neighbors, get_vertices, compile_maze
+from mazes import generate_maze, maze_to_matrix
+import bfs
+import dijkstra
+import dijkstra_A
+import shortest_paths
+import maze_reduction
+import tsp
+import tsp2
+import tsp_A
+
+#####################################################################################################################################################
+############################################################### CONSTANTS & VARIABLES ###############################################################
+#####################################################################################################################################################
+
+"""
+    Mazes to consider, as (width, height), and options of their generation.
+"""
+
+MAZE_SIZES = [(15, 11), (31, 29), (61, 59), (101, 101)]
+MUD_PERCENTAGES = [0.0, 20.0, 40.0]
+WALL_PERCENTAGE = 40.0
+MUD_RANGE = (2, 10)
+RANDOM_SEED = 42
+
+#####################################################################################################################################################
+
+"""
+    Matrices have a number of elements quadratic in the number of cells.
+    Larger mazes are only benchmarked as dictionaries (a 101x101 matrix would need close to 1 GB).
+"""
+
+MAX_MATRIX_CELLS = 4000
+
+#####################################################################################################################################################
+
+"""
+    Number of pieces of cheese for the meta-graph and the TSP solvers.
+"""
+
+NB_CHEESE = 12
+
+#####################################################################################################################################################
+
+"""
+    Number of runs per benchmark, of which the best and median durations are reported.
+"""
+
+NB_RUNS = 5
+
+#####################################################################################################################################################
+
+"""
+    Relative slowdown above which a benchmark is flagged when comparing to a previous report.
+"""
+
+REGRESSION_THRESHOLD = 0.2
+
+#####################################################################################################################################################
+##################################################################### FUNCTIONS #####################################################################
+#####################################################################################################################################################
+
+def make_benchmarks ( maze:       Union[numpy.ndarray, Dict[int, Dict[int, int]]],
+                      maze_width: int,
+                      cheese:     List[int]
+                    ) ->          Dict[str, Callable[[], Any]]:
+
+    """
+        Function to list the functions to time on a given maze.
+        Traversals and solvers are given the compiled maze, as programs do after preprocessing, and "get_neighbors" is timed on both.
+        In:
+            * maze:       Maze on which to run the benchmarks.
+            * maze_width: Width of the maze in number of cells.
+            * cheese:     Pieces of cheese in the maze, not containing the starting cell 0.
+        Out:
+            * benchmarks: Dictionary associating names to functions without arguments.
+    """
+
+    # Function to visit the neighbors of all vertices
+    def _all_neighbors (graph):
+        for vertex in get_vertices(graph):
+            get_neighbors(vertex, graph)
+
+    # List of benchmarks, where TSP solvers are compared on the same distance matrix
+    compiled_maze = compile_maze(maze)
+    distance_matrix, _ = shortest_paths.distance_table([0] + cheese, compiled_maze)
+    contracted_maze = compile_maze(maze_reduction.contract_corridors(compiled_maze, [0] + cheese)[0])
+    reduced_maze = compile_maze(maze_reduction.contract_corridors(maze_reduction.remove_dead_ends(compiled_maze, [0] + cheese), [0] + cheese)[0])
+    benchmarks = {"compile_maze": lambda: compile_maze(maze),
+                  "get_neighbors": lambda: _all_neighbors(maze),
+                  "get_neighbors (compiled)": lambda: _all_neighbors(compiled_maze),
+                  "bfs": lambda: bfs.bfs(0, compiled_maze),
+                  "dijkstra": lambda: dijkstra.dijkstra(0, compiled_maze),
+                  "dijkstra_A.dijkstra_cible": lambda: dijkstra_A.dijkstra_cible(0, compiled_maze, cheese, maze_width),
+                  "dijkstra_A.dijkstra_cible (one target)": lambda: dijkstra_A.dijkstra_cible(0, compiled_maze, cheese[-1:], maze_width, False),
+                  "dijkstra_A.dijkstra_cible (one target, A*)": lambda: dijkstra_A.dijkstra_cible(0, compiled_maze, cheese[-1:], maze_width),
+                  "shortest_paths.single_source_dijkstra": lambda: shortest_paths.single_source_dijkstra(0, compiled_maze),
+                  "maze_reduction.contract_corridors": lambda: maze_reduction.contract_corridors(compiled_maze, [0] + cheese),
+                  "single_source_dijkstra (contracted maze)": lambda: shortest_paths.single_source_dijkstra(0, contracted_maze),
+                  "maze_reduction.remove_dead_ends": lambda: maze_reduction.remove_dead_ends(compiled_maze, [0] + cheese),
+                  "single_source_dijkstra (reduced maze)": lambda: shortest_paths.single_source_dijkstra(0, reduced_maze),
+                  "shortest_paths.distance_table": lambda: shortest_paths.distance_table([0] + cheese, compiled_maze),
+                  "maze_reduction.contracted_distance_table": lambda: maze_reduction.contracted_distance_table([0] + cheese, compiled_maze),
+                  "graph_to_metagraph": lambda: tsp.graph_to_metagraph(compiled_maze, [0] + cheese, maze_width),
+                  "tsp2.branch_and_bound_order": lambda: tsp2.branch_and_bound_order(distance_matrix),
+                  "tsp_A.held_karp_order": lambda: tsp_A.held_karp_order(distance_matrix),
+                  "held_karp": lambda: tsp_A.held_karp(0, compiled_maze, cheese, maze_width)}
+    return benchmarks
+
+#####################################################################################################################################################
+
+def time_function ( function: Callable[[], Any]
+                  ) ->        Dict[str, float]:
+
+    """
+        Function to time a function over several runs.
+        In:
+            * function: Function to time.
+        Out:
+            * durations: Dictionary with the best and median durations, in seconds.
+    """
+
+    # Run several times
+    durations = []
+    for run in range(NB_RUNS):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return {"best": min(durations), "median": statistics.median(durations)}
+
+#####################################################################################################################################################
+
+def run_suite ( maze_sizes: List[Tuple[int, int]]
+              ) ->          Dict[str, Any]:
+
+    """
+        Function to run all benchmarks on all mazes.
+        In:
+            * maze_sizes: Sizes of mazes to consider, as (width, height).
+        Out:
+            * report: Dictionary describing the environment, the configuration and the results.
+    """
+
+    # Describe the environment and configuration
+    report = {"environment": {"python": platform.python_version(), "numpy": numpy.__version__, "machine": platform.machine(), "processor": platform.processor()},
+              "config": {"wall_percentage": WALL_PERCENTAGE, "mud_range": list(MUD_RANGE), "random_seed": RANDOM_SEED, "nb_cheese": NB_CHEESE, "nb_runs": NB_RUNS},
+              "results": []}
+
+    # All combinations
+    for maze_width, maze_height in maze_sizes:
+        for mud_percentage in MUD_PERCENTAGES:
+            maze_dictionary = generate_maze(maze_width, maze_height, WALL_PERCENTAGE, mud_percentage, MUD_RANGE, RANDOM_SEED)
+            cheese = random.Random(RANDOM_SEED).sample(range(1, maze_width * maze_height), NB_CHEESE)
+            representations = {"dictionary": maze_dictionary}
+            if maze_width * maze_height <= MAX_MATRIX_CELLS:
+                representations["matrix"] = maze_to_matrix(maze_dictionary)
+            for representation, maze in representations.items():
+                for name, function in make_benchmarks(maze, maze_width, cheese).items():
+                    result = {"benchmark": name, "maze_width": maze_width, "maze_height": maze_height, "representation": representation, "mud_percentage": mud_percentage}
+                    result.update(time_function(function))
+                    report["results"].append(result)
+                    print("%-45s %4dx%-4d %-10s mud %3d%%   best %10.3f ms   median %10.3f ms" % (name, maze_width, maze_height, representation, mud_percentage, 1000 * result["best"], 1000 * result["median"]))
+    return report
+
+#####################################################################################################################################################
+
+def compare_reports ( report:          Dict[str, Any],
+                      previous_report: Dict[str, Any]
+                    ) ->               List[str]:
+
+    """
+        Function to compare the results of two reports, and list the benchmarks that became slower.
+        In:
+            * report:          New report.
+            * previous_report: Reference report.
+        Out:
+            * regressions: Descriptions of the benchmarks whose best duration increased by more than REGRESSION_THRESHOLD.
+    """
+
+    # Index previous results by configuration
+    def _key (result):
+        return (result["benchmark"], result["maze_width"], result["maze_height"], result["representation"], result["mud_percentage"])
+    previous_results = {_key(result): result for result in previous_report["results"]}
+
+    # Compare best durations
+    regressions = []
+    for result in report["results"]:
+        previous_result = previous_results.get(_key(result))
+        if previous_result is not None and result["best"] > (1.0 + REGRESSION_THRESHOLD) * previous_result["best"]:
+            regressions.append("%s (%dx%d, %s, mud %d%%): %.3f ms -> %.3f ms" % (_key(result) + (1000 * previous_result["best"], 1000 * result["best"])))
+    return regressions
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Options
+    parser = argparse.ArgumentParser(description="Benchmark suite of the programs")
+    parser.add_argument("--output", type=str, default="benchmark_report.json", help="JSON file in which to write the report")
+    parser.add_argument("--compare", type=str, default=None, help="Previous JSON report to compare with")
+    parser.add_argument("--quick", action="store_true", help="Only consider the two smallest maze sizes")
+    args = parser.parse_args()
+
+    # Run and save
+    report = run_suite(MAZE_SIZES[:2] if args.quick else MAZE_SIZES)
+    with open(args.output, "w") as output_file:
+        json.dump(report, output_file, indent=4)
+    print("Report written to", args.output)
+
+    # Compare with a previous run
+    if args.compare is not None:
+        with open(args.compare) as previous_file:
+            regressions = compare_reports(report, json.load(previous_file))
+        print("%d regression(s) above %d%%" % (len(regressions), 100 * REGRESSION_THRESHOLD))
+        for regression in regressions:
+            print("   ", regression)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
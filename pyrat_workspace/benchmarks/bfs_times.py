@@ -0,0 +1,110 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This script measures the time taken by a breadth-first search on mazes of increasing size.
+    It compares a FIFO encoded as a list, where removing the first element takes a time linear in its length, with the double-ended queue used in "bfs.py".
+    Both versions should find the same distances.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import sys
+import os
+import time
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from tutorial import compile_maze
+from bfs import traversal, bfs
+from mazes import generate_maze
+
+#####################################################################################################################################################
+############################################################### CONSTANTS & VARIABLES ###############################################################
+#####################################################################################################################################################
+
+"""
+    Mazes to consider, as (width, height), and number of runs per size.
+"""
+
+MAZE_SIZES = [(15, 11), (31, 29), (61, 59), (101, 101)]
+NB_RUNS = 5
+
+#####################################################################################################################################################
+
+"""
+    Mazes configuration.
+"""
+
+MUD_PERCENTAGE = 20.0
+WALL_PERCENTAGE = 40.0
+MUD_RANGE = (2, 10)
+
+#####################################################################################################################################################
+##################################################################### FUNCTIONS #####################################################################
+#####################################################################################################################################################
+
+def list_bfs ( source: int,
+               graph:  Union[numpy.ndarray, Dict[int, Dict[int, int]]]
+             ) ->      Tuple[Dict[int, int], Dict[int, Union[None, int]]]:
+
+    """
+        Breadth-first search with a FIFO encoded as a list, as it was done before in "bfs.py".
+        In:
+            * source: Vertex from which to start the traversal.
+            * graph:  Graph on which to perform the traversal.
+        Out:
+            * distances_to_explored_vertices: Dictionary where keys are explored vertices and associated values are the lengths of the paths to reach them.
+            * routing_table:                  Routing table to allow reconstructing the paths obtained by the traversal.
+    """
+
+    # Same traversal, with elements leaving by the beginning of a list
+    return traversal(source, graph, list, list.append, lambda structure: structure.pop(0))
+
+#####################################################################################################################################################
+
+def measure ( function: Callable[[int, Any], Any],
+              graph:    Any
+            ) ->        float:
+
+    """
+        Function to measure the best time of a traversal from vertex 0 over several runs.
+        In:
+            * function: Traversal to measure.
+            * graph:    Graph on which to perform the traversal.
+        Out:
+            * duration: Best time of the runs, in seconds.
+    """
+
+    # Keep the best run to limit noise
+    durations = []
+    for run in range(NB_RUNS):
+        start = time.perf_counter()
+        function(0, graph)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Compare both versions on each size
+    print("%-10s %8s %12s %12s %8s" % ("size", "cells", "list (ms)", "deque (ms)", "ratio"))
+    for maze_width, maze_height in MAZE_SIZES:
+        maze = compile_maze(generate_maze(maze_width, maze_height, WALL_PERCENTAGE, MUD_PERCENTAGE, MUD_RANGE))
+        assert list_bfs(0, maze)[0] == bfs(0, maze)[0], "Distances differ"
+        duration_list = measure(list_bfs, maze)
+        duration_deque = measure(bfs, maze)
+        print("%-10s %8d %12.2f %12.2f %8.1f" % ("%dx%d" % (maze_width, maze_height), maze_width * maze_height, 1000 * duration_list, 1000 * duration_deque, duration_list / duration_deque))
+
+#####################################################################################################################################################
+#####################################################################################################################################################
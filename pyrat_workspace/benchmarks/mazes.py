@@ -0,0 +1,111 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program generates reproducible mazes for the benchmarks, without having to start a PyRat game.
+    Mazes are random spanning trees of the grid, to which some walls are removed and some mud is added.
+    They are returned as dictionaries, and can be converted to adjacency matrices.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import random
+import numpy
+
+#####################################################################################################################################################
+##################################################################### FUNCTIONS #####################################################################
+#####################################################################################################################################################
+
+def generate_maze ( maze_width:      int,
+                    maze_height:     int,
+                    wall_percentage: float = 40.0,
+                    mud_percentage:  float = 20.0,
+                    mud_range:       Tuple[int, int] = (2, 10),
+                    random_seed:     int = 0
+                  ) ->               Dict[int, Dict[int, int]]:
+
+    """
+        Function to generate a connected maze, deterministically from a random seed.
+        A random spanning tree is drawn by a depth-first search, then walls between adjacent cells are removed until the given percentage remains.
+        Finally, the given percentage of edges receives mud, with a weight drawn in the mud range.
+        In:
+            * maze_width:      Width of the maze in number of cells.
+            * maze_height:     Height of the maze in number of cells.
+            * wall_percentage: Percentage of walls between adjacent cells.
+            * mud_percentage:  Percentage of edges with mud.
+            * mud_range:       Minimum and maximum weights of mud.
+            * random_seed:     Seed of the random generator.
+        Out:
+            * maze: Dictionary associating to each cell its neighbors and the weights of the corresponding edges.
+    """
+
+    # Function to list the cells adjacent to a cell in the grid
+    def _grid_neighbors (cell):
+        row, col = divmod(cell, maze_width)
+        neighbors = []
+        if col > 0: neighbors.append(cell - 1)
+        if col < maze_width - 1: neighbors.append(cell + 1)
+        if row > 0: neighbors.append(cell - maze_width)
+        if row < maze_height - 1: neighbors.append(cell + maze_width)
+        return neighbors
+
+    # Random spanning tree by depth-first search
+    generator = random.Random(random_seed)
+    maze = {cell: {} for cell in range(maze_width * maze_height)}
+    seen = {0}
+    stack = [0]
+    while len(stack) > 0:
+        cell = stack[-1]
+        candidates = [neighbor for neighbor in _grid_neighbors(cell) if neighbor not in seen]
+        if len(candidates) == 0:
+            stack.pop()
+            continue
+        neighbor = generator.choice(candidates)
+        seen.add(neighbor)
+        stack.append(neighbor)
+        maze[cell][neighbor] = maze[neighbor][cell] = 1
+
+    # Remove walls until the percentage is reached
+    walls = [(cell, neighbor) for cell in maze for neighbor in _grid_neighbors(cell) if neighbor > cell and neighbor not in maze[cell]]
+    nb_pairs = len(walls) + sum([len(maze[cell]) for cell in maze]) // 2
+    nb_walls_to_keep = int(nb_pairs * wall_percentage / 100.0)
+    generator.shuffle(walls)
+    for cell, neighbor in walls[nb_walls_to_keep:]:
+        maze[cell][neighbor] = maze[neighbor][cell] = 1
+
+    # Add mud
+    edges = [(cell, neighbor) for cell in maze for neighbor in maze[cell] if neighbor > cell]
+    for cell, neighbor in edges:
+        if generator.random() < mud_percentage / 100.0:
+            maze[cell][neighbor] = maze[neighbor][cell] = generator.randint(mud_range[0], mud_range[1])
+    return maze
+
+#####################################################################################################################################################
+
+def maze_to_matrix ( maze: Dict[int, Dict[int, int]]
+                   ) ->    numpy.ndarray:
+
+    """
+        Function to convert a maze given as a dictionary to an adjacency matrix, as PyRat does for the "matrix" representation.
+        In:
+            * maze: Dictionary associating to each cell its neighbors and the weights of the corresponding edges.
+        Out:
+            * matrix: Adjacency matrix, where matrix[i, j] is the weight of the edge from i to j, or 0 if there is none.
+    """
+
+    # Fill the matrix
+    matrix = numpy.zeros((len(maze), len(maze)), dtype=int)
+    for cell in maze:
+        for neighbor in maze[cell]:
+            matrix[cell, neighbor] = maze[cell][neighbor]
+    return matrix
+
+#####################################################################################################################################################
+#####################################################################################################################################################
@@ -0,0 +1,130 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This script counts the number of elements popped by Dijkstra's traversal, before and after the priority queue was fixed.
+    Before, elements were ordered by vertex rather than by distance, and stale elements were explored again.
+    After, elements are ordered by distance and stale elements are skipped (see "traversal" in "dijkstra.py").
+    It also checks that both versions find the same distances.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import sys
+import os
+import heapq
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from tutorial import get_neighbors, get_weight
+from dijkstra import traversal, create_priority_queue, push_to_priority_queue, pop_from_priority_queue
+from mazes import generate_maze
+
+#####################################################################################################################################################
+############################################################### CONSTANTS & VARIABLES ###############################################################
+#####################################################################################################################################################
+
+"""
+    Mazes to consider, as (width, height), and number of mazes per size.
+"""
+
+MAZE_SIZES = [(15, 11), (31, 29), (61, 59)]
+NB_MAZES = 5
+
+#####################################################################################################################################################
+
+"""
+    Mazes configuration.
+"""
+
+MUD_PERCENTAGE = 40.0
+WALL_PERCENTAGE = 40.0
+MUD_RANGE = (2, 10)
+
+#####################################################################################################################################################
+##################################################################### FUNCTIONS #####################################################################
+#####################################################################################################################################################
+
+def previous_traversal ( source: int,
+                         graph:  Dict[int, Dict[int, int]]
+                       ) ->      Tuple[Dict[int, int], int]:
+
+    """
+        Traversal as it was before the fix, with elements (vertex, distance) pushed directly in the heap.
+        In:
+            * source: Vertex from which to start the traversal.
+            * graph:  Graph on which to perform the traversal.
+        Out:
+            * distances_to_explored_vertices: Dictionary associating each vertex to its distance from the source.
+            * nb_pops:                        Number of elements popped from the heap.
+    """
+
+    # Same loop as before, counting pops
+    distances_to_explored_vertices = {source: 0}
+    visited = [(source, 0)]
+    nb_pops = 0
+    while len(visited) > 0:
+        pop, distance_to_source = heapq.heappop(visited)
+        nb_pops += 1
+        for vertice in get_neighbors(pop, graph):
+            new_distance = distance_to_source + get_weight(pop, vertice, graph)
+            if vertice not in distances_to_explored_vertices or distances_to_explored_vertices[vertice] > new_distance:
+                distances_to_explored_vertices[vertice] = new_distance
+                heapq.heappush(visited, (vertice, new_distance))
+    return distances_to_explored_vertices, nb_pops
+
+#####################################################################################################################################################
+
+def current_traversal ( source: int,
+                        graph:  Dict[int, Dict[int, int]]
+                      ) ->      Tuple[Dict[int, int], int]:
+
+    """
+        Traversal with the priority queue of "dijkstra.py", counting pops.
+        In:
+            * source: Vertex from which to start the traversal.
+            * graph:  Graph on which to perform the traversal.
+        Out:
+            * distances_to_explored_vertices: Dictionary associating each vertex to its distance from the source.
+            * nb_pops:                        Number of elements popped from the heap.
+    """
+
+    # Function to count the pops
+    nb_pops = [0]
+    def _pop_from_structure (structure):
+        nb_pops[0] += 1
+        return pop_from_priority_queue(structure)
+
+    # Perform the traversal
+    distances_to_explored_vertices, _ = traversal(source, graph, create_priority_queue, push_to_priority_queue, _pop_from_structure)
+    return distances_to_explored_vertices, nb_pops[0]
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Compare both versions on each size
+    print("%-10s %12s %12s %8s" % ("size", "pops before", "pops after", "ratio"))
+    for maze_width, maze_height in MAZE_SIZES:
+        total_before = 0
+        total_after = 0
+        for seed in range(NB_MAZES):
+            maze = generate_maze(maze_width, maze_height, WALL_PERCENTAGE, MUD_PERCENTAGE, MUD_RANGE, seed)
+            distances_before, nb_pops_before = previous_traversal(0, maze)
+            distances_after, nb_pops_after = current_traversal(0, maze)
+            assert distances_before == distances_after, "Distances differ"
+            total_before += nb_pops_before
+            total_after += nb_pops_after
+        print("%-10s %12d %12d %8.1f" % ("%dx%d" % (maze_width, maze_height), total_before // NB_MAZES, total_after // NB_MAZES, total_before / total_after))
+
+#####################################################################################################################################################
+#####################################################################################################################################################
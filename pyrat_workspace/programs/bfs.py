@@ -21,10 +21,10 @@
 from pyrat import *
 
 # External imports 
-# [TODO] Put all your standard imports (numpy, random, os, heapq...) here
+import collections
 
 # Previously developed functions
-from tutorial import get_neighbors, locations_to_action , get_vertices
+from tutorial import get_neighbors, locations_to_action , get_vertices, get_weight, compile_maze, ActionPlan
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
@@ -39,7 +39,8 @@ def traversal ( source:             int,
             graph:              Union[numpy.ndarray, Dict[int, Dict[int, int]]],
             create_structure:   Callable[[], Any],
             push_to_structure:  Callable[[Any, Tuple[int, int, int]], None],
-            pop_from_structure: Callable[[Any], Tuple[int, int, int]]
+            pop_from_structure: Callable[[Any], Tuple[int, int, int]],
+            verbose:            bool = False
             ) ->                  Tuple[Dict[int, int], Dict[int, Union[None, int]]]:
     """
     Traversal function that explores a graph from a given vertex.
@@ -51,6 +52,7 @@ def traversal ( source:             int,
         * create_structure:   Function that creates an empty structure to use in the traversal.
         * push_to_structure:  Function that adds an element of type B to the structure of type A.
         * pop_from_structure: Function that returns and removes an element of type B from the structure of type A.
+        * verbose:            Set to True to print the distances found by the traversal.
     Out:
         * distances_to_explored_vertices: Dictionary where keys are explored vertices and associated values are the lengths of the paths to reach them.
         * routing_table:                  Routing table to allow reconstructing the paths obtained by the traversal.
@@ -66,36 +68,39 @@ def traversal ( source:             int,
                 continue
             else :
                 distance=distances_to_explored_vertices[pop]
-                distances_to_explored_vertices[vertice]=distance+graph[vertice][pop]
+                distances_to_explored_vertices[vertice]=distance+get_weight(pop,vertice,graph)
                 push_to_structure(visited,vertice)
                 routing_table[vertice]=pop
-    print(distances_to_explored_vertices)
+    if verbose:
+        print(distances_to_explored_vertices)
     return distances_to_explored_vertices , routing_table
-def bfs ( source: int,
-                graph:  Union[numpy.ndarray, Dict[int, Dict[int, int]]]
+def bfs ( source:  int,
+                graph:   Union[numpy.ndarray, Dict[int, Dict[int, int]]],
+                verbose: bool = False
             ) ->      Tuple[Dict[int, int], Dict[int, Union[None, int]]]:
         """
             A BFS is a particular traversal where vertices are explored in the order where they are added to the structure.
             In:
-                * source: Vertex from which to start the traversal.
-                * graph:  Graph on which to perform the traversal.
+                * source:  Vertex from which to start the traversal.
+                * graph:   Graph on which to perform the traversal.
+                * verbose: Set to True to print the distances found by the traversal.
             Out:
                 * distances_to_explored_vertices: Dictionary where keys are explored vertices and associated values are the lengths of the paths to reach them.
                 * routing_table:                  Routing table to allow reconstructing the paths obtained by the traversal.
         """
         
-        # Function to create an empty FIFO, encoded as a list
+        # Function to create an empty FIFO, encoded as a double-ended queue so that both ends are accessed in constant time
         def _create_structure ():
-            return []
+            return collections.deque()
         # Function to add an element to the FIFO (elements enter by the end)
         def _push_to_structure (structure, element):
             structure.append(element)
         # Function to extract an element from the FIFO (elements exit by the beginning)
         def _pop_from_structure (structure):
-            return structure.pop(0)
+            return structure.popleft()
         
         # Perform the traversal
-        distances_to_explored_vertices, routing_table = traversal(source, graph, _create_structure, _push_to_structure, _pop_from_structure)
+        distances_to_explored_vertices, routing_table = traversal(source, graph, _create_structure, _push_to_structure, _pop_from_structure, verbose)
         return distances_to_explored_vertices, routing_table
 def find_route ( routing_table: Dict[int, Union[None, int]],
                     source:        int,
@@ -170,8 +175,8 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
              action = locations_to_action(locations[i], locations[i + 1], maze_width)
              actions.append(action)
         return actions
-    distances_to_explored_vertices, routing_table=bfs(player_locations[name],maze)
-    memory.actions=locations_to_actions(find_route(routing_table,player_locations[name],cheese[0]),maze_width)
+    distances_to_explored_vertices, routing_table=bfs(player_locations[name],compile_maze(maze))
+    memory.actions=ActionPlan(locations_to_actions(find_route(routing_table,player_locations[name],cheese[0]),maze_width))
     pass
 #####################################################################################################################################################
 ######################################################### EXECUTED AT EACH TURN OF THE GAME #########################################################
@@ -210,7 +215,7 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
             * action: One of the possible actions, as given in possible_actions.
     """
     # [TODO] Write your turn code here and do not forget to return a possible action
-    action = memory.actions.pop(0)
+    action = memory.actions.popleft()
     return action
 
 #####################################################################################################################################################
@@ -24,7 +24,7 @@ from pyrat import *
 import heapq
 
 # Previously developed functions
-from tutorial import get_neighbors, locations_to_action , get_vertices
+from tutorial import get_neighbors, locations_to_action , get_vertices, get_weight, compile_maze, ActionPlan
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
@@ -45,6 +45,7 @@ def traversal ( source:             int,
     Traversal function that explores a graph from a given vertex.
     This function is generic and can be used for most graph traversal.
     To adapt it to a specific traversal, you need to provide the adapted functions to create, push and pop elements from the structure.
+    Elements are (vertex, distance) pairs, and a vertex is explored only the first time it is popped, later elements for it are skipped.
     In:
         * source:             Vertex from which to start the traversal.
         * graph:              Graph on which to perform the traversal.
@@ -57,21 +58,57 @@ def traversal ( source:             int,
     """
     distances_to_explored_vertices={source:0}
     routing_table={source:None}
+    settled=set()
     visited=create_structure()
     push_to_structure(visited,(source,0))
     while len(visited)>0:
         pop, distance_to_source =pop_from_structure(visited)
+        # Elements pushed before a shorter distance was found are stale, the vertex has already been explored
+        if pop in settled:
+            continue
+        settled.add(pop)
         for vertice in get_neighbors(pop,graph):
-            if vertice in distances_to_explored_vertices:
-                if distances_to_explored_vertices[vertice] > distance_to_source+graph[vertice][pop] :
-                    distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
+            if vertice in settled:
+                continue
+            elif vertice in distances_to_explored_vertices:
+                if distances_to_explored_vertices[vertice] > distance_to_source+get_weight(pop,vertice,graph) :
+                    distances_to_explored_vertices[vertice]=distance_to_source+get_weight(pop,vertice,graph)
                     push_to_structure(visited,(vertice,distances_to_explored_vertices[vertice]))
                     routing_table[vertice]=pop
             else :
-                distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
+                distances_to_explored_vertices[vertice]=distance_to_source+get_weight(pop,vertice,graph)
                 push_to_structure(visited,(vertice,distances_to_explored_vertices[vertice]))
                 routing_table[vertice]=pop
     return distances_to_explored_vertices , routing_table
+def create_priority_queue ( ) -> List[Tuple[int, int]]:
+    """
+        Function to create an empty priority queue, to use as create_structure in the traversal.
+        Out:
+            * structure: Empty priority queue.
+    """
+    return []
+def push_to_priority_queue ( structure: List[Tuple[int, int]],
+                             element:   Tuple[int, int]
+                           ) ->         None:
+    """
+        Function to add a (vertex, distance) element to the priority queue, to use as push_to_structure in the traversal.
+        The heap is ordered by distance first, so the distance is stored first.
+        In:
+            * structure: Priority queue.
+            * element:   Pair (vertex, distance) to add.
+    """
+    heapq.heappush(structure, (element[1], element[0]))
+def pop_from_priority_queue ( structure: List[Tuple[int, int]]
+                            ) ->         Tuple[int, int]:
+    """
+        Function to extract the (vertex, distance) element with the smallest distance, to use as pop_from_structure in the traversal.
+        In:
+            * structure: Priority queue.
+        Out:
+            * element: Pair (vertex, distance) with the smallest distance.
+    """
+    distance, vertex = heapq.heappop(structure)
+    return vertex, distance
 def dijkstra ( source: int,
                 graph:  Union[numpy.ndarray, Dict[int, Dict[int, int]]]
                 ) ->      Tuple[Dict[int, int], Dict[int, Union[None, int]]]:
@@ -85,18 +122,8 @@ def dijkstra ( source: int,
             * routing_table:                  Routing table to allow reconstructing the paths obtained by the traversal.
     """
     
-    # Function to create an empty priority queue
-    def _create_structure ():
-        return []
-    # Function to add an element to the priority queue
-    def _push_to_structure (structure, element):
-        heapq.heappush(structure, element)
-    # Function to extract an element from the priority queue
-    def _pop_from_structure (structure):
-        return heapq.heappop(structure)
-    
-    # Perform the traversal
-    distances_to_explored_vertices, routing_table = traversal(source, graph, _create_structure, _push_to_structure, _pop_from_structure)
+    # Perform the traversal with a priority queue ordered by distance
+    distances_to_explored_vertices, routing_table = traversal(source, graph, create_priority_queue, push_to_priority_queue, pop_from_priority_queue)
     return distances_to_explored_vertices, routing_table
 def find_route ( routing_table: Dict[int, Union[None, int]],
                     source:        int,
@@ -172,8 +199,8 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
              action = locations_to_action(locations[i], locations[i + 1], maze_width)
              actions.append(action)
         return actions
-    distances_to_explored_vertices, routing_table=dijkstra(player_locations[name],maze)
-    memory.actions=locations_to_actions(find_route(routing_table,player_locations[name],cheese[0]),maze_width)
+    distances_to_explored_vertices, routing_table=dijkstra(player_locations[name],compile_maze(maze))
+    memory.actions=ActionPlan(locations_to_actions(find_route(routing_table,player_locations[name],cheese[0]),maze_width))
     pass
 #####################################################################################################################################################
 ######################################################### EXECUTED AT EACH TURN OF THE GAME #########################################################
@@ -212,7 +239,7 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
             * action: One of the possible actions, as given in possible_actions.
     """
     # [TODO] Write your turn code here and do not forget to return a possible action
-    action = memory.actions.pop(0)
+    action = memory.actions.popleft()
     return action
 
 #####################################################################################################################################################
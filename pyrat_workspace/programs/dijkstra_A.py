@@ -18,38 +18,85 @@ from pyrat import *
 import heapq as h
 
 # Previously developed functions
-from tutorial import get_neighbors, locations_to_action, get_vertices, get_weight
+from tutorial import get_neighbors, locations_to_action, get_weight, compile_maze
+from shortest_paths import RouteCache
+from replanning import Replanner
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
 #####################################################################################################################################################
 
-# [TODO] It is good practice to keep all your constants and global variables in an easily identifiable section
+"""
+    Nombre maximal de fromages pour lequel la recherche A* est utilisée.
+    Avec plus de fromages, le plus proche est trouvé en peu d'étapes, et calculer l'estimation coûte plus de temps qu'elle n'en fait gagner.
+"""
+
+NB_MAX_CIBLES_A_ETOILE = 3
 
 #####################################################################################################################################################
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
 
-def dijkstra(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:list[int],maze_width:int):
+def distance_manhattan(sommet:int,cibles:list[tuple[int,int]],maze_width:int):
   """
-  Renvoie la liste des directions à parcourir entre la position initiale et le fromage le plus proche dans un graphe avec des poids non négatifs.
+  Renvoie la plus petite distance de Manhattan entre un sommet et des cibles données par leurs (ligne, colonne).
+  Chaque déplacement change la ligne ou la colonne de 1 et coûte au moins 1 (plus dans la boue), donc cette distance ne surestime jamais celle du labyrinthe.
+  """
+  ligne,colonne=divmod(sommet,maze_width)
+  return min(abs(ligne-ligne_cible)+abs(colonne-colonne_cible) for ligne_cible,colonne_cible in cibles)
+
+def dijkstra_cible(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:list[int],maze_width:int,a_etoile:bool=True):
+  """
+  Renvoie la distance et la liste des directions à parcourir entre la position initiale et le fromage le plus proche, ainsi que ce fromage.
+  Seul le prédécesseur de chaque sommet est stocké pendant le parcours, et les directions ne sont reconstruites que pour le fromage atteint.
+  Les fromages sont rangés dans un ensemble pour tester chaque sommet en temps constant.
+  Avec a_etoile, et au plus NB_MAX_CIBLES_A_ETOILE fromages, le tas est ordonné par la distance parcourue plus la distance de Manhattan au fromage restant le plus proche (A*).
+  Cette estimation ne diminue jamais de plus que le poids d'une arête, donc le premier fromage sorti du tas reste le plus proche, mais moins de sommets sont explorés.
+  À estimation égale, le sommet le plus éloigné de la position initiale sort en premier, pour aller au bout des chemins prometteurs.
   """
   assert cheese!=[]
+  cibles=set(cheese)
+  a_etoile=a_etoile and len(cibles)<=NB_MAX_CIBLES_A_ETOILE
+  coordonnees_cibles=[divmod(fromage,maze_width) for fromage in cibles]
+  distances={start_vertex:0}
+  predecesseurs={start_vertex:None}
   tas=[]
-  h.heappush(tas,(0,start_vertex))
-  table={vertex:(float("inf"),[]) for vertex in get_vertices(maze)}
+  h.heappush(tas,(distance_manhattan(start_vertex,coordonnees_cibles,maze_width) if a_etoile else 0,0,start_vertex))
   while tas!=[]:
-    current_distance,current_vertex=h.heappop(tas)
-    if current_vertex in cheese:
-      tas=[]
-    else :
-      for nb in get_neighbors(current_vertex,maze):
-        distance=current_distance+get_weight(current_vertex,nb,maze)
-        if distance<table[nb][0]:
-            chemin=table[current_vertex][1]+[locations_to_action(current_vertex,nb,maze_width)]
-            h.heappush(tas,(distance,nb))
-            table[nb]=(distance,chemin)
-  return table[current_vertex]
+    _,oppose_distance,current_vertex=h.heappop(tas)
+    current_distance=-oppose_distance
+    if current_distance>distances[current_vertex]:
+      continue
+    if current_vertex in cibles:
+      break
+    for nb in get_neighbors(current_vertex,maze):
+      distance=current_distance+get_weight(current_vertex,nb,maze)
+      if distance<distances.get(nb,float("inf")):
+          distances[nb]=distance
+          predecesseurs[nb]=current_vertex
+          estimation=distance+distance_manhattan(nb,coordonnees_cibles,maze_width) if a_etoile else distance
+          h.heappush(tas,(estimation,-distance,nb))
+  chemin=[]
+  vertex=current_vertex
+  while predecesseurs[vertex] is not None:
+    chemin.append(locations_to_action(predecesseurs[vertex],vertex,maze_width))
+    vertex=predecesseurs[vertex]
+  chemin.reverse()
+  return (distances[current_vertex],chemin),current_vertex
+
+def dijkstra(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:list[int],maze_width:int):
+  """
+  Renvoie la distance et la liste des directions à parcourir entre la position initiale et le fromage le plus proche dans un graphe avec des poids non négatifs.
+  """
+  return dijkstra_cible(start_vertex,maze,cheese,maze_width)[0]
+
+def fromage_plus_proche(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:list[int],maze_width:int):
+  """
+  Renvoie le plan réduit au fromage le plus proche, avec les directions pour l'atteindre, sous la forme attendue par Replanner.
+  Les directions déjà trouvées par dijkstra_cible sont gardées, pour que Replanner n'ait pas à refaire un parcours depuis le fromage.
+  """
+  (_,chemin),cible=dijkstra_cible(start_vertex,maze,cheese,maze_width)
+  return [cible],chemin
 
 #####################################################################################################################################################
 ##################################################### EXECUTED ONCE AT THE BEGINNING OF THE GAME ####################################################
@@ -85,8 +132,9 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
             * None.
     """
 
-    global routing_table
-    routing_table=dijkstra(player_locations[name],maze,cheese,maze_width)[1]
+    memory.compiled_maze=compile_maze(maze)
+    memory.replanner=Replanner(RouteCache(memory.compiled_maze,maze_width))
+    memory.replanner.update(player_locations[name],cheese,lambda location,cheese:fromage_plus_proche(location,memory.compiled_maze,cheese,maze_width))
     
 #####################################################################################################################################################
 ######################################################### EXECUTED AT EACH TURN OF THE GAME #########################################################
@@ -125,11 +173,8 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
             * action: One of the possible actions, as given in possible_actions.
     """
 
-    global routing_table
-
-    if routing_table==[]:
-        routing_table=dijkstra(player_locations[name],maze,cheese,maze_width)[1]
-    return routing_table.pop(0)
+    # Le plan n'est refait que si le fromage visé a disparu ou a été atteint
+    return memory.replanner.get_action(player_locations[name],cheese,lambda location,cheese:fromage_plus_proche(location,memory.compiled_maze,cheese,maze_width))
 
 #####################################################################################################################################################
 ######################################################## EXECUTED ONCE AT THE END OF THE GAME #######################################################
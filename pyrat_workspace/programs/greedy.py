@@ -19,7 +19,10 @@ import heapq as h
 import dijkstra as opponent
 
 # Previously developed functions
-from tutorial import get_neighbors,get_vertices,get_weight,locations_to_action
+from tutorial import get_neighbors,get_vertices,get_weight,locations_to_action,compile_maze
+from dijkstra_A import fromage_plus_proche
+from shortest_paths import RouteCache
+from replanning import Replanner
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
@@ -31,46 +34,56 @@ from tutorial import get_neighbors,get_vertices,get_weight,locations_to_action
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
 
-def dijkstra(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:list[int],maze_width:int):
-  """
-  Renvoie la liste des directions à parcourir entre la position initiale et le fromage le plus proche dans un graphe avec des poids non négatifs.
-  """
-  assert cheese!=[]
-  tas=[]
-  h.heappush(tas,(0,start_vertex))
-  table={vertex:(float("inf"),[]) for vertex in get_vertices(maze)}
-  while tas!=[]:
-    current_distance,current_vertex=h.heappop(tas)
-    if current_vertex in cheese:
-      tas=[]
-    else :
-      for nb in get_neighbors(current_vertex,maze):
-        distance=current_distance+get_weight(current_vertex,nb,maze)
-        if distance<table[nb][0]:
-            chemin=table[current_vertex][1]+[locations_to_action(current_vertex,nb,maze_width)]
-            h.heappush(tas,(distance,nb))
-            table[nb]=(distance,chemin)
-  return table[current_vertex],current_vertex
-
-
-def ciblage(my_location:int,opp_location:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:list[int],maze_width:int):
+def cible_gagnable(distances:List[List[int]]):
+    """
+    Renvoie l'indice du prochain fromage que le joueur peut atteindre avant l'adversaire, si celui-ci fait un greedy algorithm.
+    distances[i][j] est la distance entre le sommet i et le fromage j, où les sommets sont le joueur (0), l'adversaire (1) puis les fromages (2+j pour le fromage j),
+    de sorte que la simulation des déplacements de l'adversaire ne demande que des lectures dans la table, en O(k^2) pour k fromages.
+    À distance égale, le fromage de plus petit indice est choisi.
+    """
+    restants=list(range(len(distances)-2))
+    plus_proche=lambda depart:min(restants,key=lambda j:(distances[depart][j],j))
+    ma_cible=plus_proche(0)
+    cible_adv=plus_proche(1)
+    dist_adv=distances[1][cible_adv]
+    while dist_adv<=distances[0][ma_cible] and len(restants)>1:
+        restants.remove(cible_adv)
+        if ma_cible==cible_adv:
+            ma_cible=plus_proche(0)
+        position_adv=cible_adv+2
+        cible_adv=plus_proche(position_adv)
+        dist_adv+=distances[position_adv][cible_adv]
+    return ma_cible
+
+def ciblage(my_location:int,opp_location:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:list[int],maze_width:int,route_cache:Optional[RouteCache]=None):
     """
     Renvoie la liste des directions à suivre pour atteindre le prochain fromage accessible, en respectant le principe suivant :
     tant que le joueur n'a pas atteint le fromage suivant, il doit connaitre parfaitement les actions de l'adversaire si celui-ci fait un greedy algorithm.
+    Un parcours est fait depuis chaque fromage la première fois qu'il est vu, et gardé dans route_cache d'un appel à l'autre. Comme les distances sont
+    symétriques, les distances depuis les joueurs sont lues dans ces parcours, et la simulation est faite sur la table obtenue (voir cible_gagnable).
+    """
+    if route_cache is None:
+        route_cache=RouteCache(maze,maze_width)
+    fromages=sorted(cheese)
+    route_cache.add_sources(fromages)
+    distances=[[route_cache.distances[fromage][sommet] for fromage in fromages] for sommet in [my_location,opp_location]+fromages]
+    cible=fromages[cible_gagnable(distances)]
+    chemin=route_cache.get_route(cible,my_location)
+    chemin.reverse()
+    return [locations_to_action(chemin[i],chemin[i+1],maze_width) for i in range(len(chemin)-1)],cible
+
+def planificateur(name:str,teams:Dict[str, List[str]],player_locations:Dict[str, int],maze_width:int,memory:threading.local):
     """
-    cibles=cheese.copy()
-    (my_dist,my_routing_table),my_target=dijkstra(my_location,maze,cibles,maze_width)
-    (opp_dist,opp_routing_table),opp_target=dijkstra(opp_location,maze,cibles,maze_width)
-    while opp_dist<=my_dist and len(cibles)>1:
-        cibles.remove(opp_target)
-        if my_target==opp_target:
-            (my_dist,my_routing_table),my_target=dijkstra(my_location,maze,cibles,maze_width)
-            (dist,opp_routing_table),opp_target=dijkstra(opp_target,maze,cibles,maze_width)
-            opp_dist+=dist
-        else : 
-            (dist,opp_routing_table),opp_target=dijkstra(opp_target,maze,cibles,maze_width)
-            opp_dist+=dist
-    return my_routing_table,my_target
+    Renvoie la fonction donnant le prochain fromage à viser depuis une position, sous la forme attendue par Replanner :
+    le plus proche s'il n'y a pas d'adversaire à prendre en compte, et sinon le premier fromage accessible avant l'adversaire (voir ciblage).
+    Les directions vers ce fromage sont renvoyées avec lui, pour ne pas refaire le chemin dans Replanner.
+    """
+    if memory.greedy1:
+        return lambda location,cheese:fromage_plus_proche(location,memory.compiled_maze,cheese,maze_width)
+    def plan_ciblage(location,cheese):
+        chemin,cible=ciblage(location,player_locations[teams['Opponent'][0]],memory.compiled_maze,cheese,maze_width,memory.route_cache)
+        return [cible],chemin
+    return plan_ciblage
 
 #####################################################################################################################################################
 ##################################################### EXECUTED ONCE AT THE BEGINNING OF THE GAME ####################################################
@@ -105,11 +118,11 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
         Out:
             * None.
     """
+    memory.compiled_maze=compile_maze(maze)
+    memory.route_cache=RouteCache(memory.compiled_maze,maze_width)
     memory.greedy1=(len(teams)==1 or player_locations[name]==player_locations[teams['Opponent'][0]])
-    if memory.greedy1:
-        memory.my_routing_table=dijkstra(player_locations[name],maze,cheese,maze_width)[0][1]
-    else :
-        memory.my_routing_table=ciblage(player_locations[name],player_locations[teams['Opponent'][0]],maze,cheese,maze_width)[0]
+    memory.replanner=Replanner(memory.route_cache)
+    memory.replanner.update(player_locations[name],cheese,planificateur(name,teams,player_locations,maze_width,memory))
     
 #####################################################################################################################################################
 ######################################################### EXECUTED AT EACH TURN OF THE GAME #########################################################
@@ -147,12 +160,8 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
         Out:
             * action: One of the possible actions, as given in possible_actions.
     """
-    if memory.my_routing_table==[]:
-        if memory.greedy1:
-            memory.my_routing_table=dijkstra(player_locations[name],maze,memory.cheese,maze_width)[0][1]
-        else :
-            memory.my_routing_table=ciblage(player_locations[name],player_locations[teams['Opponent'][0]],maze,cheese,maze_width)[0]
-    return memory.my_routing_table.pop(0)
+    # Le plan est refait dès que le fromage visé a disparu, par exemple mangé par l'adversaire
+    return memory.replanner.get_action(player_locations[name],cheese,planificateur(name,teams,player_locations,maze_width,memory))
 
 #####################################################################################################################################################
 ######################################################## EXECUTED ONCE AT THE END OF THE GAME #######################################################
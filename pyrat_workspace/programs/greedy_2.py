@@ -15,11 +15,13 @@
 from pyrat import *
 
 # External imports 
-import heapq as h
 import dijkstra as opponent
 
 # Previously developed functions
-from tutorial import get_neighbors,get_vertices,get_weight,locations_to_action
+from tutorial import compile_maze
+from shortest_paths import RouteCache
+from replanning import Replanner
+from greedy import planificateur
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
@@ -31,46 +33,7 @@ from tutorial import get_neighbors,get_vertices,get_weight,locations_to_action
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
 
-def dijkstra(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:list[int],maze_width:int):
-  """
-  Renvoie la liste des directions à parcourir entre la position initiale et le fromage le plus proche dans un graphe avec des poids non négatifs.
-  """
-  assert cheese!=[]
-  tas=[]
-  h.heappush(tas,(0,start_vertex))
-  table={vertex:(float("inf"),[]) for vertex in get_vertices(maze)}
-  while tas!=[]:
-    current_distance,current_vertex=h.heappop(tas)
-    if current_vertex in cheese:
-      tas=[]
-    else :
-      for nb in get_neighbors(current_vertex,maze):
-        distance=current_distance+get_weight(current_vertex,nb,maze)
-        if distance<table[nb][0]:
-            chemin=table[current_vertex][1]+[locations_to_action(current_vertex,nb,maze_width)]
-            h.heappush(tas,(distance,nb))
-            table[nb]=(distance,chemin)
-  return table[current_vertex],current_vertex
-
-
-def ciblage(my_location:int,opp_location:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:list[int],maze_width:int):
-    """
-    Renvoie la liste des directions à suivre pour atteindre le prochain fromage accessible, en respectant le principe suivant :
-    tant que le joueur n'a pas atteint le fromage suivant, il doit connaitre parfaitement les actions de l'adversaire si celui-ci fait un greedy algorithm.
-    """
-    cibles=cheese.copy()
-    (my_dist,my_routing_table),my_target=dijkstra(my_location,maze,cibles,maze_width)
-    (opp_dist,opp_routing_table),opp_target=dijkstra(opp_location,maze,cibles,maze_width)
-    while opp_dist<=my_dist and len(cibles)>1:
-        cibles.remove(opp_target)
-        if my_target==opp_target:
-            (my_dist,my_routing_table),my_target=dijkstra(my_location,maze,cibles,maze_width)
-            (dist,opp_routing_table),opp_target=dijkstra(opp_target,maze,cibles,maze_width)
-            opp_dist+=dist
-        else : 
-            (dist,opp_routing_table),opp_target=dijkstra(opp_target,maze,cibles,maze_width)
-            opp_dist+=dist
-    return my_routing_table,my_target
+# La fonction planificateur, et la fonction ciblage qu'elle utilise, sont définies dans greedy.py
 
 #####################################################################################################################################################
 ##################################################### EXECUTED ONCE AT THE BEGINNING OF THE GAME ####################################################
@@ -105,11 +68,11 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
         Out:
             * None.
     """
+    memory.compiled_maze=compile_maze(maze)
+    memory.route_cache=RouteCache(memory.compiled_maze,maze_width)
     memory.greedy1=(len(teams)==1 or player_locations[name]==player_locations[teams['Opponent'][0]])
-    if memory.greedy1:
-        memory.my_routing_table=dijkstra(player_locations[name],maze,cheese,maze_width)[0][1]
-    else :
-        memory.my_routing_table=ciblage(player_locations[name],player_locations[teams['Opponent'][0]],maze,cheese,maze_width)[0]
+    memory.replanner=Replanner(memory.route_cache)
+    memory.replanner.update(player_locations[name],cheese,planificateur(name,teams,player_locations,maze_width,memory))
     
 #####################################################################################################################################################
 ######################################################### EXECUTED AT EACH TURN OF THE GAME #########################################################
@@ -147,12 +110,8 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
         Out:
             * action: One of the possible actions, as given in possible_actions.
     """
-    if memory.my_routing_table==[]:
-        if memory.greedy1:
-            memory.my_routing_table=dijkstra(player_locations[name],maze,memory.cheese,maze_width)[0][1]
-        else :
-            memory.my_routing_table=ciblage(player_locations[name],player_locations[teams['Opponent'][0]],maze,cheese,maze_width)[0]
-    return memory.my_routing_table.pop(0)
+    # Le plan est refait dès que le fromage visé a disparu, par exemple mangé par l'adversaire
+    return memory.replanner.get_action(player_locations[name],cheese,planificateur(name,teams,player_locations,maze_width,memory))
 
 #####################################################################################################################################################
 ######################################################## EXECUTED ONCE AT THE END OF THE GAME #######################################################
@@ -0,0 +1,182 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program gathers functions to reduce a maze to a smaller graph with the same shortest distances between vertices of interest.
+    Dead ends that contain no vertex of interest are removed, as they are never on a shortest path between two vertices of interest.
+    Corridors, i.e., chains of cells with exactly two neighbors, are replaced by single edges weighted by their length.
+    The cells of each corridor are kept in an expansion table, so that routes in the reduced graph can be converted back to routes in the maze.
+    Both stages return a new graph and leave the maze untouched, and they can be chained, removing dead ends first.
+    It does not define a player, but is used by the other programs to run traversals on a smaller graph (e.g., "graph_to_metagraph" in "tsp.py").
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# Previously developed functions
+from tutorial import get_vertices, get_neighbors, get_weight, compile_maze, CompiledMaze
+from shortest_paths import multi_source_dijkstra, NO_PREDECESSOR
+
+#####################################################################################################################################################
+##################################################################### FUNCTIONS #####################################################################
+#####################################################################################################################################################
+
+def remove_dead_ends ( graph:     Union[CompiledMaze, numpy.ndarray, Dict[int, Dict[int, int]]],
+                       terminals: Iterable[int] = ()
+                     ) ->         Dict[int, Dict[int, int]]:
+
+    """
+        Function to remove all dead ends of a maze that do not contain terminals (e.g., pieces of cheese and player locations).
+        Vertices with less than two neighbors are removed until there are none left, except terminals.
+        Each removal decreases the number of neighbors of the adjacent vertices, which are removed in turn if they become dead ends.
+        The maze is not modified, and the result is a new graph.
+        In:
+            * graph:     Graph to reduce.
+            * terminals: Vertices that should be kept.
+        Out:
+            * reduced_graph: Reduced graph, as a dictionary of dictionaries (the "dictionary" representation of PyRat).
+    """
+
+    # Count the neighbors of all vertices
+    graph = compile_maze(graph)
+    terminals = set(terminals)
+    vertices = get_vertices(graph)
+    neighbors = {vertex: get_neighbors(vertex, graph) for vertex in vertices}
+    nb_neighbors = {vertex: len(neighbors[vertex]) for vertex in vertices}
+
+    # Peel dead ends until none is left
+    dead_ends = [vertex for vertex in vertices if nb_neighbors[vertex] < 2 and vertex not in terminals]
+    removed = set()
+    while len(dead_ends) > 0:
+        dead_end = dead_ends.pop()
+        removed.add(dead_end)
+        for neighbor in neighbors[dead_end]:
+            if neighbor not in removed:
+                nb_neighbors[neighbor] -= 1
+                if nb_neighbors[neighbor] == 1 and neighbor not in terminals:
+                    dead_ends.append(neighbor)
+
+    # Build the remaining graph
+    reduced_graph = {vertex: {neighbor: get_weight(vertex, neighbor, graph) for neighbor in neighbors[vertex] if neighbor not in removed} for vertex in vertices if vertex not in removed}
+    return reduced_graph
+
+#####################################################################################################################################################
+
+def contract_corridors ( graph:     Union[CompiledMaze, numpy.ndarray, Dict[int, Dict[int, int]]],
+                         terminals: Iterable[int] = ()
+                       ) ->         Tuple[Dict[int, Dict[int, int]], Dict[Tuple[int, int], List[int]]]:
+
+    """
+        Function to replace corridors of a maze with weighted edges.
+        Vertices that do not have exactly two neighbors are kept, as well as terminals (e.g., pieces of cheese and player locations).
+        Each chain of other vertices between two kept vertices becomes an edge weighted by the length of the chain, and the shortest one is kept if there are several.
+        A cycle made only of vertices with two neighbors is reduced to its smallest vertex.
+        Distances between kept vertices are the same as in the maze.
+        The maze is compiled first (if not already done), so that neighbors and weights are read in constant time.
+        In:
+            * graph:     Graph to reduce.
+            * terminals: Vertices that should be kept.
+        Out:
+            * contracted_graph: Reduced graph, as a dictionary of dictionaries (the "dictionary" representation of PyRat).
+            * chains:           Dictionary giving for each edge (u, v) of the reduced graph the sequence of cells from u to v in the maze.
+    """
+
+    # Vertices with two neighbors are removed, unless they are terminals
+    graph = compile_maze(graph)
+    terminals = set(terminals)
+    vertices = get_vertices(graph)
+    neighbors = {vertex: get_neighbors(vertex, graph) for vertex in vertices}
+    kept = {vertex for vertex in vertices if len(neighbors[vertex]) != 2 or vertex in terminals}
+
+    # Function to follow a chain from a kept vertex until another kept vertex
+    contracted_graph = {}
+    chains = {}
+    covered = set()
+    def _follow_chains (start):
+        contracted_graph[start] = {}
+        covered.add(start)
+        for first_step in neighbors[start]:
+            chain = [start, first_step]
+            length = get_weight(start, first_step, graph)
+            while chain[-1] not in kept:
+                covered.add(chain[-1])
+                next_step = neighbors[chain[-1]][0] if neighbors[chain[-1]][0] != chain[-2] else neighbors[chain[-1]][1]
+                length += get_weight(chain[-1], next_step, graph)
+                chain.append(next_step)
+            end = chain[-1]
+            if end != start and length < contracted_graph[start].get(end, float("inf")):
+                contracted_graph[start][end] = length
+                chains[(start, end)] = chain
+
+    # Follow all chains from kept vertices, then from one vertex of each remaining cycle
+    for vertex in kept:
+        _follow_chains(vertex)
+    for vertex in sorted(vertices):
+        if vertex not in covered:
+            kept.add(vertex)
+            _follow_chains(vertex)
+    return contracted_graph, chains
+
+#####################################################################################################################################################
+
+def expand_route ( route:  List[int],
+                   chains: Dict[Tuple[int, int], List[int]]
+                 ) ->      List[int]:
+
+    """
+        Function to convert a route in a reduced graph into the corresponding route in the maze.
+        In:
+            * route:  Sequence of vertices of the reduced graph.
+            * chains: Expansion table, as returned by "contract_corridors".
+        Out:
+            * expanded_route: Sequence of cells of the maze.
+    """
+
+    # Replace each edge with its chain
+    expanded_route = route[:1]
+    for i in range(len(route) - 1):
+        expanded_route += chains[(route[i], route[i + 1])][1:]
+    return expanded_route
+
+#####################################################################################################################################################
+
+def contracted_distance_table ( vertices: List[int],
+                                graph:    Union[CompiledMaze, numpy.ndarray, Dict[int, Dict[int, int]]]
+                              ) ->        Tuple[numpy.ndarray, numpy.ndarray]:
+
+    """
+        Function with the same result as "distance_table" in "shortest_paths.py", where traversals run on a reduced graph.
+        Dead ends are removed and corridors are contracted first, keeping the vertices of interest.
+        Predecessors found in the reduced graph are then expanded into predecessors in the maze, only along the routes to the vertices of interest.
+        In:
+            * vertices: Vertices of interest.
+            * graph:    Graph containing the vertices of interest.
+        Out:
+            * distance_matrix: Array of shape (len(vertices), len(vertices)), where distance_matrix[i, j] is the distance from vertices[i] to vertices[j].
+            * predecessors:    Array of shape (len(vertices), nb_vertices), as returned by "multi_source_dijkstra" (only valid on routes to vertices of interest).
+    """
+
+    # Traverse the reduced graph
+    graph = compile_maze(graph)
+    contracted_graph, chains = contract_corridors(remove_dead_ends(graph, vertices), vertices)
+    distances, contracted_predecessors = multi_source_dijkstra(vertices, contracted_graph, vertices)
+    distance_matrix = distances[:, vertices]
+
+    # Expand the routes to the vertices of interest, stopping at vertices already expanded
+    predecessors = numpy.full((len(vertices), graph.nb_vertices), NO_PREDECESSOR, dtype=numpy.int32)
+    for i in range(len(vertices)):
+        for target in vertices:
+            vertex = target
+            while vertex != vertices[i] and predecessors[i, vertex] == NO_PREDECESSOR and contracted_predecessors[i, vertex] != NO_PREDECESSOR:
+                chain = chains[(int(contracted_predecessors[i, vertex]), vertex)]
+                predecessors[i, chain[1:]] = chain[:-1]
+                vertex = chain[0]
+    return distance_matrix, predecessors
+
+#####################################################################################################################################################
+#####################################################################################################################################################
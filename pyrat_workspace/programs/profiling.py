@@ -0,0 +1,227 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program gathers tools to measure where time goes in the preprocessing and turn functions of a program.
+    Named spans are recorded in a profiler stored in the memory (wall time, number of calls and, optionally, allocated memory).
+    Spans are nested, so that a span opened in another one is reported as "outer/inner".
+    It does not define a player, but is used by the other programs, and reports are typically printed in postprocessing.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import time
+import functools
+import contextlib
+import tracemalloc
+
+#####################################################################################################################################################
+############################################################### CONSTANTS & VARIABLES ###############################################################
+#####################################################################################################################################################
+
+"""
+    Profiler receiving the spans of decorated functions, for each thread.
+    It is set while a span opened with a memory is running (see "span").
+"""
+
+_active = threading.local()
+
+#####################################################################################################################################################
+##################################################################### FUNCTIONS #####################################################################
+#####################################################################################################################################################
+
+class Profiler:
+
+    """
+        Recorder of named spans, to store in the memory of a player as memory.profiler.
+        When disabled, spans do nothing, so that instrumented programs run at almost the same speed.
+        When allocations are traced, tracemalloc is started, which slows down the program noticeably.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:              Self,
+                   enabled:           bool = True,
+                   trace_allocations: bool = False
+                 ) ->                 Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:              Reference to the current object.
+                * enabled:           Set to False to make all spans do nothing.
+                * trace_allocations: Set to True to also measure the memory allocated in each span.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # Options
+        self.enabled = enabled
+        self.trace_allocations = enabled and trace_allocations
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        # Statistics per span path, and currently open spans
+        self.spans = {}
+        self.stack = []
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    @contextlib.contextmanager
+    def span ( self: Self,
+               name: str
+             ) ->    Iterator[None]:
+
+        """
+            This function is a context manager measuring the code it contains as a span with the given name.
+            In:
+                * self: Reference to the current object.
+                * name: Name of the span.
+            Out:
+                * None.
+        """
+
+        # Nothing to do when disabled
+        if not self.enabled:
+            yield
+            return
+
+        # Open the span, spans being listed in the order in which they are first opened
+        self.stack.append(name)
+        path = "/".join(self.stack)
+        statistics = self.spans.setdefault(path, {"calls": 0, "duration": 0.0, "allocated": 0})
+        allocated_before = tracemalloc.get_traced_memory()[0] if self.trace_allocations else 0
+        start = time.perf_counter()
+
+        # Run the code and close the span, even if an exception is raised
+        try:
+            yield
+        finally:
+            statistics["calls"] += 1
+            statistics["duration"] += time.perf_counter() - start
+            if self.trace_allocations:
+                statistics["allocated"] += tracemalloc.get_traced_memory()[0] - allocated_before
+            self.stack.pop()
+
+    #############################################################################################################################################
+
+    def get_report ( self: Self
+                   ) ->    str:
+
+        """
+            This function returns a table of the recorded spans, in the order in which they were first opened, so that nested spans follow the span containing them.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * report: Table of spans, with number of calls, total and mean durations, and allocated memory if traced.
+        """
+
+        # Header
+        lines = ["%-50s %8s %12s %12s" % ("span", "calls", "total (ms)", "mean (ms)") + (" %14s" % "allocated (kB)" if self.trace_allocations else "")]
+
+        # One line per span, indented by depth
+        for path in self.spans:
+            statistics = self.spans[path]
+            names = path.split("/")
+            line = "%-50s %8d %12.3f %12.3f" % ("  " * (len(names) - 1) + names[-1], statistics["calls"], 1000 * statistics["duration"], 1000 * statistics["duration"] / statistics["calls"])
+            if self.trace_allocations:
+                line += " %14.1f" % (statistics["allocated"] / 1000)
+            lines.append(line)
+        return "\n".join(lines)
+
+#####################################################################################################################################################
+
+@contextlib.contextmanager
+def span ( name:   str,
+           memory: Optional[threading.local] = None
+         ) ->      Iterator[None]:
+
+    """
+        Function to measure the code it contains as a span, to use as a context manager (e.g., "with span('greedy', memory):").
+        If a memory is given, its profiler (memory.profiler) is used, and becomes the one receiving the spans of decorated functions during the span.
+        Otherwise, the profiler of the span currently running in this thread is used.
+        Nothing is recorded if there is no such profiler, or if it is disabled.
+        In:
+            * name:   Name of the span.
+            * memory: Memory of the player, or None to use the current profiler.
+        Out:
+            * None.
+    """
+
+    # Find the profiler
+    profiler = getattr(memory, "profiler", None) if memory is not None else getattr(_active, "profiler", None)
+    if profiler is None or not profiler.enabled:
+        yield
+        return
+
+    # Make it current for decorated functions while the span runs
+    previous_profiler = getattr(_active, "profiler", None)
+    _active.profiler = profiler
+    try:
+        with profiler.span(name):
+            yield
+    finally:
+        _active.profiler = previous_profiler
+
+#####################################################################################################################################################
+
+def profiled ( name: Optional[str] = None
+             ) ->    Callable[[Callable[..., Any]], Callable[..., Any]]:
+
+    """
+        Function to create a decorator measuring all calls to a function as spans of the current profiler (see "span").
+        Functions are often called from others that do not have access to the memory, hence the use of the current profiler.
+        When no profiler is current, the only cost is a lookup before calling the function.
+        In:
+            * name: Name of the span, or None to use the name of the function.
+        Out:
+            * decorator: Decorator to apply to the function.
+    """
+
+    # Decorator
+    def _decorator (function):
+        span_name = function.__name__ if name is None else name
+        @functools.wraps(function)
+        def _wrapper (*args, **kwargs):
+            profiler = getattr(_active, "profiler", None)
+            if profiler is None:
+                return function(*args, **kwargs)
+            with profiler.span(span_name):
+                return function(*args, **kwargs)
+        return _wrapper
+    return _decorator
+
+#####################################################################################################################################################
+
+def print_report ( memory: threading.local,
+                   title:  str = "Profiling"
+                 ) ->      None:
+
+    """
+        Function to print the report of the profiler of a player, if it is enabled.
+        In:
+            * memory: Memory of the player.
+            * title:  Title to print before the report.
+        Out:
+            * None.
+    """
+
+    # Print only if something was recorded
+    profiler = getattr(memory, "profiler", None)
+    if profiler is not None and profiler.enabled:
+        print(title)
+        print(profiler.get_report())
+
+#####################################################################################################################################################
+#####################################################################################################################################################
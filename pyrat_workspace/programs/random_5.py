@@ -21,7 +21,8 @@ from pyrat import *
 import random
 
 # Previously developed functions
-from tutorial import get_neighbors, locations_to_action , get_vertices
+from tutorial import get_neighbors, locations_to_action
+from maze_reduction import remove_dead_ends
 #####################################################################################################################################################
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
@@ -70,27 +71,11 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
     """
 
     """
-       To optimize the maze by removing death ends 
+       To optimize the maze by removing death ends, until there are none left without cheese
+       The game's maze is not modified, a reduced copy is stored instead
     """
-    graph=maze.copy()
-    vertices = get_vertices(maze)
-    death_ends= [vertice for vertice in vertices if len(get_neighbors(vertice,maze))<2 and vertice not in cheese]
-    # If "maze_representation" option is set to "dictionary"
-    if isinstance(graph, dict):
-        for death_end in death_ends :
-            graph[get_neighbors(death_end,maze)[0]].pop(death_end)
-        # To store the optimized maze
-        memory.maze = graph
-    # If "maze_representation" option is set to "matrix"
-    elif isinstance(graph, numpy.ndarray):
-        for death_end in death_ends :
-            graph[get_neighbors(death_end,maze),death_end]=0
-        # To store the optimized maze
-        memory.maze = graph
-    # Unhandled data type
-    else:
-        raise Exception("Unhandled graph type", type(graph))
-    
+    memory.maze = remove_dead_ends(maze, cheese + [player_locations[name]])
+
     # To store the already visited cells
     memory.visited_cells = []
     # To store the trajectory 
@@ -0,0 +1,169 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program gathers tools to follow a sequence of pieces of cheese, and to repair it when some of them disappear.
+    Pieces of cheese eaten by the opponent are detected by comparing the list of pieces of cheese to the one of the previous turn.
+    Only the route to the current target is converted to actions, so that removing a later target costs nothing, and stealing the current one only requires a new route.
+    A plan function that already found the route to its first target can return the actions along with the targets, so that no other traversal is needed.
+    It does not define a player, but is used by the turn functions of other programs.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import collections
+
+# Previously developed functions
+from tutorial import locations_to_action, ActionPlan
+from shortest_paths import RouteCache
+
+#####################################################################################################################################################
+##################################################################### FUNCTIONS #####################################################################
+#####################################################################################################################################################
+
+class Replanner:
+
+    """
+        Plan made of a sequence of pieces of cheese to visit, with the actions to reach the first one.
+        At each turn, pieces of cheese that disappeared since the previous turn are removed from the sequence.
+        The actions are recomputed only if the current target disappeared, and a new sequence is asked only when the current one is empty.
+        Routes are obtained from traversals from the pieces of cheese, kept in a route cache, and followed backwards since distances are symmetric.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:        Self,
+                   route_cache: RouteCache,
+                   targets:     List[int] = ()
+                 ) ->           Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:        Reference to the current object.
+                * route_cache: Cache of traversals to use to find routes.
+                * targets:     Initial sequence of pieces of cheese to visit.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # Store the cache
+        self.route_cache = route_cache
+
+        # Current plan, and pieces of cheese seen at the previous update
+        self.targets = collections.deque(targets)
+        self.actions = ActionPlan()
+        self.known_cheese = set()
+
+    #############################################################################################################################################
+    #                                                              PRIVATE METHODS                                                              #
+    #############################################################################################################################################
+
+    def _get_actions_towards ( self:     Self,
+                               location: int,
+                               target:   int
+                             ) ->        List[str]:
+
+        """
+            This function returns the actions to go from a location to a target, following backwards the route from the target.
+            In:
+                * self:     Reference to the current object.
+                * location: Vertex from which the route starts.
+                * target:   Vertex where the route ends.
+            Out:
+                * actions: Sequence of actions from the location to the target.
+        """
+
+        # Traverse from the target only once, and reverse the route
+        route = self.route_cache.get_route(target, location)
+        route.reverse()
+        return [locations_to_action(route[i], route[i + 1], self.route_cache.maze_width) for i in range(len(route) - 1)]
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def update ( self:          Self,
+                 location:      int,
+                 cheese:        List[int],
+                 plan_function: Callable[[int, List[int]], Union[List[int], Tuple[List[int], List[str]]]]
+               ) ->             None:
+
+        """
+            This function repairs the plan given the current location and pieces of cheese, so that the next action can be read.
+            In:
+                * self:          Reference to the current object.
+                * location:      Current location of the player.
+                * cheese:        Pieces of cheese still in the maze.
+                * plan_function: Function giving a new sequence of pieces of cheese to visit from a location, called only when the plan is empty, without the piece of cheese under the player.
+                                 It can also return a pair (targets, actions), where actions lead from the location to the first target.
+            Out:
+                * None.
+        """
+
+        # Find pieces of cheese that disappeared, and forget the route if the current target is one of them
+        remaining_cheese = set(cheese)
+        removed_cheese = self.known_cheese - remaining_cheese
+        self.known_cheese = remaining_cheese
+        if len(removed_cheese) > 0:
+            if len(self.targets) > 0 and self.targets[0] in removed_cheese:
+                self.actions.clear()
+            self.targets = collections.deque([target for target in self.targets if target not in removed_cheese])
+
+        # Go to the next target when needed, asking for a new plan if there is none
+        # The plan function does not see the piece of cheese under the player, and only targets it can be followed to are kept, so that it is not asked again forever
+        while len(self.actions) == 0 and len(remaining_cheese) > 0:
+            if len(self.targets) == 0:
+                reachable_cheese = [vertex for vertex in cheese if vertex != location]
+                if len(reachable_cheese) == 0:
+                    break
+                plan = plan_function(location, reachable_cheese)
+                first_actions = None
+                if isinstance(plan, tuple):
+                    plan, first_actions = plan
+                self.targets.extend([target for target in plan if target != location and target in remaining_cheese])
+                if len(self.targets) == 0:
+                    break
+                if first_actions is not None and self.targets[0] == plan[0]:
+                    self.actions.extend(first_actions)
+                    continue
+            target = self.targets[0]
+            if target == location or target not in remaining_cheese:
+                self.targets.popleft()
+                continue
+            self.actions.extend(self._get_actions_towards(location, target))
+
+    #############################################################################################################################################
+
+    def get_action ( self:          Self,
+                     location:      int,
+                     cheese:        List[int],
+                     plan_function: Callable[[int, List[int]], Union[List[int], Tuple[List[int], List[str]]]]
+                   ) ->             str:
+
+        """
+            This function repairs the plan (see "update") and returns the next action to perform.
+            In:
+                * self:          Reference to the current object.
+                * location:      Current location of the player.
+                * cheese:        Pieces of cheese still in the maze.
+                * plan_function: Function giving a new sequence of pieces of cheese to visit from a location, called only when the plan is empty.
+            Out:
+                * action: Next action to perform.
+        """
+
+        # Repair the plan and follow it
+        self.update(location, cheese, plan_function)
+        return self.actions.popleft()
+
+#####################################################################################################################################################
+#####################################################################################################################################################
@@ -0,0 +1,459 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program gathers shortest-path engines working on a compiled maze (see "compile_maze" in "tutorial.py").
+    Results are stored in NumPy arrays indexed by vertex, and routes are described by predecessor arrays rather than dictionaries.
+    It does not define a player, but is used by the other programs to build meta-graphs during preprocessing.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import heapq
+import collections
+
+# Previously developed functions
+from tutorial import compile_maze, CompiledMaze, locations_to_action
+from profiling import profiled
+
+#####################################################################################################################################################
+############################################################### CONSTANTS & VARIABLES ###############################################################
+#####################################################################################################################################################
+
+"""
+    Distance given to vertices that cannot be reached from the source.
+"""
+
+INFINITY = numpy.iinfo(numpy.int32).max
+
+#####################################################################################################################################################
+
+"""
+    Predecessor given to the source and to vertices that cannot be reached from the source.
+"""
+
+NO_PREDECESSOR = -1
+
+#####################################################################################################################################################
+
+"""
+    Number of routes kept as actions by a route store, the least recently used ones being forgotten first.
+"""
+
+MAX_NB_EXPANDED_ROUTES = 64
+
+#####################################################################################################################################################
+##################################################################### FUNCTIONS #####################################################################
+#####################################################################################################################################################
+
+def multi_target_dijkstra ( source:        int,
+                            compiled_maze: CompiledMaze,
+                            targets:       Optional[Iterable[int]] = None
+                          ) ->             Tuple[List[int], List[int], List[int]]:
+
+    """
+        Dijkstra's algorithm from a single source on a compiled maze, stopping as soon as all targets are settled.
+        Entries of the heap are (distance, vertex) pairs, and entries that are popped after their vertex is settled are skipped.
+        Targets are indexed in a boolean array over cells, so that checking if a popped vertex is a target takes constant time.
+        When stopping early, only settled vertices (including all targets) have their final distance and predecessor.
+        In:
+            * source:        Vertex from which to start the traversal.
+            * compiled_maze: Compiled maze on which to perform the traversal.
+            * targets:       Vertices to reach, or None to explore the whole maze.
+        Out:
+            * distances:       List giving for each vertex its distance to the source, or INFINITY if not reached.
+            * predecessors:    List giving for each vertex its predecessor on a shortest path from the source, or NO_PREDECESSOR.
+            * settled_targets: Targets in the order in which they were settled, i.e., by increasing distance to the source.
+    """
+
+    # Initialize the structures, sized by the number of cells
+    neighbors = compiled_maze.neighbors
+    neighbor_weights = compiled_maze.neighbor_weights
+    distances = [INFINITY] * compiled_maze.nb_vertices
+    predecessors = [NO_PREDECESSOR] * compiled_maze.nb_vertices
+    settled = bytearray(compiled_maze.nb_vertices)
+    distances[source] = 0
+    heap = [(0, source)]
+
+    # Index the targets
+    is_target = bytearray(compiled_maze.nb_vertices)
+    if targets is not None:
+        for target in targets:
+            is_target[target] = 1
+    nb_remaining_targets = sum(is_target) if targets is not None else -1
+    settled_targets = []
+
+    # Explore vertices by increasing distance
+    while len(heap) > 0 and nb_remaining_targets != 0:
+        distance, vertex = heapq.heappop(heap)
+        if settled[vertex]:
+            continue
+        settled[vertex] = 1
+        if is_target[vertex]:
+            settled_targets.append(vertex)
+            nb_remaining_targets -= 1
+        for neighbor, weight in zip(neighbors[vertex], neighbor_weights[vertex]):
+            new_distance = distance + weight
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                predecessors[neighbor] = vertex
+                heapq.heappush(heap, (new_distance, neighbor))
+
+    # Done
+    return distances, predecessors, settled_targets
+
+#####################################################################################################################################################
+
+def single_source_dijkstra ( source:        int,
+                             compiled_maze: CompiledMaze
+                           ) ->             Tuple[List[int], List[int]]:
+
+    """
+        Dijkstra's algorithm from a single source on a compiled maze, exploring the whole maze.
+        In:
+            * source:        Vertex from which to start the traversal.
+            * compiled_maze: Compiled maze on which to perform the traversal.
+        Out:
+            * distances:    List giving for each vertex its distance to the source, or INFINITY if not reachable.
+            * predecessors: List giving for each vertex its predecessor on a shortest path from the source, or NO_PREDECESSOR.
+    """
+
+    # Traversal without targets
+    distances, predecessors, _ = multi_target_dijkstra(source, compiled_maze)
+    return distances, predecessors
+
+#####################################################################################################################################################
+
+def multi_source_dijkstra ( sources: List[int],
+                            graph:   Union[CompiledMaze, numpy.ndarray, Dict[int, Dict[int, int]]],
+                            targets: Optional[Iterable[int]] = None
+                          ) ->       Tuple[numpy.ndarray, numpy.ndarray]:
+
+    """
+        Function to run Dijkstra's algorithm from multiple sources over a shared compiled maze.
+        The maze is compiled once (if not already done), and each source fills one row of the output arrays.
+        If targets are given, each traversal stops once all of them are settled (see "multi_target_dijkstra").
+        In:
+            * sources: Vertices from which to start the traversals.
+            * graph:   Graph on which to perform the traversals.
+            * targets: Vertices to reach from each source, or None to explore the whole maze.
+        Out:
+            * distances:    Array of shape (len(sources), nb_vertices), where distances[i, v] is the distance from sources[i] to v.
+            * predecessors: Array of shape (len(sources), nb_vertices), where predecessors[i, v] is the predecessor of v on a shortest path from sources[i].
+    """
+
+    # Compile the maze only once for all sources
+    compiled_maze = compile_maze(graph)
+    distances = numpy.empty((len(sources), compiled_maze.nb_vertices), dtype=numpy.int32)
+    predecessors = numpy.empty((len(sources), compiled_maze.nb_vertices), dtype=numpy.int32)
+
+    # Fill one row per source
+    targets = None if targets is None else set(targets)
+    for i in range(len(sources)):
+        distances[i], predecessors[i], _ = multi_target_dijkstra(sources[i], compiled_maze, targets)
+    return distances, predecessors
+
+#####################################################################################################################################################
+
+def distance_table ( vertices: List[int],
+                     graph:    Union[CompiledMaze, numpy.ndarray, Dict[int, Dict[int, int]]]
+                   ) ->        Tuple[numpy.ndarray, numpy.ndarray]:
+
+    """
+        Function to compute the matrix of shortest distances between all pairs of vertices of interest (e.g., player location and pieces of cheese).
+        In:
+            * vertices: Vertices of interest.
+            * graph:    Graph containing the vertices of interest.
+        Out:
+            * distance_matrix: Array of shape (len(vertices), len(vertices)), where distance_matrix[i, j] is the distance from vertices[i] to vertices[j].
+            * predecessors:    Array of shape (len(vertices), nb_vertices), as returned by "multi_source_dijkstra" (only valid on routes to vertices of interest).
+    """
+
+    # Run all sources until all vertices of interest are reached, then keep only the columns of interest
+    distances, predecessors = multi_source_dijkstra(vertices, graph, vertices)
+    distance_matrix = distances[:, vertices]
+    return distance_matrix, predecessors
+
+#####################################################################################################################################################
+
+def find_route_from_predecessors ( predecessors: Union[numpy.ndarray, List[int]],
+                                   source:       int,
+                                   target:       int
+                                 ) ->            List[int]:
+
+    """
+        Function to return a sequence of locations using a predecessor array obtained from the given source.
+        In:
+            * predecessors: Predecessor array as obtained by a traversal from the source (one row of the output of "multi_source_dijkstra").
+            * source:       Vertex from which we start the route.
+            * target:       Target to reach using the predecessor array.
+        Out:
+            * route: Sequence of locations to reach the target from the source.
+    """
+
+    # Walk back from the target
+    route = [target]
+    vertex = target
+    while vertex != source:
+        vertex = int(predecessors[vertex])
+        if vertex == NO_PREDECESSOR:
+            raise Exception("Target", target, "is not reachable from", source)
+        route.append(vertex)
+    route.reverse()
+    return route
+
+#####################################################################################################################################################
+
+class RouteCache:
+
+    """
+        Cache of shortest distances and routes between locations of interest, to share between solvers of a same game.
+        Each source is explored by a single traversal the first time it is needed, and the obtained distances and predecessors are kept.
+        Actions between a source and a target are computed on demand and kept, keyed by (source, target).
+        It is typically created during preprocessing and stored in the memory, to be reused during turns.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:       Self,
+                   graph:      Union[CompiledMaze, numpy.ndarray, Dict[int, Dict[int, int]]],
+                   maze_width: int
+                 ) ->          Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:       Reference to the current object.
+                * graph:      Graph on which to compute the routes.
+                * maze_width: Width of the maze in number of cells.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # Store the compiled maze
+        self.compiled_maze = compile_maze(graph)
+        self.maze_width = maze_width
+
+        # Results of traversals per source, and actions per (source, target)
+        self.distances = {}
+        self.predecessors = {}
+        self.actions = {}
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def add_sources ( self:    Self,
+                      sources: List[int]
+                    ) ->       None:
+
+        """
+            This function performs a traversal from all given sources that have not been explored yet.
+            In:
+                * self:    Reference to the current object.
+                * sources: Sources to explore.
+            Out:
+                * None.
+        """
+
+        # Explore missing sources only
+        for source in sources:
+            if source not in self.distances:
+                self.distances[source], self.predecessors[source] = single_source_dijkstra(source, self.compiled_maze)
+
+    #############################################################################################################################################
+
+    def get_distance ( self:   Self,
+                       source: int,
+                       target: int
+                     ) ->      int:
+
+        """
+            This function returns the length of a shortest path from the source to the target.
+            In:
+                * self:   Reference to the current object.
+                * source: Vertex from which the path starts.
+                * target: Vertex where the path ends.
+            Out:
+                * distance: Length of the path, or INFINITY if the target cannot be reached.
+        """
+
+        # Explore the source if needed
+        self.add_sources([source])
+        return self.distances[source][target]
+
+    #############################################################################################################################################
+
+    def get_route ( self:   Self,
+                    source: int,
+                    target: int
+                  ) ->      List[int]:
+
+        """
+            This function returns a shortest sequence of locations from the source to the target.
+            In:
+                * self:   Reference to the current object.
+                * source: Vertex from which the route starts.
+                * target: Vertex where the route ends.
+            Out:
+                * route: Sequence of locations from the source to the target.
+        """
+
+        # Explore the source if needed
+        self.add_sources([source])
+        return find_route_from_predecessors(self.predecessors[source], source, target)
+
+    #############################################################################################################################################
+
+    def get_actions ( self:   Self,
+                      source: int,
+                      target: int
+                    ) ->      List[str]:
+
+        """
+            This function returns the actions to perform to go from the source to the target along a shortest path.
+            The returned list is shared with the cache, so it should be copied before being modified.
+            In:
+                * self:   Reference to the current object.
+                * source: Vertex from which the route starts.
+                * target: Vertex where the route ends.
+            Out:
+                * actions: Sequence of actions from the source to the target.
+        """
+
+        # Compute the actions the first time only
+        if (source, target) not in self.actions:
+            route = self.get_route(source, target)
+            self.actions[(source, target)] = [locations_to_action(route[i], route[i + 1], self.maze_width) for i in range(len(route) - 1)]
+        return self.actions[(source, target)]
+
+    #############################################################################################################################################
+
+    @profiled("distance_matrix")
+    def get_distance_matrix ( self:     Self,
+                              vertices: List[int]
+                            ) ->        numpy.ndarray:
+
+        """
+            This function returns the matrix of shortest distances between the given vertices.
+            In:
+                * self:     Reference to the current object.
+                * vertices: Vertices of interest.
+            Out:
+                * distance_matrix: Array of shape (len(vertices), len(vertices)), where distance_matrix[i, j] is the distance from vertices[i] to vertices[j].
+        """
+
+        # One traversal per missing source, then lookups
+        self.add_sources(vertices)
+        distance_matrix = numpy.empty((len(vertices), len(vertices)), dtype=numpy.int32)
+        for i in range(len(vertices)):
+            source_distances = self.distances[vertices[i]]
+            distance_matrix[i] = [source_distances[target] for target in vertices]
+        return distance_matrix
+
+#####################################################################################################################################################
+
+class RouteStore:
+
+    """
+        Compact store of shortest routes from a few sources, as obtained by "distance_table".
+        Only one predecessor array per source is kept, and routes are converted to actions on demand, when they are actually followed.
+        The most recently converted routes are kept, so that asking again for them is free, up to a fixed number of routes.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:                   Self,
+                   sources:                List[int],
+                   predecessors:           numpy.ndarray,
+                   maze_width:             int,
+                   max_nb_expanded_routes: int = MAX_NB_EXPANDED_ROUTES
+                 ) ->                      Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:                   Reference to the current object.
+                * sources:                Sources of the routes.
+                * predecessors:           Array of shape (len(sources), nb_vertices), where predecessors[i] is the predecessor array obtained from sources[i].
+                * maze_width:             Width of the maze in number of cells.
+                * max_nb_expanded_routes: Number of routes to keep as actions.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # Store the predecessor arrays, indexed by source
+        self.source_indices = {sources[i]: i for i in range(len(sources))}
+        self.predecessors = predecessors
+        self.maze_width = maze_width
+
+        # Routes converted to actions, from the least to the most recently used
+        self.max_nb_expanded_routes = max_nb_expanded_routes
+        self.expanded_routes = collections.OrderedDict()
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def get_route ( self:   Self,
+                    source: int,
+                    target: int
+                  ) ->      List[int]:
+
+        """
+            This function returns a shortest sequence of locations from the source to the target.
+            In:
+                * self:   Reference to the current object.
+                * source: Vertex from which the route starts, which should be one of the sources of the store.
+                * target: Vertex where the route ends.
+            Out:
+                * route: Sequence of locations from the source to the target.
+        """
+
+        # Walk back the predecessor array of the source
+        return find_route_from_predecessors(self.predecessors[self.source_indices[source]], source, target)
+
+    #############################################################################################################################################
+
+    def get_actions ( self:   Self,
+                      source: int,
+                      target: int
+                    ) ->      List[str]:
+
+        """
+            This function returns the actions to perform to go from the source to the target along a shortest path.
+            The returned list is shared with the store, so it should be copied before being modified.
+            In:
+                * self:   Reference to the current object.
+                * source: Vertex from which the route starts, which should be one of the sources of the store.
+                * target: Vertex where the route ends.
+            Out:
+                * actions: Sequence of actions from the source to the target.
+        """
+
+        # Reuse the route if recently converted
+        if (source, target) in self.expanded_routes:
+            self.expanded_routes.move_to_end((source, target))
+            return self.expanded_routes[(source, target)]
+
+        # Otherwise convert it, and forget the least recently used route if needed
+        route = self.get_route(source, target)
+        actions = [locations_to_action(route[i], route[i + 1], self.maze_width) for i in range(len(route) - 1)]
+        self.expanded_routes[(source, target)] = actions
+        if len(self.expanded_routes) > self.max_nb_expanded_routes:
+            self.expanded_routes.popitem(last=False)
+        return actions
+
+#####################################################################################################################################################
+#####################################################################################################################################################
@@ -20,11 +20,10 @@
 # Import PyRat
 from pyrat import *
 
-# External imports 
-import heapq
-
 # Previously developed functions
-from tutorial import get_neighbors, locations_to_action , get_vertices
+from tutorial import ActionPlan
+from shortest_paths import RouteStore
+from maze_reduction import contracted_distance_table
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
@@ -41,145 +40,31 @@ from tutorial import get_neighbors, locations_to_action , get_vertices
 #####################################################################################################################################################
 ##################################################### EXECUTED ONCE AT THE BEGINNING OF THE GAME ####################################################
 #####################################################################################################################################################
-def opposite(action):
-    if action == "west" :
-        return "east"
-    elif action == "east":
-        return "west"
-    elif action == "south" :
-        return "north"
-    elif action == "north" :
-        return "south"
-def list_opposite(l):
-    l.reverse()
-    rep=[]
-    for i in l:
-        rep.append(opposite(i))
-    rep.reverse()
-    return rep
-
-def traversal ( source:             int,
-            graph:              Union[numpy.ndarray, Dict[int, Dict[int, int]]],
-            create_structure:   Callable[[], Any],
-            push_to_structure:  Callable[[Any, Tuple[int, int, int]], None],
-            pop_from_structure: Callable[[Any], Tuple[int, int, int]],
-            #vertice_list : List[int]
-            ) ->                  Tuple[Dict[int, int], Dict[int, Union[None, int]]]:
-    """
-    Traversal function that explores a graph from a given vertex.
-    This function is generic and can be used for most graph traversal.
-    To adapt it to a specific traversal, you need to provide the adapted functions to create, push and pop elements from the structure.
-    In:
-        * source:             Vertex from which to start the traversal.
-        * graph:              Graph on which to perform the traversal.
-        * create_structure:   Function that creates an empty structure to use in the traversal.
-        * push_to_structure:  Function that adds an element of type B to the structure of type A.
-        * pop_from_structure: Function that returns and removes an element of type B from the structure of type A.
-    Out:
-        * distances_to_explored_vertices: Dictionary where keys are explored vertices and associated values are the lengths of the paths to reach them.
-        * routing_table:                  Routing table to allow reconstructing the paths obtained by the traversal.
+def graph_to_metagraph ( graph:      Union[numpy.ndarray, Dict[int, Dict[int, int]]],
+                         vertices:   List[int],
+                         maze_width: int
+                       ) ->          Tuple[Dict[int, Dict[int, int]], RouteStore]:
     """
-    distances_to_explored_vertices={source:0}
-    routing_table={source:None}
-    visited=create_structure()
-    push_to_structure(visited,(source,0))
-    while len(visited)>0:
-        pop, distance_to_source =pop_from_structure(visited)
-        for vertice in get_neighbors(pop,graph):
-            if vertice in distances_to_explored_vertices:
-                if distances_to_explored_vertices[vertice] > distance_to_source+graph[vertice][pop] :
-                    distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                    push_to_structure(visited,(vertice,distances_to_explored_vertices[vertice]))
-                    routing_table[vertice]=pop
-                    """if pop in cheese_list:
-                        if len(cheese_list)==1:
-                            print("pop",pop,"vertice",vertice)
-                            distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                            routing_table[vertice]=pop
-                            return distances_to_explored_vertices , routing_table
-                        else :  
-                            cheese_list.remove(pop)"""
-            else :
-                distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                push_to_structure(visited,(vertice,distances_to_explored_vertices[vertice]))
-                routing_table[vertice]=pop
-                """if pop in cheese_list:
-                        if len(cheese_list)==1:
-                            print("pop",pop,"vertice",vertice)
-                            distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                            routing_table[vertice]=pop
-                            return distances_to_explored_vertices , routing_table
-                        else :  
-                            cheese_list.remove(pop)"""
-    return distances_to_explored_vertices , routing_table
-def dijkstra ( source: int,
-                graph:  Union[numpy.ndarray, Dict[int, Dict[int, int]]],
-                #vertice_list : List[int]
-                ) ->      Tuple[Dict[int, int], Dict[int, Union[None, int]]]:
-    """
-        Dijkstra's algorithm is a particular traversal where vertices are explored in an order that is proportional to the distance to the source vertex.
+        Function to build a complete graph out of locations of interest in a given graph.
+        All distances are obtained from a single batch of traversals, on the maze without dead ends and with contracted corridors (see "contracted_distance_table").
+        Routes are not converted to actions here, but kept as predecessor arrays in a route store, to convert only those that are followed.
         In:
-            * source: Vertex from which to start the traversal.
-            * graph:  Graph on which to perform the traversal.
+            * graph:      Graph containing the vertices of interest.
+            * vertices:   Vertices to use in the complete graph, vertices[0] is the player location.
+            * maze_width: Width of the maze in number of cells.
         Out:
-            * distances_to_explored_vertices: Dictionary where keys are explored vertices and associated values are the lengths of the paths to reach them.
-            * routing_table:                  Routing table to allow reconstructing the paths obtained by the traversal.
+            * meta_graph: Complete graph of the vertices of interest.
+            * route:      Route store giving the actions to go from a vertex of interest to another (see "RouteStore").
     """
-    
-    # Function to create an empty priority queue
-    def _create_structure ():
-        return []
-    # Function to add an element to the priority queue
-    def _push_to_structure (structure, element):
-        heapq.heappush(structure, element)
-    # Function to extract an element from the priority queue
-    def _pop_from_structure (structure):
-        return heapq.heappop(structure)
-    
-    # Perform the traversal
-    distances_to_explored_vertices, routing_table = traversal(source, graph, _create_structure, _push_to_structure, _pop_from_structure)
-    return distances_to_explored_vertices, routing_table
-
-def find_route ( routing_table: Dict[int, Union[None, int]],
-                    source:        int,
-                    target:        int
-                ) ->             List[int]:
-    """
-        Function to return a sequence of locations using a provided routing table.
-        In:
-            * routing_table: Routing table as obtained by the traversal.
-            * source:        Vertex from which we start the route (should be the one matching the routing table).
-            * target:        Target to reach using the routing table.
-        Out:
-            * route: Sequence of locations to reach the target from the source, as perfomed in the traversal.
-    """
-    route=[target]
-    vertice=target
-    while routing_table[vertice]!= source :
-        temp=routing_table[vertice]
-        vertice=temp
-        route.append(vertice)
-    route.append(source)
-    route.reverse()
-    return route
-def locations_to_actions ( locations:  List[int],
-                               maze_width: int
-                             ) ->          List[str]: 
-        """
-            Function to transform a list of locations into a list of actions to reach vertex i+1 from vertex i.
-            In:
-                * locations:  List of locations to visit in order.
-                * maze_width: Width of the maze in number of cells.
-            Out:
-                * actions: Sequence of actions to visit the list of locations.
-        """
-        
-        # We iteratively transforms pairs of locations in the corresponding action
-        actions = []
-        for i in range(len(locations)-1):
-             action = locations_to_action(locations[i], locations[i + 1], maze_width)
-             actions.append(action)
-        return actions
+    #initilisation de meta_graph avec les valeurs des sommets des frommages 
+    meta_graph={i:{} for i in vertices}
+    distance_matrix, predecessors = contracted_distance_table(vertices, graph)
+    for source in range(len(vertices)) :
+        for target in range(len(vertices)):
+            if vertices[source]!=vertices[target]:
+                meta_graph[vertices[source]][vertices[target]]=int(distance_matrix[source,target])
+    route=RouteStore(vertices,predecessors,maze_width)
+    return meta_graph,route
 
 def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
                     maze_width:       int,
@@ -217,40 +102,6 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
     temp=cheese.copy()
     vertice_list=vertice_list+temp
 
-    def graph_to_metagraph ( graph:    Union[numpy.ndarray, Dict[int, Dict[int, int]]],
-                            vertices: List[int]
-                        ) ->        Tuple[numpy.ndarray, Dict[int, Dict[int, Union[None, int]]]]:
-        #changer matrice en dictionaire de dictionaire pour stocker le numéro des sommets avec la longueur 
-        """
-            Function to build a complete graph out of locations of interest in a given graph.
-            In:
-                * graph:    Graph containing the vertices of interest.
-                * vertices: Vertices to use in the complete graph.
-                * vertices_list[0] is the player location
-            Out:
-                * complete_graph: Complete graph of the vertices of interest.
-                * routing_tables: Dictionary of routing tables obtained by traversals used to build the complete graph.
-        """
-        #initilisation de meta_graph et route avec les valeurs des sommets des frommages 
-        meta_graph={i:{} for i in vertice_list}
-        route={i:{} for i in vertice_list}
-        for source in range(len(vertice_list)) :
-            distances_to_explored_vertices, routing_table=dijkstra(vertice_list[source],maze)
-            for cheesei in range(source+1,len(vertice_list)):
-                meta_graph[vertice_list[source]][vertice_list[cheesei]]=distances_to_explored_vertices[vertice_list[cheesei]]
-                route[vertice_list[source]][vertice_list[cheesei]]=locations_to_actions(find_route(routing_table,vertice_list[source],vertice_list[cheesei]),maze_width)
-        #symétrisation du meta_graph , route
-        for i in meta_graph:
-            for j in meta_graph[i]:
-                meta_graph[j][i]=meta_graph[i][j]
-        for i in route:
-            for j in route[i]:
-                if route[i][j] == None:
-                    continue
-                else:
-                    temp=route[i][j]
-                    route[j][i]=list_opposite(temp)
-        return meta_graph,route
         
     
     def tsp ( complete_graph: numpy.ndarray,
@@ -295,13 +146,13 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
             Function to find the path .
             In:
                 * path: list of vertices of meta_graph .
-                * route: list of action to travel across different vertices in the meta_graph
+                * route: route store giving the actions to travel across different vertices in the meta_graph
         """
-        actions=[]
+        actions=ActionPlan()
         for i in range(len(path)-1):
-            actions=actions+route[path[i]][path[i+1]]
+            actions.extend(route.get_actions(path[i],path[i+1]))
         memory.actions=actions
-    meta_graph , route = graph_to_metagraph(maze,vertice_list)
+    meta_graph , route = graph_to_metagraph(maze,vertice_list,maze_width)
     meta_graph_to_action(tsp(meta_graph,vertice_list[0]),route)
     pass
     
@@ -343,7 +194,7 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
     """
 
     # [TODO] Write your turn code here and do not forget to return a possible action
-    action = memory.actions.pop(0)
+    action = memory.actions.popleft()
     return action
 
 #####################################################################################################################################################
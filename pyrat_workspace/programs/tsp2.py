@@ -24,7 +24,10 @@ from pyrat import *
 import heapq
 
 # Previously developed functions
-from tutorial import get_neighbors, locations_to_action , get_vertices
+from tutorial import get_neighbors, locations_to_action , get_vertices, get_weight, compile_maze, ActionPlan
+from dijkstra import traversal, dijkstra
+from tsp import graph_to_metagraph
+from tsp_greedy import nearest_neighbor_order
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
@@ -36,7 +39,112 @@ from tutorial import get_neighbors, locations_to_action , get_vertices
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
 
-# [TODO] It is good practice to keep all developed functions in an easily identifiable section
+def branch_and_bound_order ( distance_matrix: Union[numpy.ndarray, List[List[int]]]
+                           ) ->               List[int]:
+
+    """
+        Function to find a shortest path starting at vertex 0 and visiting all vertices of a complete graph, with a branch-and-bound search.
+        The best path is initialized with the multi-start nearest neighbor heuristic, and a branch is cut as soon as a lower bound of its length is not better.
+        The lower bound is the current length, plus the shortest edge to an unvisited vertex, plus the weight of a minimum spanning tree of unvisited vertices.
+        Indeed, the rest of the path goes to an unvisited vertex, then connects all unvisited vertices, so it is a spanning tree of them.
+        A branch is also cut if the same vertices were already visited, ending at the same vertex, with a path that was not longer.
+        Visited vertices are stored as bits of an integer, the current path is a stack modified in place, and spanning trees are memorized per set of vertices.
+        In:
+            * distance_matrix: Distances between the vertices, where the path starts at vertex 0.
+        Out:
+            * order: Order in which vertices are visited in a shortest path, starting with 0.
+    """
+
+    # Trivial cases
+    nb_vertices = len(distance_matrix)
+    if nb_vertices <= 2:
+        return list(range(nb_vertices))
+
+    # Python lists are faster than NumPy arrays for accessing elements one by one
+    distances = [[int(distance) for distance in row] for row in distance_matrix]
+    undirected_distances = [[min(distances[i][j], distances[j][i]) for j in range(nb_vertices)] for i in range(nb_vertices)]
+    neighbors_by_distance = [sorted([j for j in range(nb_vertices) if j != i], key=lambda j: distances[i][j]) for i in range(nb_vertices)]
+    all_visited = (1 << nb_vertices) - 1
+
+    # Initial solution
+    best_order = nearest_neighbor_order(distances, True)
+    best_length = sum([distances[best_order[i]][best_order[i + 1]] for i in range(nb_vertices - 1)])
+
+    # Function to compute the weight of a minimum spanning tree of a set of vertices (Prim's algorithm), memorized per set
+    spanning_tree_weights = {}
+    def _spanning_tree_weight (vertices_set):
+        if vertices_set not in spanning_tree_weights:
+            vertices = [vertex for vertex in range(nb_vertices) if vertices_set >> vertex & 1]
+            connection_costs = {vertex: undirected_distances[vertices[0]][vertex] for vertex in vertices[1:]}
+            weight = 0
+            while len(connection_costs) > 0:
+                closest = min(connection_costs, key=connection_costs.get)
+                weight += connection_costs.pop(closest)
+                for vertex in connection_costs:
+                    connection_costs[vertex] = min(connection_costs[vertex], undirected_distances[closest][vertex])
+            spanning_tree_weights[vertices_set] = weight
+        return spanning_tree_weights[vertices_set]
+
+    # Depth-first search, exploring closest vertices first
+    path = [0]
+    shortest_prefixes = {}
+    def _search (current_vertex, visited, current_length):
+        nonlocal best_order, best_length
+
+        # Cut if a path covering the same vertices to the same end was not longer
+        if shortest_prefixes.get((visited, current_vertex), best_length) <= current_length:
+            return
+        shortest_prefixes[(visited, current_vertex)] = current_length
+
+        # Complete path
+        if visited == all_visited:
+            if current_length < best_length:
+                best_length = current_length
+                best_order = list(path)
+            return
+
+        # Lower bound on the length of the completed path
+        unvisited = all_visited ^ visited
+        closest_unvisited = next(vertex for vertex in neighbors_by_distance[current_vertex] if unvisited >> vertex & 1)
+        if current_length + distances[current_vertex][closest_unvisited] + _spanning_tree_weight(unvisited) >= best_length:
+            return
+
+        # Extend the path in place
+        for neighbor in neighbors_by_distance[current_vertex]:
+            if unvisited >> neighbor & 1:
+                new_length = current_length + distances[current_vertex][neighbor]
+                if new_length >= best_length:
+                    break
+                path.append(neighbor)
+                _search(neighbor, visited | 1 << neighbor, new_length)
+                path.pop()
+
+    # Perform the search
+    _search(0, 1, 0)
+    return best_order
+
+#####################################################################################################################################################
+
+def tsp ( complete_graph: Dict[int, Dict[int, int]],
+          source:         int
+        ) ->              List[int]:
+
+    """
+        Function to solve the TSP on a meta-graph with a branch-and-bound search (see "branch_and_bound_order").
+        In:
+            * complete_graph: Complete graph of the vertices of interest, as returned by "graph_to_metagraph".
+            * source:         Vertex used to start the search.
+        Out:
+            * path: Shortest path starting at the source and visiting all vertices of the meta-graph.
+    """
+
+    # Index the vertices, with the source first
+    vertices = [source] + [vertex for vertex in complete_graph if vertex != source]
+    distance_matrix = [[complete_graph[u][v] if u != v else 0 for v in vertices] for u in vertices]
+
+    # Solve and convert back to vertices
+    order = branch_and_bound_order(distance_matrix)
+    return [vertices[i] for i in order]
 
 #####################################################################################################################################################
 ##################################################### EXECUTED ONCE AT THE BEGINNING OF THE GAME ####################################################
@@ -58,88 +166,6 @@ def list_opposite(l):
     rep.reverse()
     return rep
 
-def traversal ( source:             int,
-            graph:              Union[numpy.ndarray, Dict[int, Dict[int, int]]],
-            create_structure:   Callable[[], Any],
-            push_to_structure:  Callable[[Any, Tuple[int, int, int]], None],
-            pop_from_structure: Callable[[Any], Tuple[int, int, int]],
-            #vertice_list : List[int]
-            ) ->                  Tuple[Dict[int, int], Dict[int, Union[None, int]]]:
-    """
-    Traversal function that explores a graph from a given vertex.
-    This function is generic and can be used for most graph traversal.
-    To adapt it to a specific traversal, you need to provide the adapted functions to create, push and pop elements from the structure.
-    In:
-        * source:             Vertex from which to start the traversal.
-        * graph:              Graph on which to perform the traversal.
-        * create_structure:   Function that creates an empty structure to use in the traversal.
-        * push_to_structure:  Function that adds an element of type B to the structure of type A.
-        * pop_from_structure: Function that returns and removes an element of type B from the structure of type A.
-    Out:
-        * distances_to_explored_vertices: Dictionary where keys are explored vertices and associated values are the lengths of the paths to reach them.
-        * routing_table:                  Routing table to allow reconstructing the paths obtained by the traversal.
-    """
-    distances_to_explored_vertices={source:0}
-    routing_table={source:None}
-    visited=create_structure()
-    push_to_structure(visited,(source,0))
-    while len(visited)>0:
-        pop, distance_to_source =pop_from_structure(visited)
-        for vertice in get_neighbors(pop,graph):
-            if vertice in distances_to_explored_vertices:
-                if distances_to_explored_vertices[vertice] > distance_to_source+graph[vertice][pop] :
-                    distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                    push_to_structure(visited,(vertice,distances_to_explored_vertices[vertice]))
-                    routing_table[vertice]=pop
-                    """if pop in cheese_list:
-                        if len(cheese_list)==1:
-                            print("pop",pop,"vertice",vertice)
-                            distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                            routing_table[vertice]=pop
-                            return distances_to_explored_vertices , routing_table
-                        else :  
-                            cheese_list.remove(pop)"""
-            else :
-                distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                push_to_structure(visited,(vertice,distances_to_explored_vertices[vertice]))
-                routing_table[vertice]=pop
-                """if pop in cheese_list:
-                        if len(cheese_list)==1:
-                            print("pop",pop,"vertice",vertice)
-                            distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                            routing_table[vertice]=pop
-                            return distances_to_explored_vertices , routing_table
-                        else :  
-                            cheese_list.remove(pop)"""
-    return distances_to_explored_vertices , routing_table
-def dijkstra ( source: int,
-                graph:  Union[numpy.ndarray, Dict[int, Dict[int, int]]],
-                #vertice_list : List[int]
-                ) ->      Tuple[Dict[int, int], Dict[int, Union[None, int]]]:
-    """
-        Dijkstra's algorithm is a particular traversal where vertices are explored in an order that is proportional to the distance to the source vertex.
-        In:
-            * source: Vertex from which to start the traversal.
-            * graph:  Graph on which to perform the traversal.
-        Out:
-            * distances_to_explored_vertices: Dictionary where keys are explored vertices and associated values are the lengths of the paths to reach them.
-            * routing_table:                  Routing table to allow reconstructing the paths obtained by the traversal.
-    """
-    
-    # Function to create an empty priority queue
-    def _create_structure ():
-        return []
-    # Function to add an element to the priority queue
-    def _push_to_structure (structure, element):
-        heapq.heappush(structure, element)
-    # Function to extract an element from the priority queue
-    def _pop_from_structure (structure):
-        return heapq.heappop(structure)
-    
-    # Perform the traversal
-    distances_to_explored_vertices, routing_table = traversal(source, graph, _create_structure, _push_to_structure, _pop_from_structure)
-    return distances_to_explored_vertices, routing_table
-
 def find_route ( routing_table: Dict[int, Union[None, int]],
                     source:        int,
                     target:        int
@@ -219,90 +245,21 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
         return actions
     
 
-    def graph_to_metagraph ( graph:    Union[numpy.ndarray, Dict[int, Dict[int, int]]],
-                            vertices: List[int]
-                        ) ->        Tuple[numpy.ndarray, Dict[int, Dict[int, Union[None, int]]]]:
-        #changer matrice en dictionaire de dictionaire pour stocker le numéro des sommets avec la longueur 
-        """
-            Function to build a complete graph out of locations of interest in a given graph.
-            In:
-                * graph:    Graph containing the vertices of interest.
-                * vertices: Vertices to use in the complete graph.
-                * vertices_list[0] is the player location
-            Out:
-                * complete_graph: Complete graph of the vertices of interest.
-                * routing_tables: Dictionary of routing tables obtained by traversals used to build the complete graph.
-        """
-        #initilisation de meta_graph et route avec les valeurs des sommets des frommages 
-        meta_graph={i:{} for i in vertice_list}
-        route={i:{} for i in vertice_list}
-        for source in range(len(vertice_list)) :
-            distances_to_explored_vertices, routing_table=dijkstra(vertice_list[source],maze)
-            for cheesei in range(source+1,len(vertice_list)):
-                meta_graph[vertice_list[source]][vertice_list[cheesei]]=distances_to_explored_vertices[vertice_list[cheesei]]
-                route[vertice_list[source]][vertice_list[cheesei]]=locations_to_actions(find_route(routing_table,vertice_list[source],vertice_list[cheesei]),maze_width)
-        #symétrisation du meta_graph , route
-        for i in meta_graph:
-            for j in meta_graph[i]:
-                meta_graph[j][i]=meta_graph[i][j]
-        for i in route:
-            for j in route[i]:
-                if route[i][j] == None:
-                    continue
-                else:
-                    temp=route[i][j]
-                    route[j][i]=list_opposite(temp)
-        return meta_graph,route
         
     
-    def tsp ( complete_graph: numpy.ndarray,
-            source:         int
-        ) ->              Tuple[List[int], int]:
-        """
-            Function to solve the TSP using an exhaustive search.
-            In:
-                * complete_graph: Complete graph of the vertices of interest.
-                * source:         Vertex used to start the search.
-            Out:
-                * path : the shortest path to perform the meta_graph
-        """
-        # We will fill these variables during the traversal
-        memory.min_path=[]
-        memory.min_lenght=10000000 #considerer comme infini
-        # Internal implementation of the recursive DFS
-        def tsp_recursive (current_vertex, path, current_length,visited):
-            # Visit the vertex 
-            # We stop when all vertices are visited
-            if len(path) == len(complete_graph) :
-                #actualisation du plus cour chemin
-                if current_length<memory.min_lenght:
-                    memory.min_lenght=current_length
-                    memory.min_path=path
-            #mise en place du backtracking
-            if current_length>memory.min_lenght :
-                return 
-            
-            # If there are still vertices to visit, we explore unexplored neighbors 
-            for neighbor in complete_graph[current_vertex] :
-                if neighbor not in visited :
-                    tsp_recursive(neighbor, path+[neighbor], current_length + complete_graph[current_vertex][neighbor],visited+[neighbor])
-        # Perform the traversal
-        tsp_recursive(source,[source],0,[source])
-        memory.min_path
-        return memory.min_path
     #list of action
     def meta_graph_to_action(path,route):
         """
             Function to find the path .
             In:
                 * path: list of vertices of meta_graph .
-                * route: list of action to travel across different vertices in the meta_graph
+                * route: route store giving the actions to travel across different vertices in the meta_graph
         """
-        actions=[]
+        actions=ActionPlan()
         for i in range(len(path)-1):
-            actions=actions+route[path[i]][path[i+1]]
+            actions.extend(route.get_actions(path[i],path[i+1]))
         memory.actions=actions
-    meta_graph , route = graph_to_metagraph(maze,vertice_list)
+    meta_graph , route = graph_to_metagraph(maze,vertice_list,maze_width)
     meta_graph_to_action(tsp(meta_graph,vertice_list[0]),route)
     pass
     
@@ -344,7 +301,7 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
     """
 
     # [TODO] Write your turn code here and do not forget to return a possible action
-    action = memory.actions.pop(0)
+    action = memory.actions.popleft()
     return action
 
 #####################################################################################################################################################
@@ -19,69 +19,93 @@ import heapq as h
 
 # Previously developed functions
 from dijkstra_A import dijkstra 
+from shortest_paths import RouteCache
+from profiling import profiled
+from replanning import Replanner
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
 #####################################################################################################################################################
 
-# [TODO] It is good practice to keep all your constants and global variables in an easily identifiable section
+"""
+    Coûts utilisés dans held_karp, pour que toutes les sommes tiennent dans un int32.
+    INFINI remplace les distances infinies (fromages inaccessibles). Un chemin passe par au plus 31 arêtes (bien plus que ce que la mémoire permet),
+    donc son coût reste inférieur à 31*INFINI < IMPOSSIBLE, et un chemin qui passe moins souvent par une arête impossible est préféré.
+    IMPOSSIBLE est le coût des états qui ne correspondent à aucun chemin, et IMPOSSIBLE+INFINI < 2^31.
+"""
+
+INFINI = 2**25
+IMPOSSIBLE = 2**30
 
 #####################################################################################################################################################
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
 
-def held_karp(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:List[int],maze_width:int):
+@profiled()
+def held_karp_order(distance_matrix:numpy.ndarray):
+  """
+  Renvoie l'ordre de visite optimal des villes 1..n-1 en partant de la ville 0, pour une matrice des distances donnée.
+  Les sous-ensembles de fromages sont codés par des masques de bits : g[S,k] est la longueur du plus court chemin partant de 0,
+  visitant exactement les fromages de S et finissant en k. Les coûts sont stockés dans un tableau int32 de taille (2^n, n)
+  et les prédécesseurs dans un tableau int8 de même taille, ce qui permet de traiter 18 à 20 fromages.
+  Le minimum sur les prédécesseurs est calculé en une seule opération NumPy pour tous les ensembles de même taille.
+  """
+  n=len(distance_matrix)-1
+  if n==0:
+    return [0]
+  assert n<32
+  distances=numpy.minimum(numpy.asarray(distance_matrix,dtype=numpy.float64),INFINI).astype(numpy.int32)
+  entre_fromages=distances[1:,1:]
+  ensembles=numpy.arange(1<<n)
+  tailles=numpy.zeros(1<<n,dtype=numpy.int8)
+  for k in range(n):
+    tailles+=((ensembles>>k)&1).astype(numpy.int8)
+  g=numpy.full((1<<n,n),IMPOSSIBLE,dtype=numpy.int32)
+  parents=numpy.full((1<<n,n),-1,dtype=numpy.int8)
+  g[1<<numpy.arange(n),numpy.arange(n)]=distances[0,1:]
+  for s in range(2,n+1):
+    couche=ensembles[tailles==s]
+    for k in range(n):
+      S=couche[((couche>>k)&1)==1]
+      couts=g[S^(1<<k)]+entre_fromages[:,k]
+      meilleurs=couts.argmin(axis=1)
+      g[S,k]=couts[numpy.arange(len(S)),meilleurs]
+      parents[S,k]=meilleurs
+  S=(1<<n)-1
+  k=int(g[S].argmin())
+  ordre=[]
+  while k!=-1:
+    ordre.append(k+1)
+    S,k=S^(1<<k),int(parents[S,k])
+  ordre.append(0)
+  ordre.reverse()
+  return ordre
+
+def fromages_held_karp(start_vertex:int,cheese:List[int],route_cache:RouteCache):
+  """
+  Renvoie les fromages dans l'ordre du chemin le plus court qui les ramasse tous en partant de start_vertex.
+  """
+  villes=[start_vertex]+cheese
+  ordre=held_karp_order(route_cache.get_distance_matrix(villes))
+  return [villes[k] for k in ordre[1:]]
+
+def held_karp(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:List[int],maze_width:int,route_cache:Optional[RouteCache]=None):
   """
   Renvoie le chemin le plus court à suivre pour ramasser des fromages dans un labyrinthe en complexité en O(n^2 * 2^n).
+  Les distances et les chemins entre villes sont lus dans route_cache (un parcours par ville), qui peut être partagé avec d'autres solveurs.
   """
     
   n=len(cheese)+1
 
-  def combinaisons(n:int,k:int):
-    """
-    Renvoie les parties à k éléments de [2,n]
-    """
-    def aux(element, combinaison_actuelle):
-        if len(combinaison_actuelle)==k:
-            combinaisons.append(tuple(combinaison_actuelle))
-            return
-        for i in range(element, n+1):
-            combinaison_actuelle.append(i)
-            aux(i+1,combinaison_actuelle)
-            combinaison_actuelle.pop()
-    combinaisons=[]
-    aux(1,[])
-    return combinaisons
-
   assert n>=2
 
-  if n==2 :
-    return dijkstra(start_vertex,maze,cheese,maze_width)
-    
-  else :
-    villes=[start_vertex]+cheese
-    distance_matrix=[[dijkstra(ville1,maze,[ville2],maze_width) for ville2 in villes] for ville1 in villes]
-    g={((k,),k):(dijkstra(start_vertex,maze,[villes[k]],maze_width)[0],[0]) for k in range(1,n)}
-    for s in range(2,n):
-      for S in combinaisons(n-1,s):
-        for k in range(s):
-          mini,ordre=float("inf"),None
-          n_S=S[:k]+S[k+1:]
-          for m in n_S:
-            if mini>g[n_S,m][0]+distance_matrix[m][S[k]][0]:
-              mini=g[n_S,m][0]+distance_matrix[m][S[k]][0]
-              ordre=g[n_S,m][1]+[m]
-          g[(S,S[k])]=mini,ordre
-    mini,ordre=float("inf"),None
-    for k in range(1,n):
-      if mini>g[tuple(range(1,n)),k][0]:
-        mini=g[tuple(range(1,n)),k][0]
-        ordre=g[tuple(range(1,n)),k][1]+[k]
-    directions=[]
-    for k in range(n-1):
-      directions+=distance_matrix[ordre[k]][ordre[k+1]][1]
-    print(distance_matrix)
-    return directions
+  if route_cache is None:
+    route_cache=RouteCache(maze,maze_width)
+  villes=[start_vertex]+fromages_held_karp(start_vertex,cheese,route_cache)
+  directions=[]
+  for k in range(n-1):
+    directions+=route_cache.get_actions(villes[k],villes[k+1])
+  return directions
             
 #####################################################################################################################################################
 ##################################################### EXECUTED ONCE AT THE BEGINNING OF THE GAME ####################################################
@@ -116,8 +140,9 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
         Out:
             * None.
     """
-    global routing_table
-    routing_table=list(held_karp(player_locations[name],maze,cheese,maze_width))
+    memory.route_cache=RouteCache(maze,maze_width)
+    memory.replanner=Replanner(memory.route_cache,fromages_held_karp(player_locations[name],cheese,memory.route_cache))
+    memory.replanner.update(player_locations[name],cheese,lambda location,cheese:fromages_held_karp(location,cheese,memory.route_cache))
     
 #####################################################################################################################################################
 ######################################################### EXECUTED AT EACH TURN OF THE GAME #########################################################
@@ -156,7 +181,8 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
             * action: One of the possible actions, as given in possible_actions.
     """
 
-    return routing_table.pop(0)
+    # Les fromages mangés par l'adversaire sont retirés du tour, sans refaire held_karp
+    return memory.replanner.get_action(player_locations[name],cheese,lambda location,cheese:fromages_held_karp(location,cheese,memory.route_cache))
 
 #####################################################################################################################################################
 ######################################################## EXECUTED ONCE AT THE END OF THE GAME #######################################################
@@ -19,12 +19,22 @@ import heapq as h
 
 # Previously developed functions
 from dijkstra_A import dijkstra 
+from tsp_A import held_karp
+from shortest_paths import RouteCache
+from tutorial import ActionPlan
+from profiling import Profiler, span, print_report
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
 #####################################################################################################################################################
 
-# [TODO] It is good practice to keep all your constants and global variables in an easily identifiable section
+"""
+    Mettre PROFILAGE à True pour mesurer le temps passé dans chaque étape du preprocessing, affiché à la fin de la partie.
+    TRACER_ALLOCATIONS mesure en plus la mémoire allouée dans chaque étape, mais ralentit le programme.
+"""
+
+PROFILAGE = False
+TRACER_ALLOCATIONS = False
 
 #####################################################################################################################################################
 ##################################################################### FUNCTIONS #####################################################################
@@ -67,29 +77,33 @@ def meilleur_concentration(cheese_list,maze_width,maze_height):
         return cheese_LS
     if maxi==cornerLN:
         return cheese_LN
-def greedy(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheeseG:List[int],maze_width:int):
+def greedy(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheeseG:List[int],maze_width:int,route_cache:Optional[RouteCache]=None):
+  if route_cache is None:
+    route_cache=RouteCache(maze,maze_width)
   villesG=[start_vertex]+cheeseG
-  distance_matrixG=[[[dijkstra(ville1,maze,[ville2],maze_width),ville1,ville2] for ville2 in villesG] for ville1 in villesG]
-  print(distance_matrixG[2][3][0][0])
+  distance_matrixG=route_cache.get_distance_matrix(villesG)
   cheese_n=0
   chemin=[]
   cheese_capt=[]
   def mini(M,source,visited):
-    mini=M[source][0][0][0]
-    indice=0
-    for i in range(len(M)):
-       if M[source][i][2] in visited:
+    # La diagonale de la matrice est nulle : la source et la position de départ sont ignorées
+    mini=float("inf")
+    indice=None
+    for i in range(1,len(M)):
+       if i==source or villesG[i] in visited or villesG[i]==start_vertex:
           continue
        else:
-         if mini>M[source][i][0][0]:
-           mini=M[source][i][0][0]
+         if mini>M[source][i]:
+           mini=M[source][i]
            indice=i
     return indice
   source=0
   while cheese_n<10:
      indice=mini(distance_matrixG,source,cheese_capt)
-     chemin+=distance_matrixG[source][indice][0][1]
-     cheese_capt.append(distance_matrixG[source][indice][2])
+     if indice is None:
+       break
+     chemin+=route_cache.get_actions(villesG[source],villesG[indice])
+     cheese_capt.append(villesG[indice])
      cheese_n+=1
      source=indice
   return chemin ,cheese_capt
@@ -97,58 +111,6 @@ def greedy(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]]
 
 
 
-def held_karp(start_vertex:int,maze:Union[numpy.ndarray, Dict[int, Dict[int, int]]],cheese:List[int],maze_width:int):
-  """
-  Renvoie le chemin le plus court à suivre pour ramasser des fromages dans un labyrinthe en complexité en O(n^2 * 2^n).
-  """
-  villes=[start_vertex]+cheese
-  distance_matrixG=[[dijkstra(ville1,maze,[ville2],maze_width) for ville2 in villes] for ville1 in villes]
-  n=len(cheese)+1
-  def combinaisons(n:int,k:int):
-    """
-    Renvoie les parties à k éléments de [2,n]
-    """
-    def aux(element, combinaison_actuelle):
-        if len(combinaison_actuelle)==k:
-            combinaisons.append(tuple(combinaison_actuelle))
-            return
-        for i in range(element, n+1):
-            combinaison_actuelle.append(i)
-            aux(i+1,combinaison_actuelle)
-            combinaison_actuelle.pop()
-    combinaisons=[]
-    aux(1,[])
-    return combinaisons
-
-  assert n>=2
-
-  if n==2 :
-    return dijkstra(start_vertex,maze,cheese,maze_width)
-    
-  else :
-    villes=[start_vertex]+cheese
-    distance_matrix=[[dijkstra(ville1,maze,[ville2],maze_width) for ville2 in villes] for ville1 in villes]
-    g={((k,),k):(dijkstra(start_vertex,maze,[villes[k]],maze_width)[0],[0]) for k in range(1,n)}
-    for s in range(2,n):
-      for S in combinaisons(n-1,s):
-        for k in range(s):
-          mini,ordre=float("inf"),None
-          n_S=S[:k]+S[k+1:]
-          for m in n_S:
-            if mini>g[n_S,m][0]+distance_matrix[m][S[k]][0]:
-              mini=g[n_S,m][0]+distance_matrix[m][S[k]][0]
-              ordre=g[n_S,m][1]+[m]
-          g[(S,S[k])]=mini,ordre
-    mini,ordre=float("inf"),None
-    for k in range(1,n):
-      if mini>g[tuple(range(1,n)),k][0]:
-        mini=g[tuple(range(1,n)),k][0]
-        ordre=g[tuple(range(1,n)),k][1]+[k]
-    directions=[]
-    for k in range(n-1):
-      directions+=distance_matrix[ordre[k]][ordre[k+1]][1]
-    return directions
-            
 #####################################################################################################################################################
 ##################################################### EXECUTED ONCE AT THE BEGINNING OF THE GAME ####################################################
 #####################################################################################################################################################
@@ -182,17 +144,26 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
         Out:
             * None.
     """
-    cheeseG=meilleur_concentration(cheese,maze_width,maze_height)
-    memory.move=[]
-    memory.move,visited=greedy(player_locations[name],maze,cheeseG,maze_width)
-    #calcul des fromages restants
-    cheese_restant=[]
-    for i in cheese:
-      if i in visited:
-        continue
-      else:
-        cheese_restant.append(i)
-    memory.move+=held_karp(visited[-1],maze,cheese_restant,maze_width)
+    memory.profiler=Profiler(PROFILAGE,TRACER_ALLOCATIONS)
+    with span("preprocessing",memory):
+      with span("meilleur_concentration"):
+        cheeseG=meilleur_concentration(cheese,maze_width,maze_height)
+      memory.route_cache=RouteCache(maze,maze_width)
+      with span("greedy"):
+        move,visited=greedy(player_locations[name],maze,cheeseG,maze_width,memory.route_cache)
+      memory.move=ActionPlan(move)
+      #calcul des fromages restants
+      cheese_restant=[]
+      for i in cheese:
+        if i in visited:
+          continue
+        else:
+          cheese_restant.append(i)
+      #greedy peut avoir déjà tout ramassé (peu de fromages), ou rien si aucun n'est accessible
+      if cheese_restant!=[]:
+        depart=visited[-1] if visited!=[] else player_locations[name]
+        with span("held_karp"):
+          memory.move.extend(held_karp(depart,maze,cheese_restant,maze_width,memory.route_cache))
 
 
     
@@ -232,7 +203,8 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
         Out:
             * action: One of the possible actions, as given in possible_actions.
     """
-    return memory.move.pop(0)
+    with span("turn",memory):
+      return memory.move.popleft()
 
 #####################################################################################################################################################
 ######################################################## EXECUTED ONCE AT THE END OF THE GAME #######################################################
@@ -271,8 +243,7 @@ def postprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int,
             * None.
     """
 
-    # [TODO] Write your postprocessing code here
-    pass
+    print_report(memory,"Profilage de "+name)
     
 #####################################################################################################################################################
 ######################################################################## GO! ########################################################################
@@ -18,8 +18,9 @@ from pyrat import *
 import heapq as h
 
 # Previously developed functions
-from tutorial import get_neighbors, locations_to_action, get_vertices, get_weight
+from tutorial import get_neighbors, locations_to_action, get_vertices, get_weight, ActionPlan
 from dijkstra_A import dijkstra
+from tsp_A import held_karp
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
@@ -31,53 +32,6 @@ from dijkstra_A import dijkstra
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
 
-def held_karp(start_vertex,maze,cheese,maze_width):
-    
-  n=len(cheese)+1
-
-  def combinaisons(n, k):
-    def aux(element, combinaison_actuelle):
-        if len(combinaison_actuelle)==k:
-            combinaisons.append(tuple(combinaison_actuelle))
-            return
-        for i in range(element, n+1):
-            combinaison_actuelle.append(i)
-            aux(i+1,combinaison_actuelle)
-            combinaison_actuelle.pop()
-    combinaisons=[]
-    aux(1,[])
-    return combinaisons
-
-  assert n>=2
-
-  if n==2 :
-    return dijkstra(start_vertex,maze,cheese,maze_width)
-    
-  else :
-    villes=[start_vertex]+cheese
-    distance_matrix=[[dijkstra(ville1,maze,[ville2],maze_width) for ville2 in villes] for ville1 in villes]
-    g={((k,),k):(dijkstra(start_vertex,maze,[villes[k]],maze_width)[0],[0]) for k in range(1,n)}
-    for s in range(2,n):
-      for S in combinaisons(n-1,s):
-        for k in range(s):
-          mini,ordre=float("inf"),None
-          n_S=S[:k]+S[k+1:]
-          for m in n_S:
-            if mini>g[n_S,m][0]+distance_matrix[m][S[k]][0]:
-              mini=g[n_S,m][0]+distance_matrix[m][S[k]][0]
-              ordre=g[n_S,m][1]+[m]
-          g[(S,S[k])]=mini,ordre
-    mini,ordre=float("inf"),None
-    for k in range(1,n):
-      if mini>g[tuple(range(1,n)),k][0]:
-        mini=g[tuple(range(1,n)),k][0]
-        ordre=g[tuple(range(1,n)),k][1]+[k]
-    directions=[]
-    for k in range(n-1):
-      directions+=distance_matrix[ordre[k]][ordre[k+1]][1]
-    print(distance_matrix)
-    return directions
-            
 #####################################################################################################################################################
 ##################################################### EXECUTED ONCE AT THE BEGINNING OF THE GAME ####################################################
 #####################################################################################################################################################
@@ -112,7 +66,7 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
             * None.
     """
     global routing_table
-    routing_table=held_karp(player_locations[name],maze,cheese,maze_width)
+    routing_table=ActionPlan(held_karp(player_locations[name],maze,cheese,maze_width))
     
 #####################################################################################################################################################
 ######################################################### EXECUTED AT EACH TURN OF THE GAME #########################################################
@@ -151,7 +105,7 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
             * action: One of the possible actions, as given in possible_actions.
     """
 
-    return routing_table.pop(0)
+    return routing_table.popleft()
 
 #####################################################################################################################################################
 ######################################################## EXECUTED ONCE AT THE END OF THE GAME #######################################################
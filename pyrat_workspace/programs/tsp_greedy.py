@@ -3,13 +3,8 @@
 #####################################################################################################################################################
 
 """
-    This program is an empty PyRat program file.
-    It serves as a template for your own programs.
-    Some [TODO] comments below are here to help you keep your code organized.
-    Note that all PyRat programs must have a "turn" function.
-    Functions "preprocessing" and "postprocessing" are optional.
-    Please check the documentation of these functions for more info on their purpose.
-    Also, the PyRat website gives more detailed explanation on how a PyRat game works.
+    This program approximates the TSP with the nearest neighbor heuristic, going each time to the closest remaining piece of cheese.
+    Paths are built on the distance matrix of the meta-graph, starting with every possible first piece of cheese, and the shortest one is kept.
     https://formations.imt-atlantique.fr/pyrat
 """
 
@@ -24,7 +19,9 @@ from pyrat import *
 import heapq
 
 # Previously developed functions
-from tutorial import get_neighbors, locations_to_action , get_vertices
+from tutorial import get_neighbors, locations_to_action , get_vertices, get_weight, compile_maze, ActionPlan
+from dijkstra import traversal, dijkstra
+from tsp import graph_to_metagraph
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
@@ -36,7 +33,71 @@ from tutorial import get_neighbors, locations_to_action , get_vertices
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
 
-# [TODO] It is good practice to keep all developed functions in an easily identifiable section
+def nearest_neighbor_order ( distance_matrix: Union[numpy.ndarray, List[List[int]]],
+                             multi_start:     bool = False
+                           ) ->               List[int]:
+
+    """
+        Function to build a path visiting all vertices of a complete graph, going each time to the closest unvisited vertex.
+        Visited vertices are marked in a boolean array, so that each step is a single argmin over the distances from the current vertex.
+        With multi_start, one path is built for each possible second vertex, all at once (one row per path), and the shortest is returned.
+        In:
+            * distance_matrix: Distances between the vertices, where the path starts at vertex 0.
+            * multi_start:     Indicates if all second vertices should be tried, instead of only the closest one.
+        Out:
+            * order: Order in which vertices are visited, starting with 0.
+    """
+
+    # Trivial cases
+    distance_matrix = numpy.asarray(distance_matrix, dtype=numpy.int64)
+    nb_vertices = len(distance_matrix)
+    if nb_vertices <= 2:
+        return list(range(nb_vertices))
+
+    # Initialize the paths with their first two vertices
+    second_vertices = numpy.arange(1, nb_vertices) if multi_start else numpy.array([numpy.argmin(distance_matrix[0, 1:]) + 1])
+    paths = numpy.arange(len(second_vertices))
+    orders = numpy.zeros((len(second_vertices), nb_vertices), dtype=numpy.int64)
+    orders[:, 1] = second_vertices
+    lengths = distance_matrix[0, second_vertices].copy()
+    visited = numpy.zeros((len(second_vertices), nb_vertices), dtype=bool)
+    visited[:, 0] = True
+    visited[paths, second_vertices] = True
+
+    # Extend all paths at once with their closest unvisited vertex
+    unreachable = numpy.iinfo(numpy.int64).max
+    for step in range(2, nb_vertices):
+        distances = numpy.where(visited, unreachable, distance_matrix[orders[:, step - 1]])
+        closest = distances.argmin(axis=1)
+        lengths += distances[paths, closest]
+        visited[paths, closest] = True
+        orders[:, step] = closest
+
+    # Keep the shortest path
+    return orders[lengths.argmin()].tolist()
+
+#####################################################################################################################################################
+
+def tsp ( complete_graph: Dict[int, Dict[int, int]],
+          source:         int
+        ) ->              List[int]:
+
+    """
+        Function to approximate the TSP on a meta-graph with the nearest neighbor heuristic, trying all first vertices (see "nearest_neighbor_order").
+        In:
+            * complete_graph: Complete graph of the vertices of interest, as returned by "graph_to_metagraph".
+            * source:         Vertex used to start the path.
+        Out:
+            * path: Path starting at the source and visiting all vertices of the meta-graph.
+    """
+
+    # Index the vertices, with the source first
+    vertices = [source] + [vertex for vertex in complete_graph if vertex != source]
+    distance_matrix = [[complete_graph[u][v] if u != v else 0 for v in vertices] for u in vertices]
+
+    # Solve and convert back to vertices
+    order = nearest_neighbor_order(distance_matrix, True)
+    return [vertices[i] for i in order]
 
 #####################################################################################################################################################
 ##################################################### EXECUTED ONCE AT THE BEGINNING OF THE GAME ####################################################
@@ -58,88 +119,6 @@ def list_opposite(l):
     rep.reverse()
     return rep
 
-def traversal ( source:             int,
-            graph:              Union[numpy.ndarray, Dict[int, Dict[int, int]]],
-            create_structure:   Callable[[], Any],
-            push_to_structure:  Callable[[Any, Tuple[int, int, int]], None],
-            pop_from_structure: Callable[[Any], Tuple[int, int, int]],
-            #vertice_list : List[int]
-            ) ->                  Tuple[Dict[int, int], Dict[int, Union[None, int]]]:
-    """
-    Traversal function that explores a graph from a given vertex.
-    This function is generic and can be used for most graph traversal.
-    To adapt it to a specific traversal, you need to provide the adapted functions to create, push and pop elements from the structure.
-    In:
-        * source:             Vertex from which to start the traversal.
-        * graph:              Graph on which to perform the traversal.
-        * create_structure:   Function that creates an empty structure to use in the traversal.
-        * push_to_structure:  Function that adds an element of type B to the structure of type A.
-        * pop_from_structure: Function that returns and removes an element of type B from the structure of type A.
-    Out:
-        * distances_to_explored_vertices: Dictionary where keys are explored vertices and associated values are the lengths of the paths to reach them.
-        * routing_table:                  Routing table to allow reconstructing the paths obtained by the traversal.
-    """
-    distances_to_explored_vertices={source:0}
-    routing_table={source:None}
-    visited=create_structure()
-    push_to_structure(visited,(source,0))
-    while len(visited)>0:
-        pop, distance_to_source =pop_from_structure(visited)
-        for vertice in get_neighbors(pop,graph):
-            if vertice in distances_to_explored_vertices:
-                if distances_to_explored_vertices[vertice] > distance_to_source+graph[vertice][pop] :
-                    distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                    push_to_structure(visited,(vertice,distances_to_explored_vertices[vertice]))
-                    routing_table[vertice]=pop
-                    """if pop in cheese_list:
-                        if len(cheese_list)==1:
-                            print("pop",pop,"vertice",vertice)
-                            distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                            routing_table[vertice]=pop
-                            return distances_to_explored_vertices , routing_table
-                        else :  
-                            cheese_list.remove(pop)"""
-            else :
-                distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                push_to_structure(visited,(vertice,distances_to_explored_vertices[vertice]))
-                routing_table[vertice]=pop
-                """if pop in cheese_list:
-                        if len(cheese_list)==1:
-                            print("pop",pop,"vertice",vertice)
-                            distances_to_explored_vertices[vertice]=distance_to_source+graph[vertice][pop]
-                            routing_table[vertice]=pop
-                            return distances_to_explored_vertices , routing_table
-                        else :  
-                            cheese_list.remove(pop)"""
-    return distances_to_explored_vertices , routing_table
-def dijkstra ( source: int,
-                graph:  Union[numpy.ndarray, Dict[int, Dict[int, int]]],
-                #vertice_list : List[int]
-                ) ->      Tuple[Dict[int, int], Dict[int, Union[None, int]]]:
-    """
-        Dijkstra's algorithm is a particular traversal where vertices are explored in an order that is proportional to the distance to the source vertex.
-        In:
-            * source: Vertex from which to start the traversal.
-            * graph:  Graph on which to perform the traversal.
-        Out:
-            * distances_to_explored_vertices: Dictionary where keys are explored vertices and associated values are the lengths of the paths to reach them.
-            * routing_table:                  Routing table to allow reconstructing the paths obtained by the traversal.
-    """
-    
-    # Function to create an empty priority queue
-    def _create_structure ():
-        return []
-    # Function to add an element to the priority queue
-    def _push_to_structure (structure, element):
-        heapq.heappush(structure, element)
-    # Function to extract an element from the priority queue
-    def _pop_from_structure (structure):
-        return heapq.heappop(structure)
-    
-    # Perform the traversal
-    distances_to_explored_vertices, routing_table = traversal(source, graph, _create_structure, _push_to_structure, _pop_from_structure)
-    return distances_to_explored_vertices, routing_table
-
 def find_route ( routing_table: Dict[int, Union[None, int]],
                     source:        int,
                     target:        int
@@ -219,85 +198,22 @@ def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, i
         return actions
     
 
-    def graph_to_metagraph ( graph:    Union[numpy.ndarray, Dict[int, Dict[int, int]]],
-                            vertices: List[int]
-                        ) ->        Tuple[numpy.ndarray, Dict[int, Dict[int, Union[None, int]]]]:
-        #changer matrice en dictionaire de dictionaire pour stocker le numéro des sommets avec la longueur 
-        """
-            Function to build a complete graph out of locations of interest in a given graph.
-            In:
-                * graph:    Graph containing the vertices of interest.
-                * vertices: Vertices to use in the complete graph.
-                * vertices_list[0] is the player location
-            Out:
-                * complete_graph: Complete graph of the vertices of interest.
-                * routing_tables: Dictionary of routing tables obtained by traversals used to build the complete graph.
-        """
-        #initilisation de meta_graph et route avec les valeurs des sommets des frommages 
-        meta_graph={i:{} for i in vertice_list}
-        route={i:{} for i in vertice_list}
-        for source in range(len(vertice_list)) :
-            distances_to_explored_vertices, routing_table=dijkstra(vertice_list[source],maze)
-            for cheesei in range(source+1,len(vertice_list)):
-                meta_graph[vertice_list[source]][vertice_list[cheesei]]=distances_to_explored_vertices[vertice_list[cheesei]]
-                route[vertice_list[source]][vertice_list[cheesei]]=locations_to_actions(find_route(routing_table,vertice_list[source],vertice_list[cheesei]),maze_width)
-        #symétrisation du meta_graph , route
-        for i in meta_graph:
-            for j in meta_graph[i]:
-                meta_graph[j][i]=meta_graph[i][j]
-        for i in route:
-            for j in route[i]:
-                if route[i][j] == None:
-                    continue
-                else:
-                    temp=route[i][j]
-                    route[j][i]=list_opposite(temp)
-        return meta_graph,route
         
     
-    def tsp ( complete_graph: numpy.ndarray,
-            source:         int
-        ) ->              Tuple[List[int], int]:
-        """
-            Function to solve the TSP using an exhaustive search.
-            In:
-                * complete_graph: Complete graph of the vertices of interest.
-                * source:         Vertex used to start the search.
-            Out:
-                * path : the shortest path to perform the meta_graph
-        """
-        visited=[source]
-        path=[source]
-        current_vertex=source
-        while len(path) != len(complete_graph) :
-            # If there are still vertices to visit, we explore unexplored neighbors
-            min=1e9 #consideré comme infini
-            min_neighbor=None
-            for neighbor in complete_graph[current_vertex] :
-                if neighbor not in visited :
-                    if min>complete_graph[current_vertex][neighbor]:
-                        min_neighbor=neighbor
-                        print("min voisin",min_neighbor,)
-            visited.append(min_neighbor)
-            current_vertex=min_neighbor
-            path.append(min_neighbor)                    
-        return path
     #list of action
     def meta_graph_to_action(path,route):
         """
             Function to find the path .
             In:
                 * path: list of vertices of meta_graph .
-                * route: list of action to travel across different vertices in the meta_graph
+                * route: route store giving the actions to travel across different vertices in the meta_graph
         """
-        actions=[]
+        actions=ActionPlan()
         for i in range(len(path)-1):
-            actions=actions+route[path[i]][path[i+1]]
+            actions.extend(route.get_actions(path[i],path[i+1]))
         memory.actions=actions
-    meta_graph , route = graph_to_metagraph(maze,vertice_list)
+    meta_graph , route = graph_to_metagraph(maze,vertice_list,maze_width)
     meta_graph_to_action(tsp(meta_graph,vertice_list[0]),route)
-    print("vertice_list",vertice_list)
-    print("tsp",tsp(meta_graph,vertice_list[0]))
     pass
     
 #####################################################################################################################################################
@@ -338,7 +254,7 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
     """
 
     # [TODO] Write your turn code here and do not forget to return a possible action
-    action = memory.actions.pop(0)
+    action = memory.actions.popleft()
     return action
 
 #####################################################################################################################################################
@@ -3,13 +3,9 @@
 #####################################################################################################################################################
 
 """
-    This program is an empty PyRat program file.
-    It serves as a template for your own programs.
-    Some [TODO] comments below are here to help you keep your code organized.
-    Note that all PyRat programs must have a "turn" function.
-    Functions "preprocessing" and "postprocessing" are optional.
-    Please check the documentation of these functions for more info on their purpose.
-    Also, the PyRat website gives more detailed explanation on how a PyRat game works.
+    This program solves the TSP with a local search that stops when the preprocessing time is about to run out.
+    It starts from the best nearest neighbor path, improves it with 2-opt and Or-opt moves, and perturbs it to escape local optima while time remains.
+    The best path found so far is always available, so that the rat has a plan even with many pieces of cheese.
     https://formations.imt-atlantique.fr/pyrat
 """
 
@@ -21,20 +17,241 @@
 from pyrat import *
 
 # External imports 
-# [TODO] Put all your standard imports (numpy, random, os, heapq...) here
+import time
+import random
 
 # Previously developed functions
-from tsp import graph_to_metagraph 
+from shortest_paths import RouteCache
+from tutorial import ActionPlan
+from tsp_greedy import nearest_neighbor_order
 
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
 #####################################################################################################################################################
 
-# [TODO] It is good practice to keep all your constants and global variables in an easily identifiable section
+"""
+    Time given by PyRat to the preprocessing function, in seconds (option "preprocessing_time" of the game).
+    Scripts that play games with another time should give it to the preprocessing function (see "get_preprocessing_function" in "match_engine.py").
+"""
+
+PREPROCESSING_TIME = 3.0
+
+#####################################################################################################################################################
+
+"""
+    Fraction of the preprocessing time that is not used by the search, to have time to build the actions and return before the deadline.
+"""
+
+TIME_MARGIN = 0.1
+
+#####################################################################################################################################################
+
+"""
+    Maximum length of the segments moved by Or-opt moves.
+"""
+
+MAX_SEGMENT_LENGTH = 3
 
 #####################################################################################################################################################
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
+
+def path_length ( distance_matrix: numpy.ndarray,
+                  order:           List[int]
+                ) ->               int:
+
+    """
+        Function to compute the length of a path in a distance matrix.
+        In:
+            * distance_matrix: Distances between the vertices.
+            * order:           Order in which vertices are visited.
+        Out:
+            * length: Length of the path.
+    """
+
+    # Sum of consecutive distances
+    return int(sum([distance_matrix[order[i]][order[i + 1]] for i in range(len(order) - 1)]))
+
+#####################################################################################################################################################
+
+def two_opt_pass ( distance_matrix: numpy.ndarray,
+                   order:           List[int]
+                 ) ->               bool:
+
+    """
+        Function to apply improving 2-opt moves to a path, i.e., to reverse segments when it makes the path shorter.
+        The length variations of all moves are computed at once with NumPy, and the best move is applied until none improves the path.
+        The path is open and starts at its first vertex, which is never moved.
+        Distances are assumed symmetric, as in PyRat mazes, so that reversing a segment does not change its length.
+        In:
+            * distance_matrix: Distances between the vertices.
+            * order:           Order in which vertices are visited, modified in place.
+        Out:
+            * improved: True if at least one move was applied.
+    """
+
+    # Nothing to reverse in short paths
+    improved = False
+    nb_vertices = len(order)
+    if nb_vertices < 3:
+        return improved
+
+    # Reversing order[i:j+1] replaces edges (order[i-1], order[i]) and (order[j], order[j+1]) with (order[i-1], order[j]) and (order[i], order[j+1])
+    # Rows and columns of the variations below correspond to i and j, both in [1, nb_vertices-1]
+    can_reverse = numpy.triu(numpy.ones((nb_vertices - 1, nb_vertices - 1), dtype=bool), 1)
+    while True:
+        vertices = numpy.asarray(order)
+        edges = distance_matrix[vertices[:-1], vertices[1:]]
+        delta = distance_matrix[vertices[:-1, None], vertices[None, 1:]] - edges[:, None]
+        delta[:, :-1] += distance_matrix[vertices[1:, None], vertices[None, 2:]] - edges[None, 1:]
+        delta[~can_reverse] = 0
+
+        # Apply the best move
+        i, j = numpy.unravel_index(numpy.argmin(delta), delta.shape)
+        if delta[i, j] >= 0:
+            return improved
+        order[i + 1:j + 2] = order[i + 1:j + 2][::-1]
+        improved = True
+
+#####################################################################################################################################################
+
+def or_opt_pass ( distance_matrix: numpy.ndarray,
+                  order:           List[int]
+                ) ->               bool:
+
+    """
+        Function to apply improving Or-opt moves to a path, i.e., to move short segments elsewhere in the path when it makes the path shorter.
+        For each segment length, the length variations of all (segment, insertion point) pairs are computed at once with NumPy.
+        The best move is applied until none improves the path.
+        The path is open and starts at its first vertex, which is never moved.
+        In:
+            * distance_matrix: Distances between the vertices.
+            * order:           Order in which vertices are visited, modified in place.
+        Out:
+            * improved: True if at least one move was applied.
+    """
+
+    # Try all segments of limited length
+    improved = False
+    nb_vertices = len(order)
+    for segment_length in range(1, min(MAX_SEGMENT_LENGTH, nb_vertices - 2) + 1):
+
+        # Segments order[i:i+segment_length] can be inserted after order[k] for k not in [i-1, i+segment_length-1], i.e., not next to them
+        # Rows correspond to i in [1, nb_vertices-segment_length], and columns to k in [0, nb_vertices-1]
+        nb_segments = nb_vertices - segment_length
+        rows, columns = numpy.indices((nb_segments, nb_vertices))
+        can_insert = (columns < rows) | (columns > rows + segment_length)
+        while True:
+            vertices = numpy.asarray(order)
+            edges = distance_matrix[vertices[:-1], vertices[1:]]
+            firsts = vertices[1:nb_segments + 1]
+            lasts = vertices[segment_length:]
+
+            # Gain obtained by removing each segment, and reconnecting its neighbors
+            removal_gain = edges[:nb_segments].copy()
+            removal_gain[:-1] += edges[segment_length:] - distance_matrix[vertices[:nb_segments - 1], vertices[segment_length + 1:]]
+
+            # Cost of inserting each segment after each vertex
+            insertion_cost = distance_matrix[vertices[None, :], firsts[:, None]]
+            insertion_cost[:, :-1] += distance_matrix[lasts[:, None], vertices[None, 1:]] - edges[None, :]
+            delta = numpy.where(can_insert, insertion_cost - removal_gain[:, None], 0)
+
+            # Apply the best move
+            i, k = numpy.unravel_index(numpy.argmin(delta), delta.shape)
+            if delta[i, k] >= 0:
+                break
+            segment = order[i + 1:i + 1 + segment_length]
+            rest = order[:i + 1] + order[i + 1 + segment_length:]
+            insertion_index = k + 1 if k < i + 1 else k + 1 - segment_length
+            order[:] = rest[:insertion_index] + segment + rest[insertion_index:]
+            improved = True
+    return improved
+
+#####################################################################################################################################################
+
+def local_search ( distance_matrix: numpy.ndarray,
+                   order:           List[int],
+                   deadline:        Optional[float] = None
+                 ) ->               List[int]:
+
+    """
+        Function to improve a path with 2-opt and Or-opt moves until none of them applies, or until the deadline is reached.
+        In:
+            * distance_matrix: Distances between the vertices.
+            * order:           Initial order in which vertices are visited, starting with the vertex that should stay first.
+            * deadline:        Time (as given by time.time()) after which no new pass is started, or None to stop only at a local optimum.
+        Out:
+            * order: Improved order.
+    """
+
+    # Alternate passes while they improve the path
+    distance_matrix = numpy.asarray(distance_matrix)
+    order = list(order)
+    while deadline is None or time.time() < deadline:
+        improved = two_opt_pass(distance_matrix, order)
+        improved = or_opt_pass(distance_matrix, order) or improved
+        if not improved:
+            break
+    return order
+
+#####################################################################################################################################################
+
+def perturb ( order:     List[int],
+              generator: random.Random
+            ) ->         List[int]:
+
+    """
+        Function to perturb a path with a double bridge move, i.e., to swap two consecutive segments of the path.
+        Such a move cannot be undone by a single 2-opt or Or-opt move, which allows the local search to escape local optima.
+        In:
+            * order:     Order in which vertices are visited, starting with the vertex that should stay first.
+            * generator: Random number generator.
+        Out:
+            * perturbed_order: Perturbed order.
+    """
+
+    # Paths that are too short are not perturbed
+    if len(order) < 4:
+        return list(order)
+
+    # Swap segments order[i:j] and order[j:k]
+    i, j, k = sorted(generator.sample(range(1, len(order) + 1), 3))
+    return order[:i] + order[j:k] + order[i:j] + order[k:]
+
+#####################################################################################################################################################
+
+def anytime_order ( distance_matrix: numpy.ndarray,
+                    deadline:        float,
+                    random_seed:     int = 0
+                  ) ->               List[int]:
+
+    """
+        Function to find a short path starting at vertex 0 and visiting all vertices, using all the time available until the deadline.
+        The search starts from a nearest neighbor path improved by local search, then repeatedly perturbs the best path and improves it again.
+        The best path found is returned when the deadline is reached, which is the nearest neighbor path if the deadline has already passed.
+        In:
+            * distance_matrix: Distances between the vertices.
+            * deadline:        Time (as given by time.time()) at which the search should return.
+            * random_seed:     Seed of the perturbations.
+        Out:
+            * order: Order in which vertices are visited in the best path found, starting with 0.
+    """
+
+    # Initial solution
+    best_order = local_search(distance_matrix, nearest_neighbor_order(distance_matrix, True), deadline)
+    best_length = path_length(distance_matrix, best_order)
+
+    # Iterated local search
+    generator = random.Random(random_seed)
+    while len(best_order) >= 4 and time.time() < deadline:
+        order = local_search(distance_matrix, perturb(best_order, generator), deadline)
+        length = path_length(distance_matrix, order)
+        if length < best_length:
+            best_order, best_length = order, length
+    return best_order
+
+#####################################################################################################################################################
+
 def meilleur_concentration(cheese_list,maze_width,maze_height):
     """
     on découpe la map en 4 pour trouver la partie avec le plus de fromage
@@ -73,42 +290,49 @@ def meilleur_concentration(cheese_list,maze_width,maze_height):
 ##################################################### EXECUTED ONCE AT THE BEGINNING OF THE GAME ####################################################
 #####################################################################################################################################################
 
-def preprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
-                    maze_width:       int,
-                    maze_height:      int,
-                    name:             str,
-                    teams:            Dict[str, List[str]],
-                    player_locations: Dict[str, int],
-                    cheese:           List[int],
-                    possible_actions: List[str],
-                    memory:           threading.local
-                  ) ->                None:
-    vertice_list=[player_locations[name]]
-    temp=cheese.copy()
-    vertice_list=vertice_list+temp
+def preprocessing ( maze:               Union[numpy.ndarray, Dict[int, Dict[int, int]]],
+                    maze_width:         int,
+                    maze_height:        int,
+                    name:               str,
+                    teams:              Dict[str, List[str]],
+                    player_locations:   Dict[str, int],
+                    cheese:             List[int],
+                    possible_actions:   List[str],
+                    memory:             threading.local,
+                    preprocessing_time: float = PREPROCESSING_TIME
+                  ) ->                  None:
     """
         This function is called once at the beginning of the game.
         It is typically given more time than the turn function, to perform complex computations.
         Store the results of these computations in the provided memory to reuse them later during turns.
         To do so, you can crete entries in the memory dictionary as memory.my_key = my_value.
         In:
-            * maze:             Map of the maze, as data type described by PyRat's "maze_representation" option.
-            * maze_width:       Width of the maze in number of cells.
-            * maze_height:      Height of the maze in number of cells.
-            * name:             Name of the player controlled by this function.
-            * teams:            Recap of the teams of players.
-            * player_locations: Locations for all players in the game.
-            * cheese:           List of available pieces of cheese in the maze.
-            * possible_actions: List of possible actions.
-            * memory:           Local memory to share information between preprocessing, turn and postprocessing.
+            * maze:               Map of the maze, as data type described by PyRat's "maze_representation" option.
+            * maze_width:         Width of the maze in number of cells.
+            * maze_height:        Height of the maze in number of cells.
+            * name:               Name of the player controlled by this function.
+            * teams:              Recap of the teams of players.
+            * player_locations:   Locations for all players in the game.
+            * cheese:             List of available pieces of cheese in the maze.
+            * possible_actions:   List of possible actions.
+            * memory:             Local memory to share information between preprocessing, turn and postprocessing.
+            * preprocessing_time: Time given to the preprocessing function, in seconds.
         Out:
             * None.
     """
 
-    # [TODO] Write your preprocessing code here
-    print(meilleur_concentration(cheese,maze_width,maze_height))
-    print(graph_to_metagraph(maze,vertice_list))
-    pass
+    # The deadline includes the time needed to compute the distances
+    deadline = time.time() + preprocessing_time * (1 - TIME_MARGIN)
+
+    # Find a path in the meta-graph
+    vertices = [player_locations[name]] + cheese
+    memory.route_cache = RouteCache(maze, maze_width)
+    order = anytime_order(memory.route_cache.get_distance_matrix(vertices), deadline)
+
+    # Convert it to actions
+    memory.actions = ActionPlan()
+    for i in range(len(order) - 1):
+        memory.actions.extend(memory.route_cache.get_actions(vertices[order[i]], vertices[order[i + 1]]))
     
 #####################################################################################################################################################
 ######################################################### EXECUTED AT EACH TURN OF THE GAME #########################################################
@@ -147,8 +371,8 @@ def turn ( maze:             Union[numpy.ndarray, Dict[int, Dict[int, int]]],
             * action: One of the possible actions, as given in possible_actions.
     """
 
-    # [TODO] Write your turn code here and do not forget to return a possible action
-    action = possible_actions[0]
+    # Follow the plan
+    action = memory.actions.popleft()
     return action
 
 #####################################################################################################################################################
@@ -198,13 +422,14 @@ def postprocessing ( maze:             Union[numpy.ndarray, Dict[int, Dict[int,
 if __name__ == "__main__":
 
     # Map the functions to the character
-    players = [{"name": "Template", "preprocessing_function": preprocessing, "turn_function": turn, "postprocessing_function": postprocessing}]
+    players = [{"name": "TSP locaux", "preprocessing_function": preprocessing, "turn_function": turn, "postprocessing_function": postprocessing}]
 
     # Customize the game elements
-    config = {"maze_width": 15,
-              "maze_height": 11,
-              "mud_percentage": 0.0,
-              "nb_cheese": 11}
+    config = {"maze_width": 31,
+              "maze_height": 29,
+              "mud_percentage": 20.0,
+              "nb_cheese": 41,
+              "preprocessing_time": PREPROCESSING_TIME}
 
     # Start the game
     game = PyRat(players, **config)
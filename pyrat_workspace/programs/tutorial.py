@@ -14,6 +14,9 @@
 # Import PyRat
 from pyrat import *
 
+# External imports
+import collections
+
 #####################################################################################################################################################
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
@@ -30,10 +33,14 @@ def get_vertices ( graph: Union[numpy.ndarray, Dict[int, Dict[int, int]]]
             * vertices: List of vertices in the graph.
     """
     
+    # If the maze has been compiled during preprocessing
+    if isinstance(graph, CompiledMaze):
+        vertices = graph.get_vertices()
+
     # If "maze_representation" option is set to "dictionary"
-    if isinstance(graph, dict):
+    elif isinstance(graph, dict):
         vertices = list(graph.keys())
-    
+
     # If "maze_representation" option is set to "matrix"
     elif isinstance(graph, numpy.ndarray):
         vertices = list(graph.sum(axis=0).nonzero()[0])
@@ -63,8 +70,12 @@ def get_neighbors ( vertex: int,
             * neighbors: List of vertices that are adjacent to the vertex in the graph.
     """
     
+    # If the maze has been compiled during preprocessing
+    if isinstance(graph, CompiledMaze):
+        neighbors = graph.get_neighbors(vertex)
+
     # If "maze_representation" option is set to "dictionary"
-    if isinstance(graph, dict):
+    elif isinstance(graph, dict):
         neighbors = list(graph[vertex].keys())
 
     # If "maze_representation" option is set to "matrix"
@@ -98,8 +109,12 @@ def get_weight ( source: int,
             * weight: Weight of the corresponding edge in the graph.
     """
     
+    # If the maze has been compiled during preprocessing
+    if isinstance(graph, CompiledMaze):
+        weight = graph.get_weight(source, target)
+
     # If "maze_representation" option is set to "dictionary"
-    if isinstance(graph, dict):
+    elif isinstance(graph, dict):
         weight = graph[source][target]
     
     # If "maze_representation" option is set to "matrix"
@@ -115,6 +130,149 @@ def get_weight ( source: int,
 
 #####################################################################################################################################################
 
+class CompiledMaze:
+
+    """
+        Maze compiled once as compressed sparse rows, to be built during preprocessing and reused during the whole game.
+        The neighbors of vertex v are targets[offsets[v]:offsets[v + 1]], and the matching edge weights are at the same indices in weights.
+        It exposes the same get_vertices/get_neighbors/get_weight functions as the PyRat representations, without type checks nor full-row scans.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:  Self,
+                   graph: Union[numpy.ndarray, Dict[int, Dict[int, int]]]
+                 ) ->     Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:  Reference to the current object.
+                * graph: Maze to compile, as data type described by PyRat's "maze_representation" option.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # If "maze_representation" option is set to "dictionary"
+        if isinstance(graph, dict):
+            nb_vertices = max(graph.keys()) + 1 if len(graph) > 0 else 0
+            degrees = numpy.zeros(nb_vertices, dtype=numpy.int32)
+            targets = []
+            weights = []
+            for vertex in sorted(graph.keys()):
+                degrees[vertex] = len(graph[vertex])
+                targets += list(graph[vertex].keys())
+                weights += list(graph[vertex].values())
+            self.vertices = list(graph.keys())
+
+        # If "maze_representation" option is set to "matrix"
+        elif isinstance(graph, numpy.ndarray):
+            nb_vertices = graph.shape[0]
+            rows, targets = graph.nonzero()
+            weights = graph[rows, targets]
+            degrees = numpy.bincount(rows, minlength=nb_vertices)
+            self.vertices = graph.sum(axis=0).nonzero()[0].tolist()
+
+        # Unhandled data type
+        else:
+            raise Exception("Unhandled graph type", type(graph))
+
+        # Compressed sparse rows
+        self.nb_vertices = nb_vertices
+        self.offsets = numpy.zeros(nb_vertices + 1, dtype=numpy.int32)
+        self.offsets[1:] = numpy.cumsum(degrees)
+        self.targets = numpy.array(targets, dtype=numpy.int32)
+        self.weights = numpy.array(weights, dtype=numpy.int32)
+
+        # Per-vertex rows as Python lists, since indexing NumPy arrays element by element is slow in traversals
+        offsets = self.offsets.tolist()
+        all_targets = self.targets.tolist()
+        all_weights = self.weights.tolist()
+        self.neighbors = [all_targets[offsets[vertex]:offsets[vertex + 1]] for vertex in range(nb_vertices)]
+        self.neighbor_weights = [all_weights[offsets[vertex]:offsets[vertex + 1]] for vertex in range(nb_vertices)]
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def get_vertices ( self: Self
+                     ) ->    List[int]:
+
+        """
+            Fuction to return the list of all vertices in the maze, except those with no neighbors.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * vertices: List of vertices in the maze.
+        """
+
+        # A copy is returned so that callers can modify it
+        return list(self.vertices)
+
+    #############################################################################################################################################
+
+    def get_neighbors ( self:   Self,
+                        vertex: int
+                      ) ->      List[int]:
+
+        """
+            Fuction to return the list of neighbors of a given vertex.
+            In:
+                * self:   Reference to the current object.
+                * vertex: Vertex for which to compute the neighborhood.
+            Out:
+                * neighbors: List of vertices that are adjacent to the vertex in the maze.
+        """
+
+        # A copy is returned so that callers can modify it
+        return list(self.neighbors[vertex])
+
+    #############################################################################################################################################
+
+    def get_weight ( self:   Self,
+                     source: int,
+                     target: int
+                   ) ->      int:
+
+        """
+            Fuction to return the weight of the edge in the maze from the source to the target.
+            In:
+                * self:   Reference to the current object.
+                * source: Source vertex in the maze.
+                * target: Target vertex, assumed to be a neighbor of the source vertex in the maze.
+            Out:
+                * weight: Weight of the corresponding edge in the maze.
+        """
+
+        # Rows have at most 4 elements, so a linear search is enough
+        row = self.neighbors[source]
+        if target not in row:
+            raise Exception("No edge from", source, "to", target)
+        return self.neighbor_weights[source][row.index(target)]
+
+#####################################################################################################################################################
+
+def compile_maze ( graph: Union[CompiledMaze, numpy.ndarray, Dict[int, Dict[int, int]]]
+                 ) ->     CompiledMaze:
+
+    """
+        Function to compile a maze into compressed sparse rows, once at the beginning of the game.
+        Compiling an already compiled maze returns it unchanged.
+        In:
+            * graph: Maze to compile.
+        Out:
+            * compiled_maze: Compiled version of the maze, usable with get_vertices, get_neighbors and get_weight.
+    """
+
+    # Nothing to do if already compiled
+    if isinstance(graph, CompiledMaze):
+        return graph
+    return CompiledMaze(graph)
+
+#####################################################################################################################################################
+
 def locations_to_action ( source:     int,
                           target:     int,
                           maze_width: int
@@ -152,6 +310,105 @@ def locations_to_action ( source:     int,
         raise Exception("Impossible move from", source, "to", target)
     return action
 
+#####################################################################################################################################################
+
+class ActionPlan:
+
+    """
+        Queue of actions planned by a player, to be built during preprocessing and consumed one action per turn.
+        It is backed by a double-ended queue, so that taking the next action takes constant time whatever the length of the plan.
+        Plans are assembled by extending them with route segments, which takes a time linear in the number of added actions.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:    Self,
+                   actions: Iterable[str] = ()
+                 ) ->       Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:    Reference to the current object.
+                * actions: Initial actions of the plan.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # Actions still to perform, in order
+        self.actions = collections.deque(actions)
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def __len__ ( self: Self
+                ) ->    int:
+
+        """
+            This function returns the number of actions remaining in the plan.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * length: Number of remaining actions.
+        """
+
+        # Length of the queue
+        return len(self.actions)
+
+    #############################################################################################################################################
+
+    def extend ( self:    Self,
+                 actions: Iterable[str]
+               ) ->       None:
+
+        """
+            This function adds a sequence of actions (e.g., the route to the next piece of cheese) at the end of the plan.
+            The given sequence is copied, so that it can be shared with a cache of routes.
+            In:
+                * self:    Reference to the current object.
+                * actions: Actions to add.
+            Out:
+                * None.
+        """
+
+        # Bulk addition
+        self.actions.extend(actions)
+
+    #############################################################################################################################################
+
+    def popleft ( self: Self
+                ) ->    str:
+
+        """
+            This function removes and returns the next action of the plan, from the front like "collections.deque.popleft".
+            In:
+                * self: Reference to the current object.
+            Out:
+                * action: Next action to perform.
+        """
+
+        # Take from the front of the queue
+        return self.actions.popleft()
+
+    #############################################################################################################################################
+
+    def clear ( self: Self
+              ) ->    None:
+
+        """
+            This function removes all remaining actions, e.g., before replanning.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Empty the queue
+        self.actions.clear()
+
 #####################################################################################################################################################
 ##################################################### EXECUTED ONCE AT THE BEGINNING OF THE GAME ####################################################
 #####################################################################################################################################################
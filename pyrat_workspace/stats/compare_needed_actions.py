@@ -21,18 +21,14 @@ import matplotlib.pyplot as pyplot
 import scipy.stats
 import os
 import numpy
-import types
-import tqdm
+import math
 
 # Previously developed functions
 sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
-import tsp_A
-import tsp2
-import dijkstra_A
-import random_3
-import tsp
-import tsp_A_locaux
-import greedy_2
+from match_engine import load_program, get_preprocessing_function, iterate_cached_jobs
+from result_cache import ResultCache
+from streaming_stats import StreamingStatistics
+
 #####################################################################################################################################################
 ############################################################### CONSTANTS & VARIABLES ###############################################################
 #####################################################################################################################################################
@@ -58,33 +54,56 @@ NB_CHEESE = 15
 
 #####################################################################################################################################################
 
+"""
+    Time given to programs that search until the end of the preprocessing time (see "get_preprocessing_function" in "match_engine.py").
+    Games are synchronous, so they are not limited by the game's preprocessing time, and would wait for the one they assume otherwise.
+"""
+
+SEARCH_TIME = 0.1
+
+#####################################################################################################################################################
+
 """
     List here the programs you want to compare.
 """
 
-PROGRAMS = [greedy_2]
+PROGRAMS = ["greedy_2"]
+
+#####################################################################################################################################################
+
+"""
+    Number of processes playing games in parallel.
+    Results do not depend on this number, set it to 1 to play all games in the current process.
+"""
+
+NB_WORKERS = os.cpu_count()
+
+#####################################################################################################################################################
+
+"""
+    File in which to keep the summaries of played games between runs.
+    Games are played again only if the code of a program or the configuration changes.
+"""
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), "needed_actions_cache.sqlite")
 
 #####################################################################################################################################################
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
 
-def run_one_game ( seed:    int,
-                   program: types.ModuleType
-                 ) ->       Dict[str, Any]:
+def make_config ( seed: int
+                ) ->   Dict[str, Any]:
 
     """
-        This function runs a PyRat game, with no GUI, for a given seed and program, and returns the obtained stats.
+        This function returns the configuration of the game played with a given seed.
+        It is also used to identify games in the cache of results.
         In:
-            * seed:    Random seed used to create the game.
-            * program: Program to use in that game.
+            * seed: Random seed used to create the game.
         Out:
-            * stats: Statistics output at the end of the game.
+            * config: Configuration given to PyRat.
     """
-    
-    # Map the functions to the character
-    players = [{"name": program.__name__, "preprocessing_function": program.preprocessing if "preprocessing" in dir(program) else None, "turn_function": program.turn}]
 
-    # Customize the game elements
+    # Customize the game elements
     config = {"maze_width": MAZE_WIDTH,
               "maze_height": MAZE_HEIGHT,
               "mud_percentage": MUD_PERCENTAGE,
@@ -96,11 +115,38 @@ def run_one_game ( seed:    int,
               "turn_time": 0.0,
               "synchronous": True,
               "random_seed": seed}
-        
+    return config
+
+#####################################################################################################################################################
+
+def run_one_game ( seed:         int,
+                   program_name: str
+                 ) ->            Dict[str, Any]:
+
+    """
+        This function runs a PyRat game, with no GUI, for a given seed and program, and returns a summary of the obtained stats.
+        The program is given by its name, so that the game can be played in another process (see "match_engine.py").
+        Turn durations are summarized in the worker, so that only a bounded amount of data is sent back and cached.
+        In:
+            * seed:         Random seed used to create the game.
+            * program_name: Name of the program to use in that game.
+        Out:
+            * summary: Number of turns, preprocessing duration, and aggregated turn durations of the game.
+    """
+    
+    # Map the functions to the character
+    program = load_program(program_name)
+    players = [{"name": program_name, "preprocessing_function": get_preprocessing_function(program, SEARCH_TIME), "turn_function": program.turn}]
+
     # Start the game
-    game = PyRat(players, **config)
+    game = PyRat(players, **make_config(seed))
     stats = game.start()
-    return stats
+
+    # Summarize the stats we are interested in
+    summary = {"turns": stats["turns"],
+               "preprocessing_duration": stats["players"][program_name]["preprocessing_duration"],
+               "turn_durations": StreamingStatistics(stats["players"][program_name]["turn_durations"])}
+    return summary
     
 #####################################################################################################################################################
 ######################################################################## GO! ########################################################################
@@ -108,23 +154,28 @@ def run_one_game ( seed:    int,
 
 if __name__ == "__main__":
 
-    # Run multiple games for each player
-    results = {program.__name__: {"turns": [], "preprocessing_duration": [], "turn_durations": []} for program in PROGRAMS}
-    for program in tqdm.tqdm(PROGRAMS, desc="Program", position=0, leave=False):
-        for seed in tqdm.tqdm(range(NB_GAMES), desc="Game", position=1, leave=False):
-        
-            # Here we are interested in the number of turns needed to complete the game, as well as the time it takes 
-            stats = run_one_game(seed, program)
-            results[program.__name__]["turns"].append(stats["turns"])
-            results[program.__name__]["preprocessing_duration"].append(stats["players"][program.__name__]["preprocessing_duration"])
-            results[program.__name__]["turn_durations"] += stats["players"][program.__name__]["turn_durations"]
+    # Run multiple games for each player, in parallel, unless already played with the same code
+    cache = ResultCache(CACHE_FILE, __file__)
+    jobs = [(seed, program) for program in PROGRAMS for seed in range(NB_GAMES)]
+    keys = [cache.make_key([program], make_config(seed)) for seed, program in jobs]
+
+    # Here we are interested in the number of turns needed to complete the game, as well as the time it takes
+    # Summaries are merged one by one in the order of the jobs, so that results do not depend on the order in which games finish
+    results = {program: {"turns": [], "preprocessing_duration": StreamingStatistics(), "turn_durations": StreamingStatistics()} for program in PROGRAMS}
+    for (seed, program), summary in zip(jobs, iterate_cached_jobs(run_one_game, jobs, keys, cache, NB_WORKERS)):
+        results[program]["turns"].append(summary["turns"])
+        results[program]["preprocessing_duration"].add(summary["preprocessing_duration"])
+        results[program]["turn_durations"].merge(summary["turn_durations"])
+    cache.close()
 
     # Show results briefly
     print("#" * 20)
     print("#  Quick analysis  #")
     print("#" * 20)
     for program in PROGRAMS:
-        print("Program", program.__name__, "requires on average", numpy.mean(results[program.__name__]["turns"]), "actions, with an average preprocessing duration of", numpy.mean(results[program.__name__]["preprocessing_duration"]), "seconds, and an average turn duration of", numpy.mean(results[program.__name__]["turn_durations"]), "seconds")
+        turn_durations = results[program]["turn_durations"]
+        print("Program", program, "requires on average", numpy.mean(results[program]["turns"]), "actions, with an average preprocessing duration of", results[program]["preprocessing_duration"].mean, "seconds, and an average turn duration of", turn_durations.mean, "seconds")
+        print("    Turn durations (seconds): std", math.sqrt(turn_durations.get_variance()), "- p50", turn_durations.get_quantile(0.5), "- p95", turn_durations.get_quantile(0.95), "- p99", turn_durations.get_quantile(0.99), "- max", turn_durations.max)
 
     # More formal statistics to check if these curves are statistically significant
     print("#" * 21)
@@ -132,15 +183,15 @@ if __name__ == "__main__":
     print("#" * 21)
     for i in range(len(PROGRAMS)):
         for j in range(i + 1, len(PROGRAMS)):
-            test_result = scipy.stats.mannwhitneyu(results[PROGRAMS[i].__name__]["turns"], results[PROGRAMS[j].__name__]["turns"], alternative="two-sided")
-            print("Mann-Whitney U test between turns of program", PROGRAMS[i].__name__, "and of program", PROGRAMS[j].__name__, ":", test_result)
+            test_result = scipy.stats.mannwhitneyu(results[PROGRAMS[i]]["turns"], results[PROGRAMS[j]]["turns"], alternative="two-sided")
+            print("Mann-Whitney U test between turns of program", PROGRAMS[i], "and of program", PROGRAMS[j], ":", test_result)
 
     # Visualization of histograms of numbers of turns taken per program
-    max_turn = max([max(results[program.__name__]["turns"]) for program in PROGRAMS])
+    max_turn = max([max(results[program]["turns"]) for program in PROGRAMS])
     pyplot.figure(figsize=(20, 10))
     for program in PROGRAMS:
-        games_completed_per_turn = [0] + [sum(map(lambda turn: turn <= i, results[program.__name__]["turns"])) * 100 / NB_GAMES for i in range(max_turn)]
-        pyplot.plot(range(max_turn + 1), games_completed_per_turn, label=program.__name__)
+        games_completed_per_turn = [0] + [sum(map(lambda turn: turn <= i, results[program]["turns"])) * 100 / NB_GAMES for i in range(max_turn)]
+        pyplot.plot(range(max_turn + 1), games_completed_per_turn, label=program)
     pyplot.title("Comparison of turns needed to complete all %d games" % (NB_GAMES))
     pyplot.xlabel("Turns")
     pyplot.ylabel("% of games completed")
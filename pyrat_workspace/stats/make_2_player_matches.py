@@ -3,8 +3,10 @@
 #####################################################################################################################################################
 
 """
-    This script makes multiple games between two programs, and compares the obtained scores.
-    It performs two analyses: a quick average analysis and a formal 1 sample T test.
+    This script makes a round-robin tournament between programs, and compares the obtained scores.
+    Each pair of programs plays multiple games, each seed being played twice with the programs swapping sides.
+    For each pair, it performs two analyses: a quick average analysis and a formal 1 sample T test.
+    Finally, it ranks the programs and writes a table of results.
 """
 
 #####################################################################################################################################################
@@ -20,20 +22,19 @@ import matplotlib.pyplot as pyplot
 import scipy.stats
 import os
 import numpy
-import types
-import tqdm
+import csv
 
 # Previously developed functions
 sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
-import random_1 as program_1
-import random_2 as program_2
+from match_engine import load_program, get_preprocessing_function, iterate_cached_jobs
+from result_cache import ResultCache
 
 #####################################################################################################################################################
 ############################################################### VARIABLES & CONSTANTS ###############################################################
 #####################################################################################################################################################
 
 """
-    Number of games to make.
+    Number of seeds to play per pair of programs (each seed is played twice, once per side).
 """
 
 NB_GAMES = 500
@@ -54,30 +55,66 @@ TURN_TIME = 0.0
 PREPROCESSING_TIME = 0.0
 SYNCHRONOUS = True
 
+#####################################################################################################################################################
+
+"""
+    Time given to programs that search until the end of the preprocessing time (see "get_preprocessing_function" in "match_engine.py").
+    Games are synchronous, so they are not limited by the game's preprocessing time, and would wait for the one they assume otherwise.
+"""
+
+SEARCH_TIME = 0.1
+
+#####################################################################################################################################################
+
+"""
+    Programs taking part in the tournament, given by their names in the "programs" directory.
+"""
+
+PROGRAMS = ["random_1", "random_2"]
+
+#####################################################################################################################################################
+
+"""
+    Number of processes playing games in parallel.
+    Results do not depend on this number, set it to 1 to play all games in the current process.
+"""
+
+NB_WORKERS = os.cpu_count()
+
+#####################################################################################################################################################
+
+"""
+    File in which to keep the stats of played games between runs.
+    Games are played again only if the code of a program or the configuration changes.
+"""
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), "results_cache.sqlite")
+
+#####################################################################################################################################################
+
+"""
+    File in which to write the table of results.
+"""
+
+RESULTS_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), "tournament_results.csv")
+
 #####################################################################################################################################################
 ##################################################################### FUNCTIONS #####################################################################
 #####################################################################################################################################################
 
-def run_one_game ( seed:      int,
-                   program_1: types.ModuleType,
-                   program_2: types.ModuleType
-                 ) ->         Dict[str, Any]:
+def make_config ( seed: int
+                ) ->   Dict[str, Any]:
 
     """
-        This function runs a PyRat game, with no GUI, for a given seed and program, and returns the obtained stats.
+        This function returns the configuration of the game played with a given seed.
+        It is also used to identify games in the cache of results.
         In:
-            * seed:      Random seed used to create the game.
-            * program_1: First program to use in that game.
-            * program_2: Second program to use in that game.
+            * seed: Random seed used to create the game.
         Out:
-            * stats: Statistics output at the end of the game.
+            * config: Configuration given to PyRat.
     """
 
-    # Map the functions to the character
-    players = [{"name": program_1.__name__, "team": "1", "preprocessing_function": program_1.preprocessing if "preprocessing" in dir(program_1) else None, "turn_function": program_1.turn},
-               {"name": program_2.__name__, "team": "2", "preprocessing_function": program_2.preprocessing if "preprocessing" in dir(program_2) else None, "turn_function": program_2.turn}]
-
-    # Customize the game elements
+    # Customize the game elements
     config = {"maze_width": MAZE_WIDTH,
               "maze_height": MAZE_HEIGHT,
               "mud_percentage": MUD_PERCENTAGE,
@@ -87,13 +124,107 @@ def run_one_game ( seed:      int,
               "render_mode": "no_rendering",
               "preprocessing_time": PREPROCESSING_TIME,
               "turn_time": TURN_TIME,
-              "synchronous": True,
+              "synchronous": SYNCHRONOUS,
               "random_seed": seed}
-        
+    return config
+
+#####################################################################################################################################################
+
+def run_one_game ( seed:           int,
+                   program_1_name: str,
+                   program_2_name: str
+                 ) ->              Dict[str, Any]:
+
+    """
+        This function runs a PyRat game, with no GUI, for a given seed and programs, and returns the obtained stats.
+        Programs are given by their names, so that the game can be played in another process (see "match_engine.py").
+        In:
+            * seed:           Random seed used to create the game.
+            * program_1_name: Name of the first program to use in that game.
+            * program_2_name: Name of the second program to use in that game.
+        Out:
+            * stats: Statistics output at the end of the game.
+    """
+
+    # Map the functions to the character
+    program_1 = load_program(program_1_name)
+    program_2 = load_program(program_2_name)
+    players = [{"name": program_1.__name__, "team": "1", "preprocessing_function": get_preprocessing_function(program_1, SEARCH_TIME), "turn_function": program_1.turn},
+               {"name": program_2.__name__, "team": "2", "preprocessing_function": get_preprocessing_function(program_2, SEARCH_TIME), "turn_function": program_2.turn}]
+
     # Start the game
-    game = PyRat(players, **config)
+    game = PyRat(players, **make_config(seed))
     stats = game.start()
     return stats
+
+#####################################################################################################################################################
+
+def make_tournament_jobs ( programs: List[str],
+                           nb_games: int
+                         ) ->        List[Tuple[int, str, str]]:
+
+    """
+        This function lists the games of a round-robin tournament.
+        Every pair of programs plays every seed twice, once with each program as the first player.
+        In:
+            * programs: Names of the programs taking part in the tournament.
+            * nb_games: Number of seeds per pair.
+        Out:
+            * jobs: Arguments of "run_one_game" for every game, as (seed, first program, second program).
+    """
+
+    # All pairs, seeds and sides
+    jobs = []
+    for i in range(len(programs)):
+        for j in range(i + 1, len(programs)):
+            for seed in range(nb_games):
+                jobs.append((seed, programs[i], programs[j]))
+                jobs.append((seed, programs[j], programs[i]))
+    return jobs
+
+#####################################################################################################################################################
+
+def summarize_tournament ( jobs:    List[Tuple[int, str, str]],
+                           margins: List[int]
+                         ) ->       Tuple[Dict[Tuple[str, str], List[int]], List[Dict[str, Any]]]:
+
+    """
+        This function gathers the results of a tournament per pair of programs, and ranks the programs.
+        A victory gives 3 points, and a draw gives 1 point.
+        In:
+            * jobs:    Games of the tournament, as returned by "make_tournament_jobs".
+            * margins: Score of the first program minus score of the second program, for each game.
+        Out:
+            * pair_margins: Dictionary associating to each pair (a, b) of programs, as ordered in the tournament, the margins of a against b.
+            * table:        Rows of the table of results, sorted by decreasing points.
+    """
+
+    # Margins per pair, from the point of view of the first program of the pair
+    pair_margins = {}
+    for (seed, program_1, program_2), margin in zip(jobs, margins):
+        if (program_2, program_1) in pair_margins:
+            pair_margins[(program_2, program_1)].append(-margin)
+        else:
+            pair_margins.setdefault((program_1, program_2), []).append(margin)
+
+    # Results per program
+    rows = {}
+    for (seed, program_1, program_2), margin in zip(jobs, margins):
+        for program, program_margin in [(program_1, margin), (program_2, -margin)]:
+            row = rows.setdefault(program, {"program": program, "games": 0, "wins": 0, "draws": 0, "losses": 0, "points": 0, "total_margin": 0})
+            row["games"] += 1
+            row["wins"] += int(program_margin > 0)
+            row["draws"] += int(program_margin == 0)
+            row["losses"] += int(program_margin < 0)
+            row["points"] += 3 * int(program_margin > 0) + int(program_margin == 0)
+            row["total_margin"] += program_margin
+
+    # Rank the programs, with the average margin to break ties
+    table = []
+    for row in rows.values():
+        table.append({"program": row["program"], "games": row["games"], "wins": row["wins"], "draws": row["draws"], "losses": row["losses"], "points": row["points"], "average_margin": round(row["total_margin"] / row["games"], 3)})
+    table.sort(key=lambda row: (-row["points"], -row["average_margin"], row["program"]))
+    return pair_margins, table
     
 #####################################################################################################################################################
 ######################################################################## GO! ########################################################################
@@ -101,42 +232,63 @@ def run_one_game ( seed:      int,
 
 if __name__ == "__main__":
 
-    # Run multiple games
-    results = []
-    for seed in tqdm.tqdm(range(NB_GAMES), desc="Game", position=0, leave=False):
-        
-        # Store score difference as result
-        stats = run_one_game(seed, program_1, program_2)
-        results.append(int(stats["players"][program_1.__name__]["score"] - stats["players"][program_2.__name__]["score"]))
-        
-    # Show results briefly
-    print("#" * 20)
-    print("#  Quick analysis  #")
-    print("#" * 20)
-    rat_victories = [score for score in results if score > 0]
-    python_victories = [score for score in results if score < 0]
-    nb_draws = NB_GAMES - len(rat_victories) - len(python_victories)
-    print(program_1.__name__, "(rat)   <-  ", len(rat_victories), "  -  ", nb_draws, "  -  ", len(python_victories), "  ->  ", program_2.__name__, "(python)")
-    print("Average score difference when %s wins:" % program_1.__name__, numpy.mean(rat_victories) if len(rat_victories) > 0 else "n/a")
-    print("Average score difference when %s wins:" % program_2.__name__, numpy.mean(numpy.abs(python_victories))if len(python_victories) > 0 else "n/a")
-
-    # More formal statistics to check if the mean of the distribution is significantly different from 0
-    print("#" * 21)
-    print("#  Formal analysis  #")
-    print("#" * 21)
-    test_result = scipy.stats.ttest_1samp(results, popmean=0.0)
-    print("One sample T-test of the distribution:", test_result)
-
-    # Visualization of histograms of score differences
-    bins = range(min(results), max(results) + 2)
-    pyplot.figure(figsize=(20, 10))
-    pyplot.hist(results, ec="black", bins=bins)
-    pyplot.title("Analysis of the game results in terms of victory margin")
-    pyplot.xlabel("score(%s) - score(%s)" % (program_1.__name__, program_2.__name__))
-    pyplot.xticks([b + 0.5 for b in bins], labels=bins)
-    pyplot.xlim(bins[0], bins[-1])
-    pyplot.ylabel("Number of games")
-    pyplot.show()
+    # Run all games of the tournament, in parallel, unless already played with the same code
+    cache = ResultCache(CACHE_FILE, __file__)
+    jobs = make_tournament_jobs(PROGRAMS, NB_GAMES)
+    keys = [cache.make_key([program_1, program_2], make_config(seed)) for seed, program_1, program_2 in jobs]
+
+    # Store score differences as results
+    results = [int(stats["players"][program_1]["score"] - stats["players"][program_2]["score"]) for (seed, program_1, program_2), stats in zip(jobs, iterate_cached_jobs(run_one_game, jobs, keys, cache, NB_WORKERS))]
+    cache.close()
+    pair_margins, table = summarize_tournament(jobs, results)
+
+    # Analyze each pair
+    for (program_1, program_2), margins in pair_margins.items():
+
+        # Show results briefly
+        print("#" * 20)
+        print("#  Quick analysis  #")
+        print("#" * 20)
+        victories_1 = [score for score in margins if score > 0]
+        victories_2 = [score for score in margins if score < 0]
+        nb_draws = len(margins) - len(victories_1) - len(victories_2)
+        print(program_1, "  <-  ", len(victories_1), "  -  ", nb_draws, "  -  ", len(victories_2), "  ->  ", program_2)
+        print("Average score difference when %s wins:" % program_1, numpy.mean(victories_1) if len(victories_1) > 0 else "n/a")
+        print("Average score difference when %s wins:" % program_2, numpy.mean(numpy.abs(victories_2)) if len(victories_2) > 0 else "n/a")
+
+        # More formal statistics to check if the mean of the distribution is significantly different from 0
+        print("#" * 21)
+        print("#  Formal analysis  #")
+        print("#" * 21)
+        test_result = scipy.stats.ttest_1samp(margins, popmean=0.0)
+        print("One sample T-test of the distribution:", test_result)
+
+    # Rank the programs and save the table
+    print("#" * 16)
+    print("#  Tournament  #")
+    print("#" * 16)
+    columns = ["program", "games", "wins", "draws", "losses", "points", "average_margin"]
+    print("%-20s %6s %6s %6s %6s %7s %15s" % tuple(columns))
+    for row in table:
+        print("%-20s %6d %6d %6d %6d %7d %15.3f" % tuple([row[column] for column in columns]))
+    with open(RESULTS_FILE, "w", newline="") as results_file:
+        writer = csv.DictWriter(results_file, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(table)
+    print("Table of results written to", RESULTS_FILE)
+
+    # Visualization of histograms of score differences, when only two programs are compared
+    if len(pair_margins) == 1:
+        (program_1, program_2), margins = list(pair_margins.items())[0]
+        bins = range(min(margins), max(margins) + 2)
+        pyplot.figure(figsize=(20, 10))
+        pyplot.hist(margins, ec="black", bins=bins)
+        pyplot.title("Analysis of the game results in terms of victory margin")
+        pyplot.xlabel("score(%s) - score(%s)" % (program_1, program_2))
+        pyplot.xticks([b + 0.5 for b in bins], labels=bins)
+        pyplot.xlim(bins[0], bins[-1])
+        pyplot.ylabel("Number of games")
+        pyplot.show()
     
 #####################################################################################################################################################
 #####################################################################################################################################################
\ No newline at end of file
@@ -0,0 +1,168 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program gathers tools shared by the statistics scripts to run many games.
+    Games are described as jobs, i.e., tuples of arguments given to a function that plays one game, and are distributed over a pool of processes.
+    Modules cannot be sent to other processes, so jobs should refer to programs by their module name (see "load_program").
+    Results can be kept between runs in a cache (see "result_cache.py"), so that only missing games are played.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import sys
+import os
+import types
+import inspect
+import functools
+import importlib
+import concurrent.futures
+import tqdm
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from result_cache import ResultCache
+
+#####################################################################################################################################################
+##################################################################### FUNCTIONS #####################################################################
+#####################################################################################################################################################
+
+def load_program ( program_name: str
+                 ) ->            types.ModuleType:
+
+    """
+        Function to get the module of a program from its name, in the current process.
+        Modules are only imported once per process, so calling it for every game is cheap.
+        In:
+            * program_name: Name of the program, as found in the "programs" directory.
+        Out:
+            * program: Module of the program.
+    """
+
+    # Import the module, or get it from the already imported ones
+    return importlib.import_module(program_name)
+
+#####################################################################################################################################################
+
+def get_preprocessing_function ( program:            types.ModuleType,
+                                 preprocessing_time: float
+                               ) ->                  Optional[Callable[..., None]]:
+
+    """
+        Function to get the preprocessing function of a program, to give to PyRat.
+        Some programs search until the end of the preprocessing time (e.g., "tsp_locaux.py"), and take it as a "preprocessing_time" parameter.
+        For these programs, the time given here is used instead of the one they assume.
+        In:
+            * program:            Module of the program, as obtained with "load_program".
+            * preprocessing_time: Time given to the preprocessing function, in seconds.
+        Out:
+            * preprocessing_function: Preprocessing function of the program, or None if it has none.
+    """
+
+    # Some programs do not need preprocessing
+    if "preprocessing" not in dir(program):
+        return None
+
+    # Give the time to programs that use it
+    if "preprocessing_time" not in inspect.signature(program.preprocessing).parameters:
+        return program.preprocessing
+    return functools.update_wrapper(functools.partial(program.preprocessing, preprocessing_time=preprocessing_time), program.preprocessing)
+
+#####################################################################################################################################################
+
+def run_jobs ( function:    Callable[..., Any],
+               jobs:        List[Tuple[Any, ...]],
+               nb_workers:  int,
+               description: str = "Game",
+               on_result:   Optional[Callable[[int, Any], None]] = None
+             ) ->           Optional[List[Any]]:
+
+    """
+        Function to call a function on all jobs, in parallel over a pool of processes.
+        Results are shown in a progress bar as soon as they arrive, in any order, but are returned in the order of the jobs.
+        This way, anything computed from the returned list does not depend on the number of workers.
+        Only a few jobs per worker are submitted at a time, so that memory does not grow with the number of jobs.
+        In:
+            * function:    Function to call, defined at the top level of a module so that it can be sent to the workers.
+            * jobs:        Arguments to give to the function, one tuple per call.
+            * nb_workers:  Number of processes to use, or 1 to run all jobs in the current process.
+            * description: Description of the progress bar.
+            * on_result:   Function called in the current process with (i, result of jobs[i]) as soon as a result arrives, in which case results are not kept.
+        Out:
+            * results: Results of the function, where results[i] is obtained with jobs[i], or None if on_result is given.
+    """
+
+    # Results are either kept or given to the callback
+    results = [None] * len(jobs) if on_result is None else None
+    def _store (i, result):
+        if on_result is None:
+            results[i] = result
+        else:
+            on_result(i, result)
+
+    # Sequential version, easier to debug
+    progress_bar = tqdm.tqdm(total=len(jobs), desc=description, leave=False)
+    if nb_workers <= 1:
+        for i in range(len(jobs)):
+            _store(i, function(*jobs[i]))
+            progress_bar.update(1)
+        progress_bar.close()
+        return results
+
+    # Parallel version, where results are put back at the index of their job
+    with concurrent.futures.ProcessPoolExecutor(max_workers=nb_workers) as executor:
+        pending = {}
+        next_job = 0
+        while next_job < len(jobs) or len(pending) > 0:
+            while next_job < len(jobs) and len(pending) < 4 * nb_workers:
+                pending[executor.submit(function, *jobs[next_job])] = next_job
+                next_job += 1
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                _store(pending.pop(future), future.result())
+                progress_bar.update(1)
+    progress_bar.close()
+    return results
+
+#####################################################################################################################################################
+
+def iterate_cached_jobs ( function:    Callable[..., Any],
+                          jobs:        List[Tuple[Any, ...]],
+                          keys:        List[str],
+                          cache:       ResultCache,
+                          nb_workers:  int,
+                          description: str = "Game"
+                        ) ->           Iterator[Any]:
+
+    """
+        Function to get the results of all jobs, playing only those that are not already in the cache.
+        New results are stored in the cache as soon as they arrive, then all results are read back one by one in the order of the jobs.
+        This way, results can be aggregated without holding all of them in memory, and aggregates do not depend on the number of workers.
+        In:
+            * function:    Function to call, as in "run_jobs".
+            * jobs:        Arguments to give to the function, one tuple per call.
+            * keys:        Keys of the jobs in the cache, as built by "ResultCache.make_key".
+            * cache:       Cache of results.
+            * nb_workers:  Number of processes to use, as in "run_jobs".
+            * description: Description of the progress bar.
+        Out:
+            * results: Iterator over the results of the function, where the i-th result is obtained with jobs[i].
+    """
+
+    # Play missing jobs only, and store them as they arrive
+    missing = [i for i in range(len(jobs)) if keys[i] not in cache]
+    run_jobs(function, [jobs[i] for i in missing], nb_workers, description, lambda j, result: cache.put(keys[missing[j]], result))
+
+    # Everything is now in the cache
+    for key in keys:
+        yield cache.get(key)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
@@ -0,0 +1,228 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program defines a persistent cache of game statistics, shared by the statistics scripts.
+    Stats are stored in a SQLite file, keyed by a hash of the source code of the programs playing, and of the game configuration (including the seed).
+    The key also includes a hash of the statistics script storing the results, and of the files it imports (e.g., "streaming_stats.py"), since they decide what is stored.
+    This way, re-running a script only plays the games of programs whose code changed since the last run.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import sys
+import os
+import ast
+import json
+import pickle
+import sqlite3
+import hashlib
+
+#####################################################################################################################################################
+############################################################### CONSTANTS & VARIABLES ###############################################################
+#####################################################################################################################################################
+
+"""
+    Directory containing the programs.
+"""
+
+PROGRAMS_DIRECTORY = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs")
+
+#####################################################################################################################################################
+##################################################################### FUNCTIONS #####################################################################
+#####################################################################################################################################################
+
+def program_hash ( program_name:       str,
+                   programs_directory: str = PROGRAMS_DIRECTORY
+                 ) ->                  str:
+
+    """
+        Function to compute a hash of the source code of a program, including the programs it imports from the same directory.
+        This way, modifying a shared file (e.g., "tutorial.py") also invalidates the results of the programs using it.
+        In:
+            * program_name:       Name of the program, as found in the programs directory.
+            * programs_directory: Directory containing the programs.
+        Out:
+            * hash: Hexadecimal digest of the sources.
+    """
+
+    # Explore the imports of the program that are files of the directory
+    digest = hashlib.sha256()
+    to_explore = [program_name]
+    explored = set()
+    while len(to_explore) > 0:
+        name = to_explore.pop()
+        file_name = os.path.join(programs_directory, name + ".py")
+        if name in explored or not os.path.isfile(file_name):
+            continue
+        explored.add(name)
+        with open(file_name, "rb") as source_file:
+            source = source_file.read()
+        for node in ast.walk(ast.parse(source)):
+            if isinstance(node, ast.Import):
+                to_explore += [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module is not None:
+                to_explore.append(node.module)
+
+    # Hash the sources in a fixed order
+    for name in sorted(explored):
+        with open(os.path.join(programs_directory, name + ".py"), "rb") as source_file:
+            digest.update(name.encode() + b"\0" + source_file.read() + b"\0")
+    return digest.hexdigest()
+
+#####################################################################################################################################################
+
+class ResultCache:
+
+    """
+        Persistent cache of game statistics, stored in a SQLite file.
+        Keys are built with "make_key", and values are the stats dictionaries returned by PyRat at the end of a game, or summaries built from them.
+        The file is created if it does not exist, and results of previous runs are kept.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:        Self,
+                   file_name:   str,
+                   script_file: Optional[str] = None
+                 ) ->           Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:        Reference to the current object.
+                * file_name:   SQLite file in which to store the results.
+                * script_file: Script that produces the stored results (usually "__file__"), so that they are invalidated when it or the files it imports change.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # Open the database
+        self.connection = sqlite3.connect(file_name)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, stats BLOB NOT NULL)")
+        self.connection.commit()
+
+        # Program hashes are computed once per run
+        self.program_hashes = {}
+        self.script_hash = None
+        if script_file is not None:
+            script_directory, script_name = os.path.split(os.path.realpath(script_file))
+            self.script_hash = program_hash(os.path.splitext(script_name)[0], script_directory)
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def make_key ( self:          Self,
+                   program_names: List[str],
+                   config:        Dict[str, Any]
+                 ) ->             str:
+
+        """
+            This function builds the key of a game, from the programs playing it and its configuration.
+            The order of the programs matters, since it determines the sides.
+            In:
+                * self:          Reference to the current object.
+                * program_names: Names of the programs playing the game, in order.
+                * config:        Configuration of the game, as given to PyRat (including the random seed).
+            Out:
+                * key: Key of the game in the cache.
+        """
+
+        # Hash the programs only once
+        for program_name in program_names:
+            if program_name not in self.program_hashes:
+                self.program_hashes[program_name] = program_hash(program_name)
+
+        # Combine programs, configuration and script
+        description = {"programs": [[program_name, self.program_hashes[program_name]] for program_name in program_names], "config": config, "script": self.script_hash}
+        return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+    #############################################################################################################################################
+
+    def __contains__ ( self: Self,
+                       key:  str
+                     ) ->    bool:
+
+        """
+            This function indicates if the results of a game are in the cache.
+            In:
+                * self: Reference to the current object.
+                * key:  Key of the game.
+            Out:
+                * found: True if the game is in the cache.
+        """
+
+        # Look for the key
+        return self.connection.execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone() is not None
+
+    #############################################################################################################################################
+
+    def get ( self: Self,
+              key:  str
+            ) ->    Dict[str, Any]:
+
+        """
+            This function returns the stats of a game stored in the cache.
+            In:
+                * self: Reference to the current object.
+                * key:  Key of the game.
+            Out:
+                * stats: Stats of the game.
+        """
+
+        # Look for the key
+        row = self.connection.execute("SELECT stats FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return pickle.loads(row[0])
+
+    #############################################################################################################################################
+
+    def put ( self:  Self,
+              key:   str,
+              stats: Dict[str, Any]
+            ) ->     None:
+
+        """
+            This function stores the stats of a game in the cache, replacing previous stats with the same key.
+            Stats are written to the file immediately, so that they are kept if the script is interrupted.
+            In:
+                * self:  Reference to the current object.
+                * key:   Key of the game.
+                * stats: Stats of the game.
+            Out:
+                * None.
+        """
+
+        # Insert or replace
+        self.connection.execute("INSERT OR REPLACE INTO results (key, stats) VALUES (?, ?)", (key, pickle.dumps(stats)))
+        self.connection.commit()
+
+    #############################################################################################################################################
+
+    def close ( self: Self
+              ) ->    None:
+
+        """
+            This function closes the database.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Close the connection
+        self.connection.close()
+
+#####################################################################################################################################################
+#####################################################################################################################################################
@@ -0,0 +1,288 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program defines an online aggregator of statistics, used to summarize durations over many games without keeping all values.
+    Count, mean and variance are updated with Welford's algorithm, and quantiles are estimated with a logarithmic sketch (as in DDSketch).
+    Aggregators can be built in different processes and merged afterwards.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import math
+import numpy
+
+#####################################################################################################################################################
+############################################################### CONSTANTS & VARIABLES ###############################################################
+#####################################################################################################################################################
+
+"""
+    Relative accuracy of quantile estimates.
+    With 0.01, an estimated quantile is within 1% of a value that is actually at that rank.
+"""
+
+RELATIVE_ACCURACY = 0.01
+
+#####################################################################################################################################################
+
+"""
+    Values below this threshold are counted as zero by the quantile sketch.
+"""
+
+MIN_VALUE = 1e-9
+
+#####################################################################################################################################################
+
+"""
+    Maximum number of buckets in the quantile sketch.
+    When exceeded, the lowest buckets are merged, which only affects the accuracy of the lowest quantiles.
+"""
+
+MAX_NB_BUCKETS = 2048
+
+#####################################################################################################################################################
+##################################################################### FUNCTIONS #####################################################################
+#####################################################################################################################################################
+
+class StreamingStatistics:
+
+    """
+        Online aggregator of non-negative values (e.g., durations).
+        Memory only depends on the range of the values, not on their number.
+        Values are added one by one or by batches, and aggregators can be merged, e.g., when computed by different workers.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:   Self,
+                   values: Iterable[float] = ()
+                 ) ->      Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:   Reference to the current object.
+                * values: Initial values to aggregate.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # Moments
+        self.count = 0
+        self.mean = 0.0
+        self.sum_squared_deviations = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+        # Quantile sketch, where bucket i counts values in (gamma^(i - 1), gamma^i]
+        self.gamma = (1.0 + RELATIVE_ACCURACY) / (1.0 - RELATIVE_ACCURACY)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0
+
+        # Initial values
+        self.add_all(values)
+
+    #############################################################################################################################################
+    #                                                              PRIVATE METHODS                                                              #
+    #############################################################################################################################################
+
+    def _merge_moments ( self:                   Self,
+                         count:                  int,
+                         mean:                   float,
+                         sum_squared_deviations: float,
+                         minimum:                float,
+                         maximum:                float
+                       ) ->                      None:
+
+        """
+            This function merges the moments of another set of values in the current ones (Chan et al.'s formula).
+            In:
+                * self:                   Reference to the current object.
+                * count:                  Number of other values.
+                * mean:                   Mean of other values.
+                * sum_squared_deviations: Sum of squared deviations to the mean of other values.
+                * minimum:                Minimum of other values.
+                * maximum:                Maximum of other values.
+            Out:
+                * None.
+        """
+
+        # Nothing to merge
+        if count == 0:
+            return
+
+        # Combine
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.sum_squared_deviations += sum_squared_deviations + delta * delta * self.count * count / total
+        self.count = total
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+
+    #############################################################################################################################################
+
+    def _collapse_buckets ( self: Self
+                          ) ->    None:
+
+        """
+            This function merges the lowest buckets of the sketch until there are at most MAX_NB_BUCKETS buckets.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Merge into the lowest kept bucket
+        if len(self.buckets) > MAX_NB_BUCKETS:
+            indices = sorted(self.buckets.keys())
+            nb_to_collapse = len(indices) - MAX_NB_BUCKETS
+            for index in indices[:nb_to_collapse]:
+                self.buckets[indices[nb_to_collapse]] += self.buckets.pop(index)
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def add ( self:  Self,
+              value: float
+            ) ->     None:
+
+        """
+            This function adds a value to the aggregator (Welford's algorithm).
+            In:
+                * self:  Reference to the current object.
+                * value: Value to add.
+            Out:
+                * None.
+        """
+
+        # Moments
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.sum_squared_deviations += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        # Sketch
+        if value <= MIN_VALUE:
+            self.zero_count += 1
+        else:
+            index = math.ceil(math.log(value) / self.log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+            self._collapse_buckets()
+
+    #############################################################################################################################################
+
+    def add_all ( self:   Self,
+                  values: Iterable[float]
+                ) ->      None:
+
+        """
+            This function adds a batch of values to the aggregator, e.g., the turn durations of a game.
+            In:
+                * self:   Reference to the current object.
+                * values: Values to add.
+            Out:
+                * None.
+        """
+
+        # Nothing to add
+        values = numpy.asarray(list(values), dtype=float)
+        if values.size == 0:
+            return
+
+        # Moments of the batch
+        mean = float(values.mean())
+        self._merge_moments(values.size, mean, float(((values - mean) ** 2).sum()), float(values.min()), float(values.max()))
+
+        # Sketch
+        positive = values[values > MIN_VALUE]
+        self.zero_count += int(values.size - positive.size)
+        indices, counts = numpy.unique(numpy.ceil(numpy.log(positive) / self.log_gamma).astype(int), return_counts=True)
+        for index, count in zip(indices.tolist(), counts.tolist()):
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self._collapse_buckets()
+
+    #############################################################################################################################################
+
+    def merge ( self:  Self,
+                other: Self
+              ) ->     None:
+
+        """
+            This function adds all values aggregated by another aggregator to the current one.
+            In:
+                * self:  Reference to the current object.
+                * other: Aggregator to merge.
+            Out:
+                * None.
+        """
+
+        # Moments and sketch
+        self._merge_moments(other.count, other.mean, other.sum_squared_deviations, other.min, other.max)
+        self.zero_count += other.zero_count
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self._collapse_buckets()
+
+    #############################################################################################################################################
+
+    def get_variance ( self: Self
+                     ) ->    float:
+
+        """
+            This function returns the variance of the values, as numpy.var does.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * variance: Variance of the values, or NaN if there is none.
+        """
+
+        # Population variance
+        return self.sum_squared_deviations / self.count if self.count > 0 else math.nan
+
+    #############################################################################################################################################
+
+    def get_quantile ( self:     Self,
+                       quantile: float
+                     ) ->        float:
+
+        """
+            This function returns an estimate of a quantile of the values, with the relative accuracy of the sketch.
+            In:
+                * self:     Reference to the current object.
+                * quantile: Quantile to estimate, between 0 and 1 (e.g., 0.95 for the 95th percentile).
+            Out:
+                * value: Estimated value at that quantile, or NaN if there is none.
+        """
+
+        # Nothing to estimate
+        if self.count == 0:
+            return math.nan
+
+        # Find the bucket containing the rank
+        rank = quantile * (self.count - 1)
+        cumulated_count = self.zero_count
+        if rank < cumulated_count:
+            return max(self.min, 0.0)
+        for index in sorted(self.buckets.keys()):
+            cumulated_count += self.buckets[index]
+            if rank < cumulated_count:
+                estimate = 2.0 * self.gamma ** index / (self.gamma + 1.0)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+#####################################################################################################################################################
+#####################################################################################################################################################
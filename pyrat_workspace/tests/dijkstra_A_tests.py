@@ -0,0 +1,194 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "dijkstra_A.py".
+    Searches with and without A* are compared on small grids with mud.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import random
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from tutorial import get_weight
+from dijkstra_A import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsDijkstraA (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:     Self,
+                   *args:    Any,
+                   **kwargs: Any,
+                 ) ->        Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:   Reference to the current object.
+                * args:   Arguments of the parent constructor.
+                * kwargs: Keyword arguments of the parent constructor.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # Inherit from parent class
+        super(TestsDijkstraA, self).__init__(*args, **kwargs)
+
+        # Grid of 4x3 cells without walls, with mud between 1 and 2
+        self.maze_width = 4
+        self.maze = self._grid(4, 3, lambda vertex, neighbor: 5 if {vertex, neighbor} == {1, 2} else 1)
+
+    #############################################################################################################################################
+    #                                                              PRIVATE METHODS                                                              #
+    #############################################################################################################################################
+
+    def _grid ( self:        Self,
+                maze_width:  int,
+                maze_height: int,
+                weight:      Callable[[int, int], int]
+              ) ->           Dict[int, Dict[int, int]]:
+
+        """
+            This function creates a grid without walls.
+            In:
+                * self:        Reference to the current object.
+                * maze_width:  Width of the grid.
+                * maze_height: Height of the grid.
+                * weight:      Function giving the weight of the edge between two vertices, called once per edge.
+            Out:
+                * maze: Grid, as a dictionary of dictionaries.
+        """
+
+        # Connect each cell to the adjacent ones
+        nb_cells = maze_width * maze_height
+        maze = {vertex: {} for vertex in range(nb_cells)}
+        for vertex in range(nb_cells):
+            for neighbor in [vertex - maze_width, vertex + maze_width] + [vertex - 1] * (vertex % maze_width != 0) + [vertex + 1] * (vertex % maze_width != maze_width - 1):
+                if 0 <= neighbor < nb_cells and neighbor not in maze[vertex]:
+                    maze[vertex][neighbor] = maze[neighbor][vertex] = weight(vertex, neighbor)
+        return maze
+
+    #############################################################################################################################################
+
+    def _follow ( self:       Self,
+                  source:     int,
+                  actions:    List[str],
+                  maze:       Dict[int, Dict[int, int]],
+                  maze_width: int
+                ) ->          Tuple[int, int]:
+
+        """
+            This function follows actions in the maze, and returns the vertex reached and the length of the route.
+            In:
+                * self:       Reference to the current object.
+                * source:     Vertex from which to start.
+                * actions:    Actions to follow.
+                * maze:       Maze in which to move.
+                * maze_width: Width of the maze.
+            Out:
+                * vertex: Vertex reached.
+                * length: Length of the route.
+        """
+
+        # Move and sum the weights of the edges crossed
+        vertex = source
+        length = 0
+        for action in actions:
+            next_vertex = vertex + {"north": -maze_width, "south": maze_width, "west": -1, "east": 1}[action]
+            length += get_weight(vertex, next_vertex, maze)
+            vertex = next_vertex
+        return vertex, length
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_distance_manhattan ( self: Self
+                                ) ->    None:
+
+        """
+            This function tests the function "distance_manhattan" of the file "dijkstra_A.py".
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Distance to the closest target, given by (row, column)
+        self.assertEqual(distance_manhattan(0, [(2, 3)], self.maze_width), 5)
+        self.assertEqual(distance_manhattan(5, [(2, 3), (0, 0)], self.maze_width), 2)
+        self.assertEqual(distance_manhattan(11, [(2, 3)], self.maze_width), 0)
+
+    #############################################################################################################################################
+
+    def test_dijkstra_cible ( self: Self
+                            ) ->    None:
+
+        """
+            This function tests the function "dijkstra_cible" of the file "dijkstra_A.py".
+            It checks that A* finds the closest piece of cheese at the same distance as the search without heuristic, and that the actions lead to it.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Mud is avoided, with and without A*
+        for a_etoile in [True, False]:
+            (distance, actions), target = dijkstra_cible(0, self.maze, [3], self.maze_width, a_etoile)
+            self.assertEqual((distance, target), (5, 3))
+            self.assertEqual(self._follow(0, actions, self.maze, self.maze_width), (3, 5))
+
+        # The closest piece of cheese is found among several ones
+        for a_etoile in [True, False]:
+            (distance, actions), target = dijkstra_cible(1, self.maze, [2, 11], self.maze_width, a_etoile)
+            self.assertEqual((distance, target), (3, 2))
+            self.assertEqual(self._follow(1, actions, self.maze, self.maze_width), (2, 3))
+
+        # Distances are the same on grids with random mud
+        generator = random.Random(0)
+        for _ in range(5):
+            maze = self._grid(15, 11, lambda vertex, neighbor: generator.choice([1, 1, 1, 2, 5, 10]))
+            for _ in range(20):
+                source = generator.randrange(15 * 11)
+                cheese = generator.sample(range(15 * 11), generator.randint(1, NB_MAX_CIBLES_A_ETOILE))
+                (distance, actions), target = dijkstra_cible(source, maze, cheese, 15)
+                self.assertEqual(distance, dijkstra_cible(source, maze, cheese, 15, False)[0][0])
+                self.assertIn(target, cheese)
+                self.assertEqual(self._follow(source, actions, maze, 15), (target, distance))
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
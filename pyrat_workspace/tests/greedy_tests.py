@@ -0,0 +1,92 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "greedy.py".
+    The opponent is simulated on small hand-made distance tables, where pieces of cheese are on a line.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from greedy import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsGreedy (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_cible_gagnable ( self: Self
+                            ) ->    None:
+
+        """
+            This function tests the function "cible_gagnable" of the file "greedy.py".
+            It checks that pieces of cheese the opponent reaches first are skipped.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Player at 0, opponent at 10, pieces of cheese at 4, 9, 12 and 20: the opponent takes 9 and 12, but 4 is reached first
+        locations = [0, 10, 4, 9, 12, 20]
+        distances = [[abs(u - v) for v in locations[2:]] for u in locations]
+        self.assertEqual(cible_gagnable(distances), 0)
+
+        # Player at 0, opponent at 5, pieces of cheese at 3, 4 and 30: the opponent takes 4 then 3, so only 30 remains
+        locations = [0, 5, 3, 4, 30]
+        distances = [[abs(u - v) for v in locations[2:]] for u in locations]
+        self.assertEqual(cible_gagnable(distances), 2)
+
+    #############################################################################################################################################
+
+    def test_ciblage ( self: Self
+                     ) ->    None:
+
+        """
+            This function tests the function "ciblage" of the file "greedy.py".
+            It checks the actions and target returned on a corridor.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Corridor 0-1-2-3-4, where the opponent at 4 takes 3, but cannot reach 1 before the player at 0
+        maze = {i: {j: 1 for j in [i - 1, i + 1] if 0 <= j < 5} for i in range(5)}
+        self.assertEqual(ciblage(0, 4, maze, [1, 3], 5), (["east"], 1))
+        self.assertEqual(ciblage(4, 0, maze, [1, 3], 5), (["west"], 3))
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
@@ -0,0 +1,153 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "match_engine.py" of the "stats" directory.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import tempfile
+import threading
+import types
+import time
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "stats"))
+from match_engine import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsMatchEngine (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_load_program ( self: Self
+                          ) ->    None:
+
+        """
+            This function tests the function "load_program" of the file "match_engine.py".
+            It checks that programs are found by name in the "programs" directory.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We load a program that does not need preprocessing
+        program = load_program("random_1")
+        self.assertIsInstance(program, types.ModuleType)
+        self.assertTrue(callable(program.turn))
+
+    #############################################################################################################################################
+
+    def test_get_preprocessing_function ( self: Self
+                                        ) ->    None:
+
+        """
+            This function tests the function "get_preprocessing_function" of the file "match_engine.py".
+            It checks that the given time is used by programs that take it, and that other programs are unchanged.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Programs without a preprocessing time are unchanged
+        self.assertIsNone(get_preprocessing_function(load_program("random_1"), 0.0))
+        program = load_program("greedy")
+        self.assertIs(get_preprocessing_function(program, 0.0), program.preprocessing)
+
+        # The anytime search stops at the given time instead of the one it assumes
+        maze = {i: {j: 1 for j in [i - 1, i + 1] if 0 <= j < 10} for i in range(10)}
+        memory = threading.local()
+        start = time.time()
+        get_preprocessing_function(load_program("tsp_locaux"), 0.0)(maze, 10, 1, "player", {"team": ["player"]}, {"player": 0}, [3, 7], [], memory)
+        self.assertLess(time.time() - start, 1.0)
+        self.assertEqual([memory.actions.popleft() for _ in range(len(memory.actions))], ["east"] * 7)
+
+    #############################################################################################################################################
+
+    def test_run_jobs ( self: Self
+                      ) ->    None:
+
+        """
+            This function tests the function "run_jobs" of the file "match_engine.py".
+            It checks that results are returned in the order of the jobs, whatever the number of workers.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Builtin functions can be sent to the workers
+        jobs = [(2, i) for i in range(50)]
+        expected = [2 ** i for i in range(50)]
+        for nb_workers in [1, 2, 4]:
+            self.assertEqual(run_jobs(pow, jobs, nb_workers), expected)
+
+        # No job gives no result
+        self.assertEqual(run_jobs(pow, [], 2), [])
+
+        # With a callback, results are given to it instead of being returned
+        received = {}
+        self.assertIsNone(run_jobs(pow, jobs, 2, on_result=received.__setitem__))
+        self.assertEqual([received[i] for i in range(len(jobs))], expected)
+
+    #############################################################################################################################################
+
+    def test_iterate_cached_jobs ( self: Self
+                                 ) ->    None:
+
+        """
+            This function tests the function "iterate_cached_jobs" of the file "match_engine.py".
+            It checks that results are given in the order of the jobs, and that only missing jobs are run.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We use a temporary cache
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(os.path.join(directory, "cache.sqlite"))
+            jobs = [(3, i) for i in range(20)]
+            keys = ["job_%d" % i for i in range(20)]
+
+            # Some results are already known, with a value that pow would not give
+            cache.put(keys[4], -1)
+            results = list(iterate_cached_jobs(pow, jobs, keys, cache, 2))
+            self.assertEqual(results, [-1 if i == 4 else 3 ** i for i in range(20)])
+            self.assertTrue(all([key in cache for key in keys]))
+            cache.close()
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
@@ -0,0 +1,228 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "maze_reduction.py".
+    We use the same maze as in "tutorial_tests.py".
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import numpy
+import copy
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from tutorial import *
+from shortest_paths import *
+from maze_reduction import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsMazeReduction (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:     Self,
+                   *args:    Any,
+                   **kwargs: Any,
+                 ) ->        Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:   Reference to the current object.
+                * args:   Arguments of the parent constructor.
+                * kwargs: Keyword arguments of the parent constructor.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # Inherit from parent class
+        super(TestsMazeReduction, self).__init__(*args, **kwargs)
+
+        # We need to store the width of the maze
+        self.maze_width = 5
+
+        # We define the graph structure that will be used for the tests
+        self.graph_dictionary = {0: {5: 1},
+                                 2: {3: 1, 7: 1},
+                                 3: {2: 1},
+                                 5: {0: 1, 6: 1, 10: 1},
+                                 6: {5: 1, 7: 1, 11: 8},
+                                 7: {2: 1, 3: 1, 6: 1, 8: 6},
+                                 8: {7: 6, 9: 9, 13: 1},
+                                 9: {8: 9},
+                                 10: {5: 1, 11: 1, 15: 9},
+                                 11: {6: 8, 10: 1, 16: 1},
+                                 13: {8: 1, 18: 6},
+                                 14: {19: 1},
+                                 15: {10: 9, 16: 4, 20: 1},
+                                 16: {11: 1, 15: 4, 17: 1, 21: 1},
+                                 17: {16: 1, 18: 5, 22: 1},
+                                 18: {13: 6, 17: 5, 19: 1, 23: 1},
+                                 19: {14: 1, 18: 1, 24: 1},
+                                 20: {15: 1},
+                                 21: {16: 1, 22: 1},
+                                 22: {17: 1, 21: 1},
+                                 23: {18: 1},
+                                 24: {19: 1}}
+
+        # Reference distances from vertex 0
+        self.distances_from_0 = {0: 0, 2: 4, 3: 4, 5: 1, 6: 2, 7: 3, 8: 9, 9: 18, 10: 2, 11: 3, 13: 10, 14: 12, 15: 8,
+                                 16: 4, 17: 5, 18: 10, 19: 11, 20: 9, 21: 5, 22: 6, 23: 11, 24: 12}
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_remove_dead_ends ( self: Self
+                              ) ->    None:
+
+        """
+            This function tests the function "remove_dead_ends" of the file "maze_reduction.py".
+            It checks that dead ends are removed until none is left, without modifying the maze, and that distances between terminals are preserved.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Dead ends are removed until there are none left, except terminals
+        maze = copy.deepcopy(self.graph_dictionary)
+        reduced_graph = remove_dead_ends(maze, [0, 9])
+        self.assertEqual(sorted(reduced_graph.keys()), [0, 5, 6, 7, 8, 9, 10, 11, 13, 15, 16, 17, 18, 21, 22])
+        self.assertEqual(reduced_graph[7], {6: 1, 8: 6})
+        self.assertEqual(reduced_graph[18], {13: 6, 17: 5})
+        self.assertTrue(all([len(reduced_graph[vertex]) >= 2 for vertex in reduced_graph if vertex not in [0, 9]]))
+
+        # The maze is not modified
+        self.assertEqual(maze, self.graph_dictionary)
+
+        # Distances between terminals are preserved
+        distances, _ = multi_source_dijkstra([0, 9], self.graph_dictionary)
+        reduced_distances, _ = multi_source_dijkstra([0, 9], reduced_graph)
+        self.assertEqual(reduced_distances[0, 9], distances[0, 9])
+
+        # Both representations give the same result
+        graph_matrix = numpy.zeros((25, 25), dtype=int)
+        for vertex in self.graph_dictionary:
+            for neighbor in self.graph_dictionary[vertex]:
+                graph_matrix[vertex, neighbor] = self.graph_dictionary[vertex][neighbor]
+        self.assertEqual(remove_dead_ends(graph_matrix, [0, 9]), reduced_graph)
+
+    #############################################################################################################################################
+
+    def test_contract_corridors ( self: Self
+                                ) ->    None:
+
+        """
+            This function tests the function "contract_corridors" of the file "maze_reduction.py".
+            It checks which vertices are kept, and that distances between them are the same as in the maze.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Corridor cells are removed, except terminals
+        contracted_graph, chains = contract_corridors(self.graph_dictionary, [0, 22])
+        self.assertEqual(sorted(contracted_graph.keys()), [0, 3, 5, 6, 7, 8, 9, 10, 11, 14, 15, 16, 17, 18, 19, 20, 22, 23, 24])
+        self.assertEqual(contracted_graph[8], {7: 6, 9: 9, 18: 7})
+        self.assertEqual(chains[(8, 18)], [8, 13, 18])
+        self.assertEqual(contracted_graph[22], {17: 1, 16: 2})
+        self.assertEqual(chains[(22, 16)], [22, 21, 16])
+
+        # Distances from the terminals are preserved
+        distances, _ = multi_source_dijkstra([0, 22], self.graph_dictionary)
+        contracted_distances, _ = multi_source_dijkstra([0, 22], contracted_graph)
+        for vertex in contracted_graph:
+            self.assertEqual(contracted_distances[0, vertex], distances[0, vertex])
+            self.assertEqual(contracted_distances[1, vertex], distances[1, vertex])
+
+        # A cycle is reduced to a single vertex
+        cycle = {0: {1: 1, 2: 1}, 1: {0: 1, 3: 1}, 2: {0: 1, 3: 1}, 3: {1: 1, 2: 1}}
+        self.assertEqual(contract_corridors(cycle), ({0: {}}, {}))
+        contracted_graph, chains = contract_corridors(cycle, [0, 3])
+        self.assertEqual(contracted_graph, {0: {3: 2}, 3: {0: 2}})
+
+    #############################################################################################################################################
+
+    def test_expand_route ( self: Self
+                          ) ->    None:
+
+        """
+            This function tests the function "expand_route" of the file "maze_reduction.py".
+            It checks that a shortest route in the reduced graph gives a shortest route in the maze.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We expand a route from 0 to 22
+        contracted_graph, chains = contract_corridors(self.graph_dictionary, [0, 22])
+        distances, predecessors = multi_source_dijkstra([0], contracted_graph)
+        route = expand_route(find_route_from_predecessors(predecessors[0], 0, 22), chains)
+        self.assertEqual((route[0], route[-1]), (0, 22))
+        self.assertEqual(sum([get_weight(route[i], route[i + 1], self.graph_dictionary) for i in range(len(route) - 1)]), self.distances_from_0[22])
+
+        # A single vertex is its own route
+        self.assertEqual(expand_route([0], chains), [0])
+
+    #############################################################################################################################################
+
+    def test_contracted_distance_table ( self: Self
+                                       ) ->    None:
+
+        """
+            This function tests the function "contracted_distance_table" of the file "maze_reduction.py".
+            It checks that distances are the same as with "distance_table", and that predecessors give routes of these lengths in the maze.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Same distances as on the maze
+        vertices = [0, 9, 14, 22]
+        distance_matrix, predecessors = contracted_distance_table(vertices, self.graph_dictionary)
+        self.assertTrue((distance_matrix == distance_table(vertices, self.graph_dictionary)[0]).all())
+        self.assertEqual(predecessors.shape, (4, 25))
+
+        # Routes between vertices of interest are routes of the maze
+        for i in range(len(vertices)):
+            for j in range(len(vertices)):
+                route = find_route_from_predecessors(predecessors[i], vertices[i], vertices[j])
+                self.assertEqual(sum([get_weight(route[k], route[k + 1], self.graph_dictionary) for k in range(len(route) - 1)]), distance_matrix[i, j])
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
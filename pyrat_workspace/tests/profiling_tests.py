@@ -0,0 +1,130 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "profiling.py".
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import threading
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from profiling import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+@profiled()
+def _square ( value: int
+            ) ->     int:
+
+    """
+        Decorated function used in the tests.
+        In:
+            * value: Value to square.
+        Out:
+            * square: Square of the value.
+    """
+
+    # Square
+    return value * value
+
+#####################################################################################################################################################
+
+class TestsProfiling (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_spans ( self: Self
+                   ) ->    None:
+
+        """
+            This function tests the functions "span" and "profiled" of the file "profiling.py".
+            It checks that nested spans and decorated functions are recorded in the profiler of the memory.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We record a few nested spans
+        memory = threading.local()
+        memory.profiler = Profiler()
+        with span("preprocessing", memory):
+            with span("phase"):
+                for i in range(3):
+                    self.assertEqual(_square(i), i * i)
+            _square(4)
+
+        # We check the recorded paths and counts
+        self.assertEqual(list(memory.profiler.spans.keys()), ["preprocessing", "preprocessing/phase", "preprocessing/phase/_square", "preprocessing/_square"])
+        self.assertEqual(memory.profiler.spans["preprocessing/phase/_square"]["calls"], 3)
+        self.assertGreaterEqual(memory.profiler.spans["preprocessing"]["duration"], memory.profiler.spans["preprocessing/phase"]["duration"])
+        self.assertIn("_square", memory.profiler.get_report())
+
+        # Outside of a span, decorated functions are not recorded
+        _square(5)
+        self.assertEqual(memory.profiler.spans["preprocessing/_square"]["calls"], 1)
+
+        # Spans are closed when an exception is raised
+        with self.assertRaises(ValueError):
+            with span("turn", memory):
+                raise ValueError()
+        self.assertEqual(memory.profiler.spans["turn"]["calls"], 1)
+        self.assertEqual(memory.profiler.stack, [])
+
+    #############################################################################################################################################
+
+    def test_disabled ( self: Self
+                      ) ->    None:
+
+        """
+            This function tests that nothing is recorded when the profiler is disabled or missing.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Disabled profiler
+        memory = threading.local()
+        memory.profiler = Profiler(enabled=False)
+        with span("preprocessing", memory):
+            _square(2)
+        self.assertEqual(memory.profiler.spans, {})
+
+        # No profiler
+        with span("preprocessing", threading.local()):
+            self.assertEqual(_square(3), 9)
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
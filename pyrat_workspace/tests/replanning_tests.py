@@ -0,0 +1,182 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "replanning.py".
+    Plans are followed in a corridor, where pieces of cheese disappear between turns.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from shortest_paths import RouteCache
+from replanning import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsReplanning (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:     Self,
+                   *args:    Any,
+                   **kwargs: Any,
+                 ) ->        Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:   Reference to the current object.
+                * args:   Arguments of the parent constructor.
+                * kwargs: Keyword arguments of the parent constructor.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # Inherit from parent class
+        super(TestsReplanning, self).__init__(*args, **kwargs)
+
+        # Corridor 0-1-2-3-4
+        self.maze_width = 5
+        self.maze = {i: {j: 1 for j in [i - 1, i + 1] if 0 <= j < 5} for i in range(5)}
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_update ( self: Self
+                    ) ->    None:
+
+        """
+            This function tests the methods "update" and "get_action" of the class "Replanner" of the file "replanning.py".
+            It checks that the route is kept when a later target disappears, and recomputed when the current one disappears.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Function to plan the closest piece of cheese, remembering where it is called
+        plans = []
+        def _closest (location, cheese):
+            plans.append(location)
+            return [min(cheese, key=lambda vertex: abs(vertex - location))]
+
+        # We follow the initial targets
+        replanner = Replanner(RouteCache(self.maze, self.maze_width), [4, 0])
+        replanner.update(2, [0, 4], _closest)
+        self.assertEqual(list(replanner.actions.actions), ["east", "east"])
+
+        # Removing a later target keeps the route
+        self.assertEqual(replanner.get_action(2, [4], _closest), "east")
+        self.assertEqual(list(replanner.targets), [4])
+        self.assertEqual(plans, [])
+
+        # Removing the current target asks for a new plan from the current location
+        self.assertEqual(replanner.get_action(3, [1], _closest), "west")
+        self.assertEqual(list(replanner.actions.actions), ["west"])
+        self.assertEqual(plans, [3])
+
+        # Reaching the target goes on with the next one
+        replanner.targets.append(0)
+        self.assertEqual(replanner.get_action(2, [0, 1], _closest), "west")
+        self.assertEqual(replanner.get_action(1, [0], _closest), "west")
+        self.assertEqual(plans, [3])
+
+        # Nothing to do once all pieces of cheese are eaten
+        replanner.update(0, [], _closest)
+        self.assertEqual(len(replanner.actions), 0)
+
+    #############################################################################################################################################
+
+    def test_cheese_under_player ( self: Self
+                                 ) ->    None:
+
+        """
+            This function tests the method "update" of the class "Replanner" of the file "replanning.py" when the player is on a piece of cheese.
+            The plan function must not be given this piece of cheese, otherwise it is planned and skipped forever.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Function to plan the closest piece of cheese, which is the current location if given
+        plans = []
+        def _closest (location, cheese):
+            plans.append(list(cheese))
+            return [min(cheese, key=lambda vertex: abs(vertex - location))]
+
+        # The plan function is not called when the only piece of cheese is under the player
+        replanner = Replanner(RouteCache(self.maze, self.maze_width))
+        replanner.update(1, [1], _closest)
+        self.assertEqual(len(replanner.actions), 0)
+        self.assertEqual(plans, [])
+
+        # Otherwise, it is called without it
+        replanner.update(1, [1, 3], _closest)
+        self.assertEqual(list(replanner.actions.actions), ["east", "east"])
+        self.assertEqual(plans, [[3]])
+
+        # A plan made only of targets that cannot be followed is ignored
+        replanner = Replanner(RouteCache(self.maze, self.maze_width))
+        replanner.update(1, [1, 3], lambda location, cheese: [location, 4])
+        self.assertEqual(len(replanner.actions), 0)
+
+    #############################################################################################################################################
+
+    def test_plan_with_actions ( self: Self
+                               ) ->    None:
+
+        """
+            This function tests the method "update" of the class "Replanner" of the file "replanning.py" with a plan function returning actions.
+            The actions to the first target are used as they are, without a traversal from the target.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # The actions given with the plan are followed
+        replanner = Replanner(RouteCache(self.maze, self.maze_width))
+        replanner.update(0, [3, 4], lambda location, cheese: ([3, 4], ["east", "east", "east"]))
+        self.assertEqual(list(replanner.actions.actions), ["east", "east", "east"])
+        self.assertNotIn(3, replanner.route_cache.distances)
+
+        # They are ignored if the first target is dropped
+        replanner = Replanner(RouteCache(self.maze, self.maze_width))
+        replanner.update(0, [4], lambda location, cheese: ([2, 4], ["east", "east"]))
+        self.assertEqual(list(replanner.actions.actions), ["east"] * 4)
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
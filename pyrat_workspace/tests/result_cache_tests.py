@@ -0,0 +1,127 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "result_cache.py" of the "stats" directory.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import tempfile
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "stats"))
+from result_cache import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsResultCache (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_program_hash ( self: Self
+                          ) ->    None:
+
+        """
+            This function tests the function "program_hash" of the file "result_cache.py".
+            It checks that the hash depends on the imported programs.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We copy two programs in a temporary directory and modify the imported one
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "program.py"), "w") as program_file:
+                program_file.write("import numpy\nfrom helper import f\n")
+            with open(os.path.join(directory, "helper.py"), "w") as helper_file:
+                helper_file.write("def f (): return 1\n")
+            hash_before = program_hash("program", directory)
+            self.assertEqual(program_hash("program", directory), hash_before)
+            with open(os.path.join(directory, "helper.py"), "w") as helper_file:
+                helper_file.write("def f (): return 2\n")
+            self.assertNotEqual(program_hash("program", directory), hash_before)
+
+    #############################################################################################################################################
+
+    def test_result_cache ( self: Self
+                          ) ->    None:
+
+        """
+            This function tests the class "ResultCache" of the file "result_cache.py".
+            It checks that keys depend on programs, configuration and script, and that stats are kept between runs.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We use a temporary file
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "cache.sqlite")
+            cache = ResultCache(file_name)
+
+            # Keys depend on the programs, their order, and the configuration
+            key = cache.make_key(["random_1", "random_2"], {"random_seed": 0, "maze_width": 15})
+            self.assertEqual(key, cache.make_key(["random_1", "random_2"], {"maze_width": 15, "random_seed": 0}))
+            self.assertNotEqual(key, cache.make_key(["random_2", "random_1"], {"random_seed": 0, "maze_width": 15}))
+            self.assertNotEqual(key, cache.make_key(["random_1", "random_2"], {"random_seed": 1, "maze_width": 15}))
+
+            # Stats are stored and found again after reopening the file
+            self.assertNotIn(key, cache)
+            self.assertRaises(KeyError, cache.get, key)
+            cache.put(key, {"turns": 12, "players": {"random_1": {"turn_durations": [0.1, 0.2]}}})
+            cache.close()
+            cache = ResultCache(file_name)
+            self.assertIn(key, cache)
+            self.assertEqual(cache.get(key)["players"]["random_1"]["turn_durations"], [0.1, 0.2])
+            cache.close()
+
+            # Keys depend on the script producing the results, and on the files it imports
+            def _script_key ():
+                script_cache = ResultCache(file_name, os.path.join(directory, "script.py"))
+                script_key = script_cache.make_key(["random_1", "random_2"], {"random_seed": 0, "maze_width": 15})
+                script_cache.close()
+                return script_key
+            with open(os.path.join(directory, "script.py"), "w") as script_file:
+                script_file.write("from summary import *\n")
+            with open(os.path.join(directory, "summary.py"), "w") as summary_file:
+                summary_file.write("def f (): return 1\n")
+            script_key = _script_key()
+            self.assertNotEqual(script_key, key)
+            self.assertEqual(script_key, _script_key())
+            with open(os.path.join(directory, "summary.py"), "w") as summary_file:
+                summary_file.write("def f (): return 2\n")
+            self.assertNotEqual(script_key, _script_key())
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
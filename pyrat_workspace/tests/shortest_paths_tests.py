@@ -0,0 +1,274 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "shortest_paths.py".
+    We use the same maze as in "tutorial_tests.py".
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import numpy
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from tutorial import *
+from shortest_paths import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsShortestPaths (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                                CONSTRUCTOR                                                                #
+    #############################################################################################################################################
+
+    def __init__ ( self:     Self,
+                   *args:    Any,
+                   **kwargs: Any,
+                 ) ->        Self:
+
+        """
+            This function is the constructor of the class.
+            In:
+                * self:   Reference to the current object.
+                * args:   Arguments of the parent constructor.
+                * kwargs: Keyword arguments of the parent constructor.
+            Out:
+                * self: Reference to the current object.
+        """
+
+        # Inherit from parent class
+        super(TestsShortestPaths, self).__init__(*args, **kwargs)
+
+        # We need to store the width of the maze
+        self.maze_width = 5
+
+        # We define the graph structure that will be used for the tests
+        self.graph_dictionary = {0: {5: 1},
+                                 2: {3: 1, 7: 1},
+                                 3: {2: 1},
+                                 5: {0: 1, 6: 1, 10: 1},
+                                 6: {5: 1, 7: 1, 11: 8},
+                                 7: {2: 1, 3: 1, 6: 1, 8: 6},
+                                 8: {7: 6, 9: 9, 13: 1},
+                                 9: {8: 9},
+                                 10: {5: 1, 11: 1, 15: 9},
+                                 11: {6: 8, 10: 1, 16: 1},
+                                 13: {8: 1, 18: 6},
+                                 14: {19: 1},
+                                 15: {10: 9, 16: 4, 20: 1},
+                                 16: {11: 1, 15: 4, 17: 1, 21: 1},
+                                 17: {16: 1, 18: 5, 22: 1},
+                                 18: {13: 6, 17: 5, 19: 1, 23: 1},
+                                 19: {14: 1, 18: 1, 24: 1},
+                                 20: {15: 1},
+                                 21: {16: 1, 22: 1},
+                                 22: {17: 1, 21: 1},
+                                 23: {18: 1},
+                                 24: {19: 1}}
+
+        # Reference distances from vertex 0
+        self.distances_from_0 = {0: 0, 2: 4, 3: 4, 5: 1, 6: 2, 7: 3, 8: 9, 9: 18, 10: 2, 11: 3, 13: 10, 14: 12, 15: 8,
+                                 16: 4, 17: 5, 18: 10, 19: 11, 20: 9, 21: 5, 22: 6, 23: 11, 24: 12}
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_multi_source_dijkstra ( self: Self
+                                   ) ->    None:
+
+        """
+            This function tests the function "multi_source_dijkstra" of the file "shortest_paths.py".
+            It checks that the distances and predecessors are correct, and that unreachable vertices are marked as such.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We run the traversal from two sources at once
+        distances, predecessors = multi_source_dijkstra([0, 24], self.graph_dictionary)
+        self.assertEqual(distances.shape, (2, 25))
+        self.assertEqual(predecessors.dtype, numpy.int32)
+
+        # We check the distances from the first source
+        for vertex in self.distances_from_0:
+            self.assertEqual(distances[0, vertex], self.distances_from_0[vertex])
+
+        # Distances should be symmetric in this maze
+        self.assertEqual(distances[1, 0], distances[0, 24])
+
+        # Vertices that are not in the maze cannot be reached
+        self.assertEqual(distances[0, 1], INFINITY)
+        self.assertEqual(predecessors[0, 1], NO_PREDECESSOR)
+        self.assertEqual(predecessors[0, 0], NO_PREDECESSOR)
+
+    #############################################################################################################################################
+
+    def test_multi_target_dijkstra ( self: Self
+                                   ) ->    None:
+
+        """
+            This function tests the function "multi_target_dijkstra" of the file "shortest_paths.py".
+            It checks that targets are reported by increasing distance, and that the traversal stops once they are all settled.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Targets should be settled by increasing distance, with correct distances
+        compiled_maze = compile_maze(self.graph_dictionary)
+        distances, predecessors, settled_targets = multi_target_dijkstra(0, compiled_maze, {22, 13, 11})
+        self.assertEqual(settled_targets, [11, 22, 13])
+        for target in settled_targets:
+            self.assertEqual(distances[target], self.distances_from_0[target])
+
+        # Far away vertices should not be reached
+        self.assertEqual(distances[14], INFINITY)
+
+        # Without targets, the whole maze is explored
+        distances, predecessors, settled_targets = multi_target_dijkstra(0, compiled_maze)
+        self.assertEqual(settled_targets, [])
+        self.assertEqual(distances[14], self.distances_from_0[14])
+
+    #############################################################################################################################################
+
+    def test_distance_table ( self: Self
+                            ) ->    None:
+
+        """
+            This function tests the function "distance_table" of the file "shortest_paths.py".
+            It checks that the matrix contains the distances between the vertices of interest.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We check the table on a few vertices
+        vertices = [0, 9, 14, 22]
+        distance_matrix, predecessors = distance_table(vertices, compile_maze(self.graph_dictionary))
+        self.assertEqual(distance_matrix.shape, (4, 4))
+        self.assertTrue(numpy.all(distance_matrix == distance_matrix.T))
+        self.assertTrue(numpy.all(numpy.diag(distance_matrix) == 0))
+        for j in range(len(vertices)):
+            self.assertEqual(distance_matrix[0, j], self.distances_from_0[vertices[j]])
+
+    #############################################################################################################################################
+
+    def test_find_route_from_predecessors ( self: Self
+                                          ) ->    None:
+
+        """
+            This function tests the function "find_route_from_predecessors" of the file "shortest_paths.py".
+            It checks that routes are valid shortest paths, and that an exception is raised for unreachable targets.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We check that the route is a valid path of the correct length
+        distances, predecessors = multi_source_dijkstra([0], self.graph_dictionary)
+        route = find_route_from_predecessors(predecessors[0], 0, 9)
+        self.assertEqual(route[0], 0)
+        self.assertEqual(route[-1], 9)
+        self.assertEqual(sum([get_weight(route[i], route[i + 1], self.graph_dictionary) for i in range(len(route) - 1)]), 18)
+
+        # The route from a vertex to itself is the vertex alone
+        self.assertEqual(find_route_from_predecessors(predecessors[0], 0, 0), [0])
+
+        # The function should raise an exception if the target cannot be reached
+        self.assertRaises(Exception, find_route_from_predecessors, predecessors[0], 0, 1)
+
+    #############################################################################################################################################
+
+    def test_route_cache ( self: Self
+                         ) ->    None:
+
+        """
+            This function tests the class "RouteCache" of the file "shortest_paths.py".
+            It checks that distances and actions are correct, and that each source is explored only once.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We check distances and actions
+        route_cache = RouteCache(self.graph_dictionary, self.maze_width)
+        self.assertEqual(route_cache.get_distance(0, 22), 6)
+        self.assertEqual(route_cache.get_actions(0, 11), ["south", "south", "east"])
+        self.assertEqual(route_cache.get_actions(0, 6), ["south", "east"])
+        self.assertEqual(route_cache.get_actions(0, 0), [])
+
+        # Actions are computed once per pair
+        self.assertIs(route_cache.get_actions(0, 6), route_cache.get_actions(0, 6))
+
+        # We check the distance matrix, and that it only explored the missing sources
+        distance_matrix = route_cache.get_distance_matrix([0, 9, 22])
+        self.assertEqual(distance_matrix[0].tolist(), [0, 18, 6])
+        self.assertTrue(numpy.all(distance_matrix == distance_matrix.T))
+        self.assertEqual(sorted(route_cache.distances.keys()), [0, 9, 22])
+
+    #############################################################################################################################################
+
+    def test_route_store ( self: Self
+                         ) ->    None:
+
+        """
+            This function tests the class "RouteStore" of the file "shortest_paths.py".
+            It checks that actions are correct, and that only the most recently used routes are kept as actions.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We build a store from a distance table
+        vertices = [0, 6, 11, 22]
+        distance_matrix, predecessors = distance_table(vertices, self.graph_dictionary)
+        route_store = RouteStore(vertices, predecessors, self.maze_width, 2)
+        self.assertEqual(route_store.get_route(0, 22)[-1], 22)
+        self.assertEqual(len(route_store.get_route(0, 22)) - 1, distance_matrix[0, 3])
+
+        # We check actions, and that they are reused
+        self.assertEqual(route_store.get_actions(0, 11), ["south", "south", "east"])
+        self.assertEqual(route_store.get_actions(0, 6), ["south", "east"])
+        self.assertIs(route_store.get_actions(0, 11), route_store.get_actions(0, 11))
+
+        # Only the two most recently used routes are kept
+        route_store.get_actions(6, 22)
+        self.assertEqual(list(route_store.expanded_routes.keys()), [(0, 11), (6, 22)])
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
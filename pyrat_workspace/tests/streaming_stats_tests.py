@@ -0,0 +1,122 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "streaming_stats.py" of the "stats" directory.
+    Results are compared to NumPy on random durations.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import pickle
+import numpy
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "stats"))
+from streaming_stats import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsStreamingStats (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_moments ( self: Self
+                     ) ->    None:
+
+        """
+            This function tests the count, mean, variance and extrema of the class "StreamingStatistics" of the file "streaming_stats.py".
+            It checks that adding values one by one, by batches, or merging aggregators gives the same results as NumPy.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Random durations, with some zeros
+        values = numpy.random.default_rng(0).lognormal(-6, 1.5, size=5000)
+        values[::100] = 0.0
+
+        # One by one
+        one_by_one = StreamingStatistics()
+        for value in values:
+            one_by_one.add(value)
+
+        # By batches, merged as if computed by different workers
+        merged = StreamingStatistics()
+        for batch in numpy.array_split(values, 7):
+            merged.merge(StreamingStatistics(batch))
+
+        # Comparison with NumPy
+        for aggregator in [one_by_one, merged, StreamingStatistics(values)]:
+            self.assertEqual(aggregator.count, len(values))
+            self.assertAlmostEqual(aggregator.mean, values.mean(), places=12)
+            self.assertAlmostEqual(aggregator.get_variance(), values.var(), places=12)
+            self.assertEqual(aggregator.min, values.min())
+            self.assertEqual(aggregator.max, values.max())
+
+        # Empty aggregators have no statistics
+        self.assertTrue(math.isnan(StreamingStatistics().get_variance()))
+        self.assertTrue(math.isnan(StreamingStatistics().get_quantile(0.5)))
+
+    #############################################################################################################################################
+
+    def test_quantiles ( self: Self
+                       ) ->    None:
+
+        """
+            This function tests the function "get_quantile" of the class "StreamingStatistics" of the file "streaming_stats.py".
+            It checks that estimates are within the relative accuracy of the exact quantiles, and that merging does not change them.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Random durations
+        values = numpy.random.default_rng(1).lognormal(-6, 1.5, size=20000)
+        aggregator = StreamingStatistics(values)
+        merged = StreamingStatistics()
+        for batch in numpy.array_split(values, 13):
+            merged.merge(pickle.loads(pickle.dumps(StreamingStatistics(batch))))
+
+        # Estimates are close to values of the right rank
+        sorted_values = numpy.sort(values)
+        for quantile in [0.0, 0.1, 0.5, 0.95, 0.99, 1.0]:
+            exact = sorted_values[int(quantile * (len(values) - 1))]
+            self.assertLessEqual(abs(aggregator.get_quantile(quantile) - exact), RELATIVE_ACCURACY * exact * 1.0001)
+            self.assertEqual(merged.get_quantile(quantile), aggregator.get_quantile(quantile))
+
+        # Memory does not depend on the number of values
+        self.assertLessEqual(len(aggregator.buckets), MAX_NB_BUCKETS)
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
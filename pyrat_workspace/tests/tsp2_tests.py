@@ -0,0 +1,149 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "tsp2.py".
+    The branch-and-bound solver is checked against an exhaustive search on small random distance matrices, and against Held-Karp on larger ones.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import itertools
+import numpy
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from tsp2 import *
+from tsp_A import held_karp_order
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsTsp2 (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                              PRIVATE METHODS                                                              #
+    #############################################################################################################################################
+
+    def _random_distance_matrix ( self:     Self,
+                                  nb_towns: int,
+                                  seed:     int
+                                ) ->        numpy.ndarray:
+
+        """
+            This function creates a symmetric distance matrix between random points of a grid, with Manhattan distances.
+            In:
+                * self:     Reference to the current object.
+                * nb_towns: Number of towns in the matrix.
+                * seed:     Random seed.
+            Out:
+                * distance_matrix: Distance matrix between the towns.
+        """
+
+        # Manhattan distances between random points
+        generator = numpy.random.default_rng(seed)
+        points = generator.integers(0, 30, size=(nb_towns, 2))
+        return numpy.abs(points[:, None, :] - points[None, :, :]).sum(axis=2)
+
+    #############################################################################################################################################
+
+    def _length ( self:            Self,
+                  distance_matrix: numpy.ndarray,
+                  order:           List[int]
+                ) ->               int:
+
+        """
+            This function computes the length of a path in a distance matrix.
+            In:
+                * self:            Reference to the current object.
+                * distance_matrix: Distance matrix between the towns.
+                * order:           Order in which towns are visited.
+            Out:
+                * length: Length of the path.
+        """
+
+        # Sum of consecutive distances
+        return sum([distance_matrix[order[i], order[i + 1]] for i in range(len(order) - 1)])
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_branch_and_bound_order ( self: Self
+                                    ) ->    None:
+
+        """
+            This function tests the function "branch_and_bound_order" of the file "tsp2.py".
+            It checks that the returned order visits all towns once, starts at town 0, and is as short as the best order found exhaustively or by Held-Karp.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We compare to an exhaustive search on small matrices
+        for nb_towns in range(1, 8):
+            for seed in range(5):
+                distance_matrix = self._random_distance_matrix(nb_towns, seed)
+                order = branch_and_bound_order(distance_matrix)
+                self.assertEqual(order[0], 0)
+                self.assertEqual(sorted(order), list(range(nb_towns)))
+                best = min([self._length(distance_matrix, [0] + list(permutation)) for permutation in itertools.permutations(range(1, nb_towns))])
+                self.assertEqual(self._length(distance_matrix, order), best)
+
+        # We compare to Held-Karp on larger matrices, including asymmetric ones
+        for seed in range(3):
+            distance_matrix = self._random_distance_matrix(12, seed)
+            asymmetric_matrix = distance_matrix + numpy.random.default_rng(seed).integers(0, 5, size=distance_matrix.shape) * (1 - numpy.eye(12, dtype=int))
+            for matrix in [distance_matrix, asymmetric_matrix]:
+                order = branch_and_bound_order(matrix)
+                self.assertEqual(sorted(order), list(range(12)))
+                self.assertEqual(self._length(matrix, order), self._length(matrix, held_karp_order(matrix)))
+
+    #############################################################################################################################################
+
+    def test_tsp ( self: Self
+                 ) ->    None:
+
+        """
+            This function tests the function "tsp" of the file "tsp2.py".
+            It checks that the path on a meta-graph starts at the source and visits the vertices in the best order.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Vertices on a line, starting from the middle
+        locations = [10, 0, 12, 30]
+        complete_graph = {u: {v: abs(u - v) for v in locations if v != u} for u in locations}
+        self.assertEqual(tsp(complete_graph, 10), [10, 0, 12, 30])
+        self.assertEqual(tsp({7: {}}, 7), [7])
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
@@ -0,0 +1,110 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "tsp_A_locaux.py".
+    The greedy phase is checked on a corridor, where the closest piece of cheese is always the next one.
+    The preprocessing is checked on a grid, with few pieces of cheese so that greedy collects all of them.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import threading
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from tsp_A_locaux import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsTspALocaux (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_greedy ( self: Self
+                    ) ->    None:
+
+        """
+            This function tests the function "greedy" of the file "tsp_A_locaux.py".
+            It checks that distinct pieces of cheese are visited, at most 10 of them, and that the actions lead through them.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Corridor of 30 cells, with a piece of cheese every other cell from the player at 0
+        maze = {i: {j: 1 for j in [i - 1, i + 1] if 0 <= j < 30} for i in range(30)}
+        cheese = list(range(28, 0, -2))
+        actions, visited = greedy(0, maze, cheese, 30)
+        self.assertEqual(visited, list(range(2, 22, 2)))
+        self.assertEqual(actions, ["east"] * 20)
+
+        # Less than 10 pieces of cheese, and a piece of cheese under the player
+        actions, visited = greedy(4, maze, [0, 4, 6], 30)
+        self.assertEqual(visited, [6, 0])
+        self.assertEqual(actions, ["east"] * 2 + ["west"] * 6)
+
+    #############################################################################################################################################
+
+    def test_preprocessing ( self: Self
+                           ) ->    None:
+
+        """
+            This function tests the function "preprocessing" of the file "tsp_A_locaux.py".
+            It checks that the planned actions visit all pieces of cheese, including when greedy already collects all of them.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Grid of 5x5 cells without walls
+        maze = {i: {j: 1 for j in [i - 5, i + 5] + [i - 1] * (i % 5 != 0) + [i + 1] * (i % 5 != 4) if 0 <= j < 25} for i in range(25)}
+
+        # A single piece of cheese, and all pieces of cheese in a single quadrant
+        for cheese in [[12], [3, 4, 8]]:
+            memory = threading.local()
+            preprocessing(maze, 5, 5, "player", {"team": ["player"]}, {"player": 0}, cheese, [], memory)
+            location = 0
+            visited = set()
+            while len(memory.move) > 0:
+                location += {"north": -5, "south": 5, "west": -1, "east": 1}[memory.move.popleft()]
+                visited.add(location)
+            self.assertTrue(set(cheese) <= visited)
+
+        # A piece of cheese under the player is not visited by greedy, and the route starts from the player
+        memory = threading.local()
+        preprocessing(maze, 5, 5, "player", {"team": ["player"]}, {"player": 0}, [0], [], memory)
+        self.assertEqual(len(memory.move), 0)
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
@@ -0,0 +1,133 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "tsp_A.py".
+    The solver is checked against an exhaustive search on small random distance matrices.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import itertools
+import numpy
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from tsp_A import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsTspA (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                              PRIVATE METHODS                                                              #
+    #############################################################################################################################################
+
+    def _random_distance_matrix ( self:     Self,
+                                  nb_towns: int,
+                                  seed:     int
+                                ) ->        numpy.ndarray:
+
+        """
+            This function creates a symmetric distance matrix between random points of a grid, with Manhattan distances.
+            In:
+                * self:     Reference to the current object.
+                * nb_towns: Number of towns in the matrix.
+                * seed:     Random seed.
+            Out:
+                * distance_matrix: Distance matrix between the towns.
+        """
+
+        # Manhattan distances between random points
+        generator = numpy.random.default_rng(seed)
+        points = generator.integers(0, 30, size=(nb_towns, 2))
+        return numpy.abs(points[:, None, :] - points[None, :, :]).sum(axis=2)
+
+    #############################################################################################################################################
+
+    def _length ( self:            Self,
+                  distance_matrix: numpy.ndarray,
+                  order:           List[int]
+                ) ->               int:
+
+        """
+            This function computes the length of a path in a distance matrix.
+            In:
+                * self:            Reference to the current object.
+                * distance_matrix: Distance matrix between the towns.
+                * order:           Order in which towns are visited.
+            Out:
+                * length: Length of the path.
+        """
+
+        # Sum of consecutive distances
+        return sum([distance_matrix[order[i], order[i + 1]] for i in range(len(order) - 1)])
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_held_karp_order ( self: Self
+                             ) ->    None:
+
+        """
+            This function tests the function "held_karp_order" of the file "tsp_A.py".
+            It checks that the returned order visits all towns once, starts at town 0, and is as short as the best order found exhaustively.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We test several sizes and seeds
+        for nb_towns in range(2, 8):
+            for seed in range(5):
+
+                # We check that the order is a valid path starting from 0
+                distance_matrix = self._random_distance_matrix(nb_towns, seed)
+                order = held_karp_order(distance_matrix)
+                self.assertEqual(order[0], 0)
+                self.assertEqual(sorted(order), list(range(nb_towns)))
+
+                # We check that it is optimal
+                best = min([self._length(distance_matrix, [0] + list(permutation)) for permutation in itertools.permutations(range(1, nb_towns))])
+                self.assertEqual(self._length(distance_matrix, order), best)
+
+        # A single town gives a trivial path
+        self.assertEqual(held_karp_order(numpy.zeros((1, 1))), [0])
+
+        # Unreachable towns, with infinite distances or the largest int32, do not overflow the costs and are visited last
+        for infinity in [float("inf"), numpy.iinfo(numpy.int32).max]:
+            distance_matrix = numpy.array([[0, 1, 2, infinity], [1, 0, 1, infinity], [2, 1, 0, infinity], [infinity, infinity, infinity, 0]])
+            self.assertEqual(held_karp_order(distance_matrix), [0, 1, 2, 3])
+            distance_matrix = numpy.array([[0, 1, infinity, infinity], [1, 0, infinity, infinity], [infinity, infinity, 0, 5], [infinity, infinity, 5, 0]])
+            self.assertEqual(held_karp_order(distance_matrix)[:2], [0, 1])
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
@@ -0,0 +1,155 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "tsp_greedy.py".
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import numpy
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from tsp_greedy import *
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsTspGreedy (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                              PRIVATE METHODS                                                              #
+    #############################################################################################################################################
+
+    def _random_distance_matrix ( self:     Self,
+                                  nb_towns: int,
+                                  seed:     int
+                                ) ->        numpy.ndarray:
+
+        """
+            This function creates a symmetric distance matrix between random points of a grid, with Manhattan distances.
+            In:
+                * self:     Reference to the current object.
+                * nb_towns: Number of towns in the matrix.
+                * seed:     Random seed.
+            Out:
+                * distance_matrix: Distance matrix between the towns.
+        """
+
+        # Manhattan distances between random points
+        generator = numpy.random.default_rng(seed)
+        points = generator.integers(0, 30, size=(nb_towns, 2))
+        return numpy.abs(points[:, None, :] - points[None, :, :]).sum(axis=2)
+
+    #############################################################################################################################################
+
+    def _length ( self:            Self,
+                  distance_matrix: numpy.ndarray,
+                  order:           List[int]
+                ) ->               int:
+
+        """
+            This function computes the length of a path in a distance matrix.
+            In:
+                * self:            Reference to the current object.
+                * distance_matrix: Distance matrix between the towns.
+                * order:           Order in which towns are visited.
+            Out:
+                * length: Length of the path.
+        """
+
+        # Sum of consecutive distances
+        return sum([distance_matrix[order[i], order[i + 1]] for i in range(len(order) - 1)])
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_nearest_neighbor_order ( self: Self
+                                    ) ->    None:
+
+        """
+            This function tests the function "nearest_neighbor_order" of the file "tsp_greedy.py".
+            It checks that the returned order visits all towns once, starting at town 0, going each time to the closest unvisited town.
+            With multi-start, it checks that the returned order is the shortest of the paths obtained for all second towns.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Towns on a line are visited in order
+        points = numpy.array([0, 5, 1, 3, 10])
+        distance_matrix = numpy.abs(points[:, None] - points[None, :])
+        self.assertEqual(nearest_neighbor_order(distance_matrix), [0, 2, 3, 1, 4])
+
+        # Going first to the farther town is better there
+        points = numpy.array([0, 1, 10, -2])
+        distance_matrix = numpy.abs(points[:, None] - points[None, :])
+        self.assertEqual(nearest_neighbor_order(distance_matrix), [0, 1, 3, 2])
+        self.assertEqual(nearest_neighbor_order(distance_matrix, True), [0, 3, 1, 2])
+
+        # Random matrices give valid paths, and multi-start paths are not longer
+        for seed in range(5):
+            distance_matrix = self._random_distance_matrix(10, seed)
+            for multi_start in [False, True]:
+                order = nearest_neighbor_order(distance_matrix, multi_start)
+                self.assertEqual(order[0], 0)
+                self.assertEqual(sorted(order), list(range(10)))
+            self.assertLessEqual(self._length(distance_matrix, nearest_neighbor_order(distance_matrix, True)), self._length(distance_matrix, nearest_neighbor_order(distance_matrix)))
+
+        # Trivial cases
+        self.assertEqual(nearest_neighbor_order(numpy.zeros((1, 1))), [0])
+        self.assertEqual(nearest_neighbor_order(numpy.zeros((2, 2)), True), [0, 1])
+
+    #############################################################################################################################################
+
+
+    #############################################################################################################################################
+
+    def test_tsp ( self: Self
+                 ) ->    None:
+
+        """
+            This function tests the function "tsp" of the file "tsp_greedy.py".
+            It checks that the path on a meta-graph starts at the source and is the best nearest neighbor path.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Vertices on a line, starting from the middle, where going first to the farther vertex is better
+        locations = [10, 0, 13, 30]
+        complete_graph = {u: {v: abs(u - v) for v in locations if v != u} for u in locations}
+        self.assertEqual(tsp(complete_graph, 10), [10, 0, 13, 30])
+        self.assertEqual(tsp({7: {}}, 7), [7])
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
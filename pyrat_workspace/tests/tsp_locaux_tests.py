@@ -0,0 +1,142 @@
+#####################################################################################################################################################
+######################################################################## INFO #######################################################################
+#####################################################################################################################################################
+
+"""
+    This program contains all the unit tests for the functions developed in the program "tsp_locaux.py".
+    The local search is checked on small hand-made paths, and against an exhaustive search on small random distance matrices.
+"""
+
+#####################################################################################################################################################
+###################################################################### IMPORTS ######################################################################
+#####################################################################################################################################################
+
+# Import PyRat
+from pyrat import *
+
+# External imports
+import unittest
+import itertools
+import time
+import numpy
+import sys
+import os
+
+# Previously developed functions
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "programs"))
+from tsp_locaux import *
+from tsp_greedy import nearest_neighbor_order
+
+#####################################################################################################################################################
+############################################################### UNIT TESTS DEFINITION ###############################################################
+#####################################################################################################################################################
+
+class TestsTspLocaux (unittest.TestCase):
+
+    """
+        Here we choose to use the unittest module to perform unit tests.
+        This module is very simple to use and allows to easily check if the code is working as expected.
+    """
+
+    #############################################################################################################################################
+    #                                                              PRIVATE METHODS                                                              #
+    #############################################################################################################################################
+
+    def _random_distance_matrix ( self:     Self,
+                                  nb_towns: int,
+                                  seed:     int
+                                ) ->        numpy.ndarray:
+
+        """
+            This function creates a symmetric distance matrix between random points of a grid, with Manhattan distances.
+            In:
+                * self:     Reference to the current object.
+                * nb_towns: Number of towns in the matrix.
+                * seed:     Random seed.
+            Out:
+                * distance_matrix: Distance matrix between the towns.
+        """
+
+        # Manhattan distances between random points
+        generator = numpy.random.default_rng(seed)
+        points = generator.integers(0, 30, size=(nb_towns, 2))
+        return numpy.abs(points[:, None, :] - points[None, :, :]).sum(axis=2)
+
+    #############################################################################################################################################
+    #                                                               PUBLIC METHODS                                                              #
+    #############################################################################################################################################
+
+    def test_two_opt_pass ( self: Self
+                          ) ->    None:
+
+        """
+            This function tests the functions "two_opt_pass" and "or_opt_pass" of the file "tsp_locaux.py".
+            It checks that a path going back and forth on a line is fixed, and that the first vertex is never moved.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Towns on a line, visited in a bad order
+        points = numpy.array([0, 3, 1, 2, 4])
+        distance_matrix = numpy.abs(points[:, None] - points[None, :])
+        for improvement_pass in [two_opt_pass, or_opt_pass]:
+            order = [0, 1, 2, 3, 4]
+            self.assertTrue(improvement_pass(distance_matrix, order))
+            self.assertEqual(order[0], 0)
+            self.assertEqual(sorted(order), list(range(5)))
+            self.assertLess(path_length(distance_matrix, order), path_length(distance_matrix, [0, 1, 2, 3, 4]))
+
+        # An optimal path is not modified
+        order = [0, 2, 3, 1, 4]
+        self.assertFalse(two_opt_pass(distance_matrix, order))
+        self.assertFalse(or_opt_pass(distance_matrix, order))
+        self.assertEqual(order, [0, 2, 3, 1, 4])
+
+    #############################################################################################################################################
+
+    def test_anytime_order ( self: Self
+                           ) ->    None:
+
+        """
+            This function tests the function "anytime_order" of the file "tsp_locaux.py".
+            It checks that the returned order is a valid path, not longer than the nearest neighbor one, and that the deadline is respected.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We check validity and improvement on a large matrix
+        distance_matrix = self._random_distance_matrix(42, 0)
+        start = time.time()
+        order = anytime_order(distance_matrix, start + 0.2)
+        self.assertLess(time.time() - start, 0.5)
+        self.assertEqual(order[0], 0)
+        self.assertEqual(sorted(order), list(range(42)))
+        self.assertLessEqual(path_length(distance_matrix, order), path_length(distance_matrix, nearest_neighbor_order(distance_matrix)))
+
+        # Small matrices should be solved optimally
+        for seed in range(5):
+            distance_matrix = self._random_distance_matrix(6, seed)
+            order = anytime_order(distance_matrix, time.time() + 0.05, seed)
+            best = min([path_length(distance_matrix, [0] + list(permutation)) for permutation in itertools.permutations(range(1, 6))])
+            self.assertEqual(path_length(distance_matrix, order), best)
+
+        # A passed deadline still gives a valid path, and trivial cases are handled
+        order = anytime_order(self._random_distance_matrix(20, 0), time.time() - 1)
+        self.assertEqual(sorted(order), list(range(20)))
+        self.assertEqual(anytime_order(numpy.zeros((1, 1)), time.time() + 1), [0])
+
+#####################################################################################################################################################
+######################################################################## GO! ########################################################################
+#####################################################################################################################################################
+
+if __name__ == "__main__":
+
+    # Run all unit tests
+    unittest.main(verbosity=2)
+
+#####################################################################################################################################################
+#####################################################################################################################################################
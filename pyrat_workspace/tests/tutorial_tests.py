@@ -216,6 +216,76 @@ class TestsTutorial (unittest.TestCase):
 
     #############################################################################################################################################
 
+    def test_compile_maze ( self: Self
+                          ) ->    None:
+
+        """
+            This function tests the function "compile_maze" of the file "tutorial.py".
+            It checks that the compiled maze gives the same vertices, neighbors and weights as the original graph structures.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # We test the function for both graph structures
+        for graph in [self.graph_dictionary, self.graph_matrix]:
+
+            # We check that the compiled structure is correct
+            compiled_maze = compile_maze(graph)
+            self.assertEqual(compiled_maze.offsets.dtype, numpy.int32)
+            self.assertEqual(compiled_maze.offsets[-1], len(compiled_maze.targets))
+
+            # We check that the functions give the same results on the compiled maze
+            self.assertEqual(sorted(get_vertices(compiled_maze)), sorted(get_vertices(graph)))
+            for vertex in get_vertices(graph):
+                self.assertEqual(sorted(get_neighbors(vertex, compiled_maze)), sorted(get_neighbors(vertex, graph)))
+                for neighbor in get_neighbors(vertex, graph):
+                    self.assertEqual(get_weight(vertex, neighbor, compiled_maze), get_weight(vertex, neighbor, graph))
+
+            # Compiling twice should do nothing
+            self.assertIs(compile_maze(compiled_maze), compiled_maze)
+
+            # Missing edges and vertices should raise an exception
+            self.assertRaises(Exception, get_weight, 0, 1, compiled_maze)
+            self.assertRaises(Exception, get_neighbors, 25, compiled_maze)
+
+    #############################################################################################################################################
+
+    def test_action_plan ( self: Self
+                         ) ->    None:
+
+        """
+            This function tests the class "ActionPlan" of the file "tutorial.py".
+            It checks that actions are returned in order, whether given at creation or added by segments.
+            In:
+                * self: Reference to the current object.
+            Out:
+                * None.
+        """
+
+        # Actions given at creation come first, then added segments
+        segment = ["east", "east"]
+        action_plan = ActionPlan(["north"])
+        action_plan.extend(segment)
+        action_plan.extend(["south"])
+        self.assertEqual(len(action_plan), 4)
+        self.assertEqual([action_plan.popleft() for i in range(4)], ["north", "east", "east", "south"])
+
+        # Added segments are copied
+        self.assertEqual(segment, ["east", "east"])
+
+        # An empty plan cannot be popped
+        self.assertEqual(len(action_plan), 0)
+        self.assertRaises(IndexError, action_plan.popleft)
+
+        # Clearing removes all actions
+        action_plan.extend(segment)
+        action_plan.clear()
+        self.assertEqual(len(action_plan), 0)
+
+    #############################################################################################################################################
+
     def test_locations_to_action ( self: Self
                                  ) ->    None:
 